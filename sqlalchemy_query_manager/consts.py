@@ -1,3 +1,13 @@
+import re
+
+import sqlalchemy
+
+
+SQLALCHEMY_VERSION = tuple(
+    int(part) for part in re.findall(r"\d+", sqlalchemy.__version__)[:3]
+)
+
+
 class classproperty(property):
     def __get__(self, owner_self, owner_cls):
         return self.fget(owner_cls)
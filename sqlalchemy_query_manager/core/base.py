@@ -1,19 +1,93 @@
+import asyncio
 import dataclasses
 import enum
 import typing
 
 from dataclass_sqlalchemy_mixins.base.mixins import (
+    SQLALCHEMY_OP_MATCHER,
     SqlAlchemyFilterConverterMixin,
     SqlAlchemyOrderConverterMixin,
 )
-from sqlalchemy import delete, func, inspect, select, update
+from sqlalchemy import (
+    and_,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    inspect,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import DeclarativeMeta, InstrumentedAttribute, Session, sessionmaker
+from sqlalchemy.orm import (
+    DeclarativeMeta,
+    InstrumentedAttribute,
+    Load,
+    Session,
+    defaultload,
+    joinedload,
+    selectinload,
+    sessionmaker,
+)
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.session import make_transient_to_detached
+from sqlalchemy.sql import ClauseElement
+from sqlalchemy.sql.elements import BindParameter
+
+from sqlalchemy_query_manager.consts import SQLALCHEMY_VERSION, classproperty
+from sqlalchemy_query_manager.core.cache import (
+    DEFAULT_STATEMENT_CACHE_SIZE,
+    get_lookup_cache,
+    get_statement_cache,
+)
+from sqlalchemy_query_manager.core.expressions import (
+    DEFAULT_LARGE_IN_THRESHOLD,
+    POSTGRES_RELTUPLES_QUERY,
+    SQLITE_STAT1_EXISTS_QUERY,
+    SQLITE_STAT1_QUERY,
+    Explain,
+    InValues,
+    ValueList,
+    get_plan_rows,
+)
+from sqlalchemy_query_manager.core.helpers import E, reverse_order_by
+from sqlalchemy_query_manager.core.loader import DataLoader
+from sqlalchemy_query_manager.core.metadata import get_model_metadata, register_model
+from sqlalchemy_query_manager.core.transaction_context_manager import (
+    AsyncAtomicSessionContextManager,
+    AtomicSessionContextManager,
+    get_current_async_session,
+    is_sessionmaker,
+)
+from sqlalchemy_query_manager.core.upsert import (
+    ON_CONFLICT_DIALECTS,
+    get_insert_do_nothing_statement,
+    get_upsert_statement,
+    is_do_nothing_upsert,
+    supports_returning,
+    supports_upsert,
+)
+from sqlalchemy_query_manager.core.utils import (
+    chunked,
+    decode_cursor,
+    encode_cursor,
+    freeze,
+    get_async_session,
+    get_async_session_iterator,
+    get_session,
+    get_session_dialect,
+    get_session_iterator,
+)
+
 
-from sqlalchemy_query_manager.consts import classproperty
-from sqlalchemy_query_manager.core.helpers import E
-from sqlalchemy_query_manager.core.utils import get_async_session, get_session
+# Filters with these operations change the rendered SQL depending on a value,
+# so their values are a part of the statement cache key instead of bind parameters
+LITERAL_FILTER_OPS = {"isnull", "is", "is_not"}
 
 
 class JoinType(enum.Enum):
@@ -24,10 +98,47 @@ class JoinType(enum.Enum):
     FULL = "full"
 
 
-@dataclasses.dataclass
+class DetachStrategy(enum.Enum):
+    """How objects returned by read operations are detached from the session"""
+
+    # Expunge every object of the session
+    EXPUNGE_ALL = "expunge_all"
+    # Expunge only returned objects
+    EXPUNGE = "expunge"
+    # Build detached objects from rows without adding them to the session
+    DETACHED = "detached"
+    # Return rows of model columns instead of objects
+    ROWS = "rows"
+
+
+@dataclasses.dataclass(frozen=True)
 class JoinConfig:
     model: DeclarativeMeta
     join_type: JoinType = JoinType.INNER
+    # Model the joined relationship belongs to, None if it is unknown
+    parent: typing.Optional[DeclarativeMeta] = None
+
+
+@dataclasses.dataclass(frozen=True)
+class Page:
+    """Page of objects returned by QueryManager.page()"""
+
+    items: typing.List
+    total: int
+    number: int
+    size: int
+
+    @property
+    def has_next(self) -> bool:
+        return self.number * self.size < self.total
+
+    @property
+    def has_previous(self) -> bool:
+        return self.number > 1
+
+    @property
+    def pages(self) -> int:
+        return -(-self.total // self.size)
 
 
 class QueryManager(SqlAlchemyFilterConverterMixin, SqlAlchemyOrderConverterMixin):
@@ -40,16 +151,17 @@ class QueryManager(SqlAlchemyFilterConverterMixin, SqlAlchemyOrderConverterMixin
 
         self._to_commit = False
 
-        if isinstance(self.session, sessionmaker):
+        if is_sessionmaker(self.session):
             self._to_commit = True
 
         self.fields = None
+        self._fields_key = None
 
         self._filters = {}
-        self._order_by = set()
+        self._order_by = ()
 
         self.models_to_join = []
-        self.explicit_joins: typing.List[JoinConfig] = []
+        self.explicit_joins: typing.Tuple[JoinConfig, ...] = ()
 
         self._limit = None
         self._offset = None
@@ -59,30 +171,57 @@ class QueryManager(SqlAlchemyFilterConverterMixin, SqlAlchemyOrderConverterMixin
 
         self._distinct = None
 
+        self._select_related: typing.Tuple[str, ...] = ()
+        self._prefetch_related: typing.Tuple[typing.Tuple[str, typing.Any], ...] = ()
+        # Pairs of ("defer" | "undefer" | "load_only", field)
+        self._column_options: typing.Tuple[typing.Tuple[str, str], ...] = ()
+
     def _clone(self):
-        """Create a copy of the current QueryManager"""
-        new_manager = self.__class__(
-            model=self.ConverterConfig.model, session=self.session
-        )
+        """
+        Create a copy of the current QueryManager.
 
-        # Copy all mutable state
-        new_manager._filters = self._filters.copy()
-        new_manager._order_by = self._order_by.copy()
-        new_manager._limit = self._limit
-        new_manager._offset = self._offset
-        new_manager.fields = self.fields.copy() if self.fields else None
-        new_manager.models_to_join = self.models_to_join.copy()
-        new_manager.explicit_joins = self.explicit_joins.copy()
+        Query state is never changed in place, so the copy shares it
+        with the original instead of copying every container.
+        Expressions built lazily from the state are reset.
+        """
+        new_manager = self.__class__.__new__(self.__class__)
+        new_manager.__dict__.update(self.__dict__)
+
+        new_manager.models_to_join = []
+        new_manager._binary_expressions = []
+        new_manager._unary_expressions = []
 
-        new_manager._to_commit = self._to_commit
+        return new_manager
 
-        new_manager._distinct = self._distinct
+    def _get_state_key(self):
+        # Values like dicts for JSON columns are converted to hashable ones
+        filters = tuple(
+            (field, freeze(value)) for field, value in self._filters.items()
+        )
 
-        # Copy internal state
-        new_manager._binary_expressions = self._binary_expressions.copy()
-        new_manager._unary_expressions = self._unary_expressions.copy()
+        return (
+            self.__class__,
+            self.ConverterConfig.model,
+            self.session,
+            filters,
+            self._order_by,
+            self.fields,
+            self.explicit_joins,
+            self._limit,
+            self._offset,
+            self._distinct,
+            self._select_related,
+            self._prefetch_related,
+            self._column_options,
+        )
 
-        return new_manager
+    def __eq__(self, other):
+        if not isinstance(other, QueryManager):
+            return NotImplemented
+        return self._get_state_key() == other._get_state_key()
+
+    def __hash__(self):
+        return hash(self._get_state_key())
 
     def join_models(
         self,
@@ -123,6 +262,13 @@ class QueryManager(SqlAlchemyFilterConverterMixin, SqlAlchemyOrderConverterMixin
 
         return query
 
+    def _get_path_join_configs(self, models, join_type):
+        """Get joins of models of a relationship path, each one joined from the previous one"""
+        return tuple(
+            JoinConfig(model=model, join_type=join_type, parent=parent)
+            for parent, model in zip((self.ConverterConfig.model, *models), models)
+        )
+
     def inner_join(self, *relationships):
         """
         Specify relationships to be joined using INNER JOIN.
@@ -141,19 +287,11 @@ class QueryManager(SqlAlchemyFilterConverterMixin, SqlAlchemyOrderConverterMixin
         new_manager = self._clone()
 
         for relationship in relationships:
-            relationship = relationship.split("__")
-            models, _ = self.get_foreign_key_path(
-                relationship,
-                to_return_column=False,
-            )
+            models = self._resolve_join_lookup(relationship)
 
-            for model in models:
-                new_manager.explicit_joins.append(
-                    JoinConfig(
-                        model=model,
-                        join_type=JoinType.INNER,
-                    )
-                )
+            new_manager.explicit_joins += self._get_path_join_configs(
+                models, JoinType.INNER
+            )
 
         return new_manager
 
@@ -193,19 +331,11 @@ class QueryManager(SqlAlchemyFilterConverterMixin, SqlAlchemyOrderConverterMixin
         new_manager = self._clone()
 
         for relationship in relationships:
-            relationship = relationship.split("__")
-            models, _ = self.get_foreign_key_path(
-                relationship,
-                to_return_column=False,
-            )
+            models = self._resolve_join_lookup(relationship)
 
-            for model in models:
-                new_manager.explicit_joins.append(
-                    JoinConfig(
-                        model=model,
-                        join_type=JoinType.LEFT,
-                    )
-                )
+            new_manager.explicit_joins += self._get_path_join_configs(
+                models, JoinType.LEFT
+            )
 
         return new_manager
 
@@ -227,48 +357,565 @@ class QueryManager(SqlAlchemyFilterConverterMixin, SqlAlchemyOrderConverterMixin
         new_manager = self._clone()
 
         for relationship in relationships:
-            relationship = relationship.split("__")
-            models, _ = self.get_foreign_key_path(
-                relationship,
-                to_return_column=False,
+            models = self._resolve_join_lookup(relationship)
+
+            new_manager.explicit_joins += self._get_path_join_configs(
+                models, JoinType.FULL
             )
 
-            for model in models:
-                new_manager.explicit_joins.append(
-                    JoinConfig(
-                        model=model,
-                        join_type=JoinType.FULL,
+        return new_manager
+
+    def select_related(self, *relationships):
+        """
+        Load many-to-one relationships in the same query with LEFT OUTER JOIN.
+
+        Loaded relationships are kept by objects after they are expunged.
+
+        Args:
+            *relationships: Relationship paths like 'group', 'group__owner'
+
+        Returns:
+            QueryManager: New instance with relationships to load
+
+        Usage:
+            Item.query_manager.select_related('group__owner').all()
+        """
+        new_manager = self._clone()
+
+        for relationship in relationships:
+            for relationship_property in self._resolve_relationship_path(relationship):
+                if relationship_property.uselist:
+                    raise ValueError(
+                        f"select_related() doesn't support collection {relationship}, "
+                        "use prefetch_related()"
                     )
-                )
 
+        new_manager._select_related += relationships
         return new_manager
 
-    def get_model_field(
-        self,
-        field: str,
+    def prefetch_related(self, *relationships, query_manager=None):
+        """
+        Load relationships with a separate query per relationship.
+
+        Collections are loaded with SELECT ... WHERE foreign_key IN (...)
+        for all returned objects at once, so there are no N+1 lazy loads.
+        Loaded relationships are kept by objects after they are expunged.
+
+        Args:
+            *relationships: Relationship paths like 'items', 'group__owner'
+            query_manager: QueryManager of the related model to filter or order
+                loaded objects, only direct relationships are supported with it
+
+        Returns:
+            QueryManager: New instance with relationships to load
+
+        Usage:
+            Group.query_manager.prefetch_related('items').all()
+            Group.query_manager.prefetch_related(
+                'items',
+                query_manager=Item.query_manager.where(is_valid=True).order_by('-id'),
+            ).all()
+        """
+        new_manager = self._clone()
+
+        for relationship in relationships:
+            relationship_properties = self._resolve_relationship_path(relationship)
+
+            if query_manager is not None:
+                relationship_property = relationship_properties[-1]
+
+                if len(relationship_properties) > 1:
+                    raise ValueError(
+                        "prefetch_related() supports only direct relationships "
+                        "with a query manager"
+                    )
+                if (
+                    relationship_property.secondary is not None
+                    or len(relationship_property.local_remote_pairs) != 1
+                ):
+                    raise ValueError(
+                        f"prefetch_related() doesn't support {relationship} "
+                        "with a query manager, it has to be a single foreign key"
+                    )
+
+        new_manager._prefetch_related += tuple(
+            (relationship, query_manager) for relationship in relationships
+        )
+        return new_manager
+
+    def _resolve_relationship_path(self, relationship: str):
+        """Resolve a "relation__relation" path into relationship properties, memoized per model"""
+        lookup_cache = get_lookup_cache(self.ConverterConfig.model)
+        cache_key = ("relationship", relationship)
+
+        relationship_properties = lookup_cache.get(cache_key)
+        if relationship_properties is None:
+            model = self.ConverterConfig.model
+            relationship_properties = []
+
+            for name in relationship.split("__"):
+                relationship_property = inspect(model).relationships.get(name)
+                if relationship_property is None:
+                    raise ValueError(
+                        f"{model.__name__} doesn't have relationship {name}"
+                    )
+                if relationship_property.lazy in ("dynamic", "write_only"):
+                    raise ValueError(
+                        f"{model.__name__}.{name} is a {relationship_property.lazy} "
+                        "relationship and can't be loaded"
+                    )
+
+                relationship_properties.append(relationship_property)
+                model = relationship_property.entity.class_
+
+            relationship_properties = lookup_cache[cache_key] = tuple(
+                relationship_properties
+            )
+
+        return relationship_properties
+
+    def _get_loader_options(self):
+        """Get loader options of select_related, prefetch_related and column options"""
+        loader_options = []
+
+        relationships = [
+            (relationship, joinedload) for relationship in self._select_related
+        ]
+        relationships.extend(
+            (relationship, selectinload)
+            for relationship, query_manager in self._prefetch_related
+            if query_manager is None
+        )
+
+        for relationship, loader in relationships:
+            loader_option = None
+            for relationship_property in self._resolve_relationship_path(relationship):
+                attr = relationship_property.class_attribute
+                loader_option = (
+                    loader(attr)
+                    if loader_option is None
+                    else getattr(loader_option, loader.__name__)(attr)
+                )
+            loader_options.append(loader_option)
+
+        loader_options.extend(self._get_column_loader_options())
+
+        return loader_options
+
+    def _get_prefetch_lookups(self, objects):
+        """
+        Get lookups of relationships prefetched with a query manager.
+
+        Yields:
+            Tuples of (relationship property, remote field, objects by their keys, query manager)
+        """
+        for relationship, query_manager in self._prefetch_related:
+            if query_manager is None:
+                continue
+
+            relationship_property = self._resolve_relationship_path(relationship)[0]
+            local_column, remote_column = relationship_property.local_remote_pairs[0]
+
+            local_field = relationship_property.parent.get_property_by_column(
+                local_column
+            ).key
+            remote_field = relationship_property.mapper.get_property_by_column(
+                remote_column
+            ).key
+
+            objects_by_keys = {}
+            for obj in objects:
+                objects_by_keys.setdefault(getattr(obj, local_field), []).append(obj)
+
+            yield relationship_property, remote_field, objects_by_keys, query_manager
+
+    def _set_prefetched(
+        self, relationship_property, remote_field, objects_by_keys, related_objects
     ):
-        db_field = None
+        related_objects_by_keys = {}
+        for related_obj in related_objects:
+            related_objects_by_keys.setdefault(
+                getattr(related_obj, remote_field), []
+            ).append(related_obj)
+
+        for key, objects in objects_by_keys.items():
+            related_objects = related_objects_by_keys.get(key, [])
+
+            for obj in objects:
+                set_committed_value(
+                    obj,
+                    relationship_property.key,
+                    (
+                        list(related_objects)
+                        if relationship_property.uselist
+                        else next(iter(related_objects), None)
+                    ),
+                )
+
+    def _prefetch(self, session, objects, expunge=True):
+        """Load relationships prefetched with a query manager for objects"""
+        if not objects or self._returns_rows:
+            return
+
+        for (
+            relationship_property,
+            remote_field,
+            objects_by_keys,
+            query_manager,
+        ) in self._get_prefetch_lookups(objects):
+            keys = [key for key in objects_by_keys if key is not None]
+            related_objects = (
+                query_manager.where(**{f"{remote_field}__in": keys}).all(
+                    session=session, expunge=expunge
+                )
+                if keys
+                else []
+            )
+
+            self._set_prefetched(
+                relationship_property, remote_field, objects_by_keys, related_objects
+            )
+
+    def defer(self, *fields):
+        """
+        Skip loading columns of returned objects.
+
+        Objects are still model instances, deferred columns are loaded on access
+        while an object is attached to a session.
+
+        Args:
+            *fields: Column names, columns of relationships loaded with
+                select_related() or prefetch_related() are set like 'group__name'
 
-        if "__" in field:
-            # There might be several relationship
-            # that is why string might look like
-            # related_model1__related_model2__related_model2_field
-            field_params = field.split("__")
+        Returns:
+            QueryManager: New instance with deferred columns
+
+        Usage:
+            Item.query_manager.defer('payload').all()
+            Item.query_manager.select_related('group').defer('group__description').all()
+        """
+        return self._add_column_options("defer", fields)
+
+    def undefer(self, *fields):
+        """
+        Load columns which are deferred by defer() or by the model mapping.
+
+        Args:
+            *fields: Column names, columns of relationships loaded with
+                select_related() or prefetch_related() are set like 'group__name'
+
+        Returns:
+            QueryManager: New instance with undeferred columns
+
+        Usage:
+            Item.query_manager.undefer('payload').all()
+            Item.query_manager.select_related('group').undefer('group__description').all()
+        """
+        return self._add_column_options("undefer", fields)
+
+    def load_only(self, *fields):
+        """
+        Load only the given columns of returned objects, other columns are deferred.
+
+        Unlike only(), model instances are returned. Primary keys are always loaded.
+
+        Args:
+            *fields: Column names, columns of relationships loaded with
+                select_related() or prefetch_related() are set like 'group__name'
+
+        Returns:
+            QueryManager: New instance with columns to load
+
+        Usage:
+            Item.query_manager.load_only('id', 'name').all()
+        """
+        return self._add_column_options("load_only", fields)
+
+    def _add_column_options(self, column_option, fields):
+        new_manager = self._clone()
+
+        for field in fields:
+            self._resolve_column_path(field)
+
+        if column_option != "load_only":
+            # The latest of defer() and undefer() of a field is applied
+            new_manager._column_options = tuple(
+                (option, field)
+                for option, field in self._column_options
+                if option == "load_only" or field not in fields
+            )
+
+        new_manager._column_options += tuple((column_option, field) for field in fields)
+        return new_manager
+
+    def _resolve_column_path(self, field: str):
+        """
+        Resolve a "relation__column" path into relationship properties and a column attribute.
 
-            if len(field_params) > 1:
+        Returns:
+            Tuple of (relationship properties, column attribute)
+        """
+        *relationship_path, column_name = field.split("__")
+
+        relationship_properties = ()
+        model = self.ConverterConfig.model
+        if relationship_path:
+            relationship_properties = self._resolve_relationship_path(
+                "__".join(relationship_path)
+            )
+            model = relationship_properties[-1].entity.class_
+
+        if column_name not in get_model_metadata(model).column_attrs:
+            raise ValueError(f"{model.__name__} doesn't have column {column_name}")
+
+        return relationship_properties, getattr(model, column_name)
+
+    def _get_column_loader_options(self):
+        """Get defer/undefer/load_only options, load_only columns are merged per path"""
+        loader_options = []
+        load_only_attrs = {}
+
+        for column_option, field in self._column_options:
+            relationship_properties, attr = self._resolve_column_path(field)
+
+            if column_option == "load_only":
+                load_only_attrs.setdefault(relationship_properties, []).append(attr)
+                continue
+
+            loader = self._get_path_loader(relationship_properties)
+            loader_options.append(getattr(loader, column_option)(attr))
+
+        for relationship_properties, attrs in load_only_attrs.items():
+            loader = self._get_path_loader(relationship_properties)
+            loader_options.append(loader.load_only(*attrs))
+
+        return loader_options
+
+    def _get_path_loader(self, relationship_properties):
+        """Get a loader of a relationship path which doesn't change its loading strategy"""
+        if not relationship_properties:
+            return Load(self.ConverterConfig.model)
+
+        loader = defaultload(relationship_properties[0].class_attribute)
+        for relationship_property in relationship_properties[1:]:
+            loader = loader.defaultload(relationship_property.class_attribute)
+
+        return loader
+
+    def _resolve_join_lookup(self, relationship: str):
+        """Resolve a "relation__relation" path into models to join, memoized per model"""
+        lookup_cache = get_lookup_cache(self.ConverterConfig.model)
+        cache_key = ("join", relationship)
+
+        models = lookup_cache.get(cache_key)
+        if models is None:
+            models, _ = self.get_foreign_key_path(
+                relationship.split("__"),
+                to_return_column=False,
+            )
+            models = lookup_cache[cache_key] = tuple(models)
+
+        return models
+
+    def _resolve_field_lookup(self, field: str):
+        """
+        Resolve a "relation__field" path into models to join and a model field.
+
+        Results are memoized per model, so relationships of a path are walked only once.
+
+        Returns:
+            Tuple of (models, db_field)
+        """
+        lookup_cache = get_lookup_cache(self.ConverterConfig.model)
+        cache_key = ("field", field)
+
+        resolved = lookup_cache.get(cache_key)
+        if resolved is None:
+            models = ()
+
+            if "__" in field:
+                # There might be several relationship
+                # that is why string might look like
+                # related_model1__related_model2__related_model2_field
                 models, db_field = self.get_foreign_key_path(
-                    models_path_to_look=field_params,
+                    models_path_to_look=field.split("__"),
                 )
                 if db_field is None:
                     raise ValueError
+                models = tuple(models)
             else:
-                field = field_params[0]
+                db_field = getattr(self.ConverterConfig.model, field)
+
+            resolved = lookup_cache[cache_key] = (models, db_field)
+
+        return resolved
 
-        if db_field is None:
-            db_field = getattr(self.ConverterConfig.model, field)
+    def _resolve_filter_lookup(self, field: str):
+        """
+        Resolve a "relation__field__op" filter into models to join, a model field
+        and an operation, memoized per model.
+
+        Returns:
+            Tuple of (models, db_field, op)
+        """
+        lookup_cache = get_lookup_cache(self.ConverterConfig.model)
+        cache_key = ("filter", field)
+
+        resolved = lookup_cache.get(cache_key)
+        if resolved is None:
+            op = "eq"
+            path = field
+
+            if "__" in field:
+                # Op should be always the last one
+                path_without_op, last_param = field.rsplit("__", 1)
+
+                if last_param in SQLALCHEMY_OP_MATCHER:
+                    op = last_param
+                    path = path_without_op
+
+            models, db_field = self._resolve_field_lookup(path)
+            resolved = lookup_cache[cache_key] = (models, db_field, op)
+
+        return resolved
+
+    def _get_filter_binary_expression(self, field, value):
+        models, db_field, op = self._resolve_filter_lookup(field)
+
+        if op == "isnull":
+            op = "is" if value else "is_not"
+            value = None
+
+        models = list(models) or [
+            self.ConverterConfig.model,
+        ]
+
+        if op in ("in", "not_in") and (
+            self._is_large_in_value(value)
+            or isinstance(value, BindParameter)
+            and isinstance(value.type, ValueList)
+        ):
+            # A template filter of a cached statement binds values by the key
+            key = value.key if isinstance(value, BindParameter) else None
+            values = None if isinstance(value, BindParameter) else value
+
+            return models, InValues(db_field, values, key=key, negate=op == "not_in")
+
+        return models, getattr(db_field, SQLALCHEMY_OP_MATCHER[op])(value)
 
+    @property
+    def large_in_threshold(self) -> typing.Optional[int]:
+        """Number of values of an in/not_in filter above which InValues is used"""
+        config = getattr(self.ConverterConfig.model, "QueryManagerConfig", None)
+        return getattr(config, "large_in_threshold", DEFAULT_LARGE_IN_THRESHOLD)
+
+    def _is_large_in_value(self, value):
+        large_in_threshold = self.large_in_threshold
+        return (
+            bool(large_in_threshold)
+            and isinstance(value, (list, tuple, set, frozenset))
+            and len(value) > large_in_threshold
+        )
+
+    def _get_order_unary_expression(self, field):
+        sql_order_by_direction = "asc"
+
+        if field.startswith("-"):
+            sql_order_by_direction = "desc"
+            field = field[1:]
+
+        models, db_field = self._resolve_field_lookup(field)
+
+        models = list(models) or [
+            self.ConverterConfig.model,
+        ]
+
+        return models, getattr(db_field, sql_order_by_direction)()
+
+    def get_model_field(
+        self,
+        field: str,
+    ):
+        _, db_field = self._resolve_field_lookup(field)
         return db_field
 
+    def get_model_column(self, field: str):
+        """Get a table column by the name of a model attribute"""
+        column_attrs = get_model_metadata(self.ConverterConfig.model).column_attrs
+
+        if field not in column_attrs:
+            raise ValueError(
+                f"{self.ConverterConfig.model.__name__} doesn't have column {field}"
+            )
+
+        return column_attrs[field]
+
+    def _get_bulk_update_statements(self, data, key_fields, batch_size):
+        """
+        Group rows into executemany UPDATE ... WHERE key = :key statements.
+
+        Rows in one executemany statement have to update the same fields,
+        so every batch is split by the set of fields to update.
+        """
+        table = self.ConverterConfig.model.__table__
+
+        for batch in chunked(data, batch_size):
+            batch_groups = {}
+            for item in batch:
+                if any(key not in item for key in key_fields):
+                    continue
+
+                update_fields = tuple(key for key in item if key not in key_fields)
+                if update_fields:
+                    batch_groups.setdefault(update_fields, []).append(item)
+
+            for update_fields, items in batch_groups.items():
+                statement = (
+                    update(table)
+                    .where(
+                        *[
+                            self.get_model_column(key) == bindparam(f"qm_key_{key}")
+                            for key in key_fields
+                        ]
+                    )
+                    .values(
+                        {
+                            self.get_model_column(field): bindparam(f"qm_value_{field}")
+                            for field in update_fields
+                        }
+                    )
+                )
+                params = [
+                    {
+                        **{f"qm_key_{key}": item[key] for key in key_fields},
+                        **{f"qm_value_{field}": item[field] for field in update_fields},
+                    }
+                    for item in items
+                ]
+                yield statement, params
+
+    def _get_bulk_update_select_statements(self, data, key_fields, batch_size):
+        """Build one SELECT per batch to fetch rows updated by bulk_update"""
+        key_columns = [self.get_model_column(key) for key in key_fields]
+
+        for batch in chunked(data, batch_size):
+            keys = {
+                tuple(item[key] for key in key_fields)
+                for item in batch
+                if all(key in item for key in key_fields)
+            }
+            if not keys:
+                continue
+
+            if len(key_columns) == 1:
+                where_clause = key_columns[0].in_([key[0] for key in keys])
+            else:
+                where_clause = tuple_(*key_columns).in_(list(keys))
+
+            yield select(self.ConverterConfig.model).where(
+                where_clause
+            ).execution_options(populate_existing=True)
+
     def only(self, *fields):
         query_manager = self._clone()
 
@@ -282,14 +929,12 @@ class QueryManager(SqlAlchemyFilterConverterMixin, SqlAlchemyOrderConverterMixin
                         models.append(explicit_join.model)
 
                 for model in models:
-                    for column in model.__table__.columns:
-                        _fields.append(column)
-                    hybrids = [
-                        getattr(model, name)
-                        for name, attr in vars(model).items()
-                        if isinstance(attr, hybrid_property)
-                    ]
-                    _fields.extend(hybrids)
+                    model_metadata = get_model_metadata(model)
+
+                    _fields.extend(model_metadata.columns)
+                    _fields.extend(
+                        getattr(model, name) for name in model_metadata.hybrids
+                    )
                 continue
 
             if isinstance(field, InstrumentedAttribute):
@@ -302,177 +947,1171 @@ class QueryManager(SqlAlchemyFilterConverterMixin, SqlAlchemyOrderConverterMixin
                 )
             _fields.append(field)
 
-        query_manager.fields = _fields
+        query_manager.fields = tuple(_fields)
+        # Columns passed as objects can't be a part of a statement cache key
+        query_manager._fields_key = (
+            fields if all(isinstance(field, str) for field in fields) else None
+        )
         return query_manager
 
-    def limit(self, limit):
+    def _get_values_query_manager(self, fields):
+        """
+        Select fields labelled by their lookups for values(), values_list() and dicts().
+
+        Relationships of "relation__field" lookups are joined with LEFT JOIN,
+        so rows without a related object are kept. All model columns are selected
+        if no fields are given.
+        """
+        if not fields:
+            fields = tuple(get_model_metadata(self.ConverterConfig.model).column_attrs)
+
         query_manager = self._clone()
 
-        query_manager._limit = limit
+        columns = []
+        joined_models = {explicit_join.model for explicit_join in self.explicit_joins}
+        for field in fields:
+            if isinstance(field, InstrumentedAttribute):
+                columns.append(field.label(field.key))
+                continue
+            elif not isinstance(field, str):
+                raise NotImplementedError(
+                    "Should be either InstrumentedAttribute class or str"
+                )
+
+            models, db_field = self._resolve_field_lookup(field)
+            for join_config in self._get_path_join_configs(models, JoinType.LEFT):
+                if join_config.model not in joined_models:
+                    query_manager.explicit_joins += (join_config,)
+                    joined_models.add(join_config.model)
+
+            columns.append(db_field.label(field))
+
+        query_manager.fields = tuple(columns)
+        # Labelled columns are rendered differently from only(),
+        # so they get their own statement cache key
+        query_manager._fields_key = (
+            ("values",) + fields
+            if all(isinstance(field, str) for field in fields)
+            else None
+        )
         return query_manager
 
-    def offset(self, offset):
-        query_manager = self._clone()
+    @get_session
+    def values(self, *fields, session=None, expunge=True):
+        """
+        Get values of fields as tuples without loading model objects.
+
+        Args:
+            *fields: Field names or "relation__field" lookups, all model columns if empty
+            session: Database session (optional, will use self.session if not provided)
+
+        Returns:
+            List of tuples
+
+        Usage:
+            Item.query_manager.where(is_valid=True).values('id', 'group__name')
+        """
+        statement, params = self._get_values_query_manager(fields)._get_statement()
+        return [tuple(row) for row in session.execute(statement, params)]
+
+    @get_session
+    def values_list(self, *fields, flat=False, session=None, expunge=True):
+        """
+        Get values of fields as tuples, or values of a single field if flat is True.
+
+        Args:
+            *fields: Field names or "relation__field" lookups, all model columns if empty
+            flat: Return values of a single field instead of tuples
+            session: Database session (optional, will use self.session if not provided)
+
+        Returns:
+            List of tuples or values
+
+        Raises:
+            ValueError: If flat is True and not exactly one field is given
+
+        Usage:
+            Item.query_manager.order_by('id').values_list('id', flat=True)
+        """
+        if flat and len(fields) != 1:
+            raise ValueError("flat is only supported with a single field")
+
+        statement, params = self._get_values_query_manager(fields)._get_statement()
+        result = session.execute(statement, params)
+
+        if flat:
+            return result.scalars().all()
+        return [tuple(row) for row in result]
+
+    @get_session
+    def dicts(self, *fields, session=None, expunge=True):
+        """
+        Get values of fields as dicts keyed by the given lookups.
+
+        Args:
+            *fields: Field names or "relation__field" lookups, all model columns if empty
+            session: Database session (optional, will use self.session if not provided)
+
+        Returns:
+            List of dicts
+
+        Usage:
+            Item.query_manager.where(is_valid=True).dicts('id', 'name', 'group__name')
+        """
+        statement, params = self._get_values_query_manager(fields)._get_statement()
+        return [dict(row) for row in session.execute(statement, params).mappings()]
+
+    def limit(self, limit):
+        query_manager = self._clone()
+
+        query_manager._limit = limit
+        return query_manager
+
+    def offset(self, offset):
+        query_manager = self._clone()
+
+        query_manager._offset = offset
+        return query_manager
+
+    def distinct(self):
+        query_manager = self._clone()
+
+        query_manager._distinct = True
+        return query_manager
+
+    @property
+    def binary_expressions(self):
+        if not self._binary_expressions and self._filters:
+            models_binary_expressions = self.get_models_binary_expressions(
+                filters=self._filters
+            )
+
+            for model_binary_expression in models_binary_expressions:
+                for model in model_binary_expression.get("models"):
+                    self.models_to_join.append(JoinConfig(model=model))
+                self._binary_expressions.append(
+                    model_binary_expression.get("binary_expression")
+                )
+        return self._binary_expressions
+
+    @property
+    def unary_expressions(self):
+        if not self._unary_expressions and self._order_by:
+            _order_by = list(self._order_by)
+
+            to_order_by = []
+            e_pos = []
+            for pos, order_by in enumerate(_order_by):
+                if isinstance(order_by, E):
+                    to_order_by.append(order_by.field_name)
+                    e_pos.append(pos)
+                else:
+                    to_order_by.append(order_by)
+
+            models_unary_expressions = self.get_models_unary_expressions(
+                order_by=to_order_by
+            )
+
+            for pos, model_unary_expression in enumerate(models_unary_expressions):
+                for model in model_unary_expression.get("models"):
+                    self.models_to_join.append(JoinConfig(model=model))
+                unary_expression = model_unary_expression.get("unary_expression")
+
+                if pos in e_pos:
+                    func_to_apply = _order_by[pos].func
+                    unary_expression = func_to_apply(unary_expression)
+
+                self._unary_expressions.append(unary_expression)
+
+        return self._unary_expressions
+
+    def _build_query(self):
+        query = select(self.ConverterConfig.model)
+
+        # Apply explicit joins
+        if self.explicit_joins:
+            query = self.join_models(
+                query=query,
+                join_configs=self.explicit_joins,
+            )
+
+        # Apply binary expressions
+        if self.binary_expressions:
+            query = self.join_models(
+                query=query,
+                join_configs=self.models_to_join,
+            )
+            query = query.where(*self.binary_expressions)
+
+        # Apply unary expressions
+        if self.unary_expressions:
+            query = self.join_models(query=query, join_configs=self.models_to_join)
+            query = query.order_by(*self.unary_expressions)
+
+        # Load relationships and columns
+        if self._select_related or self._prefetch_related or self._column_options:
+            query = query.options(*self._get_loader_options())
+
+        # Select fields
+        if self.fields:
+            query = query.with_only_columns(*self.fields)
+
+        # Templates of cached statements bind offset and limit as parameters
+        if isinstance(self._offset, BindParameter) or self._offset:
+            query = query.offset(self._offset)
+
+        if isinstance(self._limit, BindParameter) or self._limit:
+            query = query.limit(self._limit)
+
+        if self._distinct:
+            query = query.distinct()
+
+        return query
+
+    def _build_count_query(self):
+        """
+        Build SELECT count(*) for the current query.
+
+        Ordering is dropped and rows are counted without a subquery, joins which
+        can't change the number of rows are left out. DISTINCT, LIMIT and OFFSET
+        change the number of rows, so such queries are counted in a subquery.
+        """
+        if (
+            self._distinct
+            or isinstance(self._limit, BindParameter)
+            or isinstance(self._offset, BindParameter)
+            or self._limit
+            or self._offset
+        ):
+            return select(func.count()).select_from(
+                self._build_query().order_by(None).subquery()
+            )
+
+        query = select(func.count()).select_from(self.ConverterConfig.model)
+
+        join_configs = self._get_count_join_configs()
+        if join_configs:
+            query = self.join_models(query=query, join_configs=join_configs)
+
+        if self.binary_expressions:
+            query = query.where(*self.binary_expressions)
+
+        return query
+
+    def _build_exists_query(self):
+        """
+        Build SELECT EXISTS (SELECT 1 ... LIMIT 1) for the current query.
+
+        Joins are planned like for count(), queries with DISTINCT, LIMIT or OFFSET
+        are checked as they are, since these define which rows are returned.
+        """
+        if (
+            self._distinct
+            or isinstance(self._limit, BindParameter)
+            or isinstance(self._offset, BindParameter)
+            or self._limit
+            or self._offset
+        ):
+            query = self._build_query().order_by(None)
+        else:
+            query = select(literal(1)).select_from(self.ConverterConfig.model)
+
+            join_configs = self._get_count_join_configs()
+            if join_configs:
+                query = self.join_models(query=query, join_configs=join_configs)
+
+            if self.binary_expressions:
+                query = query.where(*self.binary_expressions)
+
+        return select(query.limit(1).exists())
+
+    def _get_count_join_configs(self):
+        """
+        Get joins of the query which can change the number of rows.
+
+        A join to a model by its primary key neither duplicates nor filters out rows
+        if it is a LEFT JOIN or its foreign key is not nullable, such joins are left out
+        unless filters use the model.
+        """
+        model = self.ConverterConfig.model
+
+        filter_paths = [
+            self._resolve_filter_lookup(field)[0] for field in self._filters
+        ]
+        filter_models = {
+            filter_model for filter_path in filter_paths for filter_model in filter_path
+        }
+
+        order_paths = []
+        for order_by in self._order_by:
+            field = order_by.field_name if isinstance(order_by, E) else order_by
+            order_paths.append(self._resolve_field_lookup(field.lstrip("-"))[0])
+
+        # Joins in the order they are applied by _build_query()
+        join_configs = {}
+        for join_config in list(self.explicit_joins) + [
+            join_config
+            for path in filter_paths + order_paths
+            for join_config in self._get_path_join_configs(path, JoinType.INNER)
+        ]:
+            if join_config.model != model:
+                join_configs.setdefault(join_config.model, join_config)
+
+        joined_models = [model, *join_configs]
+
+        needed_models = set(filter_models)
+        # Set once a kept join can't be traced to the model it is joined from
+        keep_earlier_joins = False
+        count_join_configs = []
+        for pos, join_config in reversed(list(enumerate(join_configs.values()))):
+            parent_model, foreign_key = self._get_many_to_one_join(
+                joined_models[: pos + 1], join_config.model
+            )
+
+            if (
+                not keep_earlier_joins
+                and join_config.model not in needed_models
+                and foreign_key is not None
+                and (
+                    join_config.join_type == JoinType.LEFT
+                    or join_config.join_type == JoinType.INNER
+                    and not any(column.nullable for column in foreign_key.columns)
+                )
+            ):
+                continue
+
+            count_join_configs.append(join_config)
+            if parent_model is not None:
+                needed_models.add(parent_model)
+
+            # Joins leading to the kept one along its relationship path are kept too
+            parent = join_config
+            while parent is not None and parent.model != model:
+                if parent.parent is None:
+                    keep_earlier_joins = True
+                    break
+                needed_models.add(parent.parent)
+                parent = join_configs.get(parent.parent)
+
+        return count_join_configs[::-1]
+
+    @staticmethod
+    def _get_many_to_one_join(models, model):
+        """
+        Find a foreign key referencing the primary key of a model from joined models.
+
+        Returns:
+            Tuple of (joined model, foreign key constraint) or (None, None)
+            if the model is not joined by its primary key
+        """
+        table = model.__table__
+        primary_key = set(table.primary_key.columns)
+
+        for joined_model in models:
+            joined_table = joined_model.__table__
+
+            if any(
+                foreign_key_constraint.referred_table is joined_table
+                for foreign_key_constraint in table.foreign_key_constraints
+            ):
+                # The model references joined models back, rows might be duplicated
+                return None, None
+
+            for foreign_key_constraint in joined_table.foreign_key_constraints:
+                if (
+                    foreign_key_constraint.referred_table is table
+                    and {element.column for element in foreign_key_constraint.elements}
+                    == primary_key
+                ):
+                    return joined_model, foreign_key_constraint
+
+        return None, None
+
+    def _get_statement_cache_key(self):
+        """
+        Get a key describing the shape of the query.
+
+        Filter values are replaced with bind parameters, so queries which differ
+        only in values share one statement.
+
+        Returns:
+            Tuple of (cache_key, filters with bind parameters, parameters) or
+            (None, None, None) if the query can't be cached
+        """
+        filters_key = []
+        template_filters = {}
+        params = {}
+
+        for pos, (field, value) in enumerate(self._filters.items()):
+            _, db_field, op = self._resolve_filter_lookup(field)
+
+            if value is None or op in LITERAL_FILTER_OPS:
+                try:
+                    hash(value)
+                except TypeError:
+                    return None, None, None
+
+                filters_key.append((field, "literal", value))
+                template_filters[field] = value
+                continue
+
+            if (
+                isinstance(value, ClauseElement)
+                or hasattr(value, "__clause_element__")
+                or hasattr(value, "_sa_instance_state")
+            ):
+                return None, None, None
+
+            expanding = isinstance(value, (list, tuple, set, frozenset))
+            if expanding:
+                if op not in ("in", "not_in"):
+                    return None, None, None
+                value = list(value)
+
+            param_name = f"qm_filter_{pos}"
+            if expanding and self._is_large_in_value(value):
+                template_filters[field] = bindparam(
+                    param_name, type_=ValueList(db_field.type)
+                )
+                filters_key.append((field, "values"))
+            else:
+                template_filters[field] = bindparam(param_name, expanding=expanding)
+                filters_key.append((field, expanding))
+            params[param_name] = value
+
+        order_by_key = tuple(
+            (
+                (order_by.field_name, order_by.func)
+                if isinstance(order_by, E)
+                else order_by
+            )
+            for order_by in self._order_by
+        )
+        joins_key = tuple(
+            (explicit_join.model, explicit_join.join_type, explicit_join.parent)
+            for explicit_join in self.explicit_joins
+        )
+
+        cache_key = (
+            tuple(filters_key),
+            order_by_key,
+            self._fields_key,
+            joins_key,
+            bool(self._distinct),
+            bool(self._limit),
+            bool(self._offset),
+            self._select_related,
+            tuple(
+                relationship
+                for relationship, query_manager in self._prefetch_related
+                if query_manager is None
+            ),
+            self._column_options,
+        )
+
+        try:
+            hash(cache_key)
+        except TypeError:
+            return None, None, None
+
+        return cache_key, template_filters, params
+
+    def _get_statement(self):
+        """
+        Get a statement for the current query and parameters to execute it with.
+
+        Statements are cached per model by the shape of the query,
+        so repeated queries skip building and compiling the statement.
+        """
+        return self._get_cached_statement(QueryManager._build_query)
+
+    def _get_count_statement(self):
+        """Get a statement counting rows of the current query and its parameters"""
+        return self._get_cached_statement(QueryManager._build_count_query, kind="count")
+
+    def _get_exists_statement(self):
+        """Get a statement checking if the query returns any rows and its parameters"""
+        return self._get_cached_statement(
+            QueryManager._build_exists_query, kind="exists"
+        )
+
+    def _get_cached_statement(self, build_query, kind=None):
+        """
+        Get a statement built by build_query from the statement cache.
+
+        Args:
+            build_query: Function building a statement from a query manager
+            kind: Kind of the statement added to the cache key, None for SELECT
+        """
+        statement_cache = get_statement_cache(self.ConverterConfig.model)
+        if statement_cache is None or self.fields and self._fields_key is None:
+            return build_query(self), {}
+
+        cache_key, template_filters, params = self._get_statement_cache_key()
+        if cache_key is None:
+            return build_query(self), {}
+
+        if kind is not None:
+            cache_key = (kind, cache_key)
+
+        statement = statement_cache.get(cache_key)
+
+        if statement is None:
+            template = self._clone()
+            template._filters = template_filters
+            template._limit = bindparam("qm_limit") if self._limit else None
+            template._offset = bindparam("qm_offset") if self._offset else None
+
+            statement = build_query(template)
+
+            statement_cache.set(cache_key, statement)
+
+        if self._offset:
+            params["qm_offset"] = self._offset
+        if self._limit:
+            params["qm_limit"] = self._limit
+
+        return statement, params
+
+    @property
+    def query(self):
+        statement, params = self._get_statement()
+
+        if params:
+            statement = statement.params(**params)
+
+        return statement
+
+    def cache_info(self):
+        """
+        Get statistics of the statement cache of the model.
+
+        Returns:
+            CacheInfo(hits, misses, maxsize, currsize) or None if the cache is disabled
+        """
+        statement_cache = get_statement_cache(self.ConverterConfig.model)
+        return statement_cache.info() if statement_cache else None
+
+    def cache_clear(self):
+        """Clear the statement cache of the model"""
+        statement_cache = get_statement_cache(self.ConverterConfig.model)
+        if statement_cache:
+            statement_cache.clear()
+
+    @property
+    def detach_strategy(self) -> DetachStrategy:
+        config = getattr(self.ConverterConfig.model, "QueryManagerConfig", None)
+        return getattr(config, "detach_strategy", DetachStrategy.EXPUNGE)
+
+    @property
+    def _returns_rows(self):
+        """Check if reads select columns instead of the model"""
+        return bool(self.fields) or self.detach_strategy in (
+            DetachStrategy.DETACHED,
+            DetachStrategy.ROWS,
+        )
+
+    def _select_model_columns(self, statement):
+        """Select model columns instead of the model if objects are not loaded by the session"""
+        if self.fields or not self._returns_rows:
+            return statement
+
+        column_attrs = get_model_metadata(self.ConverterConfig.model).column_attrs
+        return statement.with_only_columns(
+            *[
+                column.label(key)
+                for key, column in column_attrs.items()
+                if self._is_column_loaded(key)
+            ]
+        )
+
+    def _is_column_loaded(self, key):
+        """Check if a column of the model is loaded according to defer/undefer/load_only"""
+        if not self._column_options:
+            return True
+
+        if key in get_model_metadata(self.ConverterConfig.model).primary_key_attrs:
+            return True
+
+        options = {option for option, field in self._column_options if field == key}
+        if options & {"undefer", "load_only"}:
+            return True
+        if "defer" in options:
+            return False
+
+        # Other columns are deferred by load_only() of the model
+        return not any(
+            option == "load_only" and "__" not in field
+            for option, field in self._column_options
+        )
+
+    def _get_read_statement(self):
+        statement, params = self._get_statement()
+        return self._select_model_columns(statement), params
+
+    def _build_detached_object(self, row):
+        obj = inspect(self.ConverterConfig.model).class_manager.new_instance()
+
+        for key, value in row._mapping.items():
+            set_committed_value(obj, key, value)
+
+        make_transient_to_detached(obj)
+        return obj
+
+    def _from_rows(self, rows):
+        """Build detached objects from rows for DetachStrategy.DETACHED"""
+        if self.fields or self.detach_strategy != DetachStrategy.DETACHED:
+            return rows
+
+        return [self._build_detached_object(row) for row in rows]
+
+    def _detach(self, session, objects):
+        """Detach objects returned by a read according to the detach strategy"""
+        detach_strategy = self.detach_strategy
+
+        if detach_strategy == DetachStrategy.EXPUNGE_ALL:
+            session.expunge_all()
+        elif detach_strategy == DetachStrategy.EXPUNGE and not self.fields:
+            for obj in objects:
+                # The same object might be returned more than once
+                if obj in session:
+                    session.expunge(obj)
+
+    @get_session
+    def all(self, session=None, expunge=True):
+        statement, params = self._get_read_statement()
+        result = session.execute(statement, params)
+
+        if not self._returns_rows:
+            result = result.scalars()
+
+        result = self._from_rows(result.all())
+        self._prefetch(session, result, expunge=expunge)
+
+        if result and expunge:
+            self._detach(session, result)
+
+        return result
+
+    def _get_lookup_field(self, field):
+        """Resolve "pk" to the name of the primary key attribute"""
+        if field != "pk":
+            return field
+
+        primary_key_attrs = get_model_metadata(
+            self.ConverterConfig.model
+        ).primary_key_attrs
+        if len(primary_key_attrs) != 1:
+            raise ValueError("Composite primary keys are not supported, pass a field")
+
+        return primary_key_attrs[0]
+
+    def _get_in_bulk_statements(self, dialect, field, keys, chunk_size):
+        """
+        Yield a statement with its params for every chunk of keys.
+
+        Postgres gets keys as one array parameter, so the SQL is the same for any
+        number of keys. Other dialects get chunks padded to a power of two
+        by repeating the last key, so only a few IN list sizes are ever rendered.
+        """
+        column = get_model_metadata(self.ConverterConfig.model).column_attrs[field]
+        statement, params = self._get_read_statement()
+
+        if dialect.name == "postgresql":
+            statement = statement.where(
+                column == any_(bindparam("qm_keys", type_=ARRAY(column.type)))
+            )
+            for chunk in chunked(keys, chunk_size):
+                yield statement, {**params, "qm_keys": chunk}
+            return
+
+        statement = statement.where(column.in_(bindparam("qm_keys", expanding=True)))
+        for chunk in chunked(keys, chunk_size):
+            size = min(chunk_size, 1 << (len(chunk) - 1).bit_length())
+            chunk = chunk + [chunk[-1]] * (size - len(chunk))
+            yield statement, {**params, "qm_keys": chunk}
+
+    @get_session
+    def in_bulk(self, keys, field="pk", chunk_size=500, session=None, expunge=True):
+        """
+        Get objects by a list of unique values of a field.
+
+        Keys are deduplicated and looked up with WHERE field IN (...) queries
+        of at most chunk_size keys, filters of the query manager are applied.
+
+        Args:
+            keys: Values of the field
+            field: Unique field to look objects up by, primary key by default
+            chunk_size: Maximum number of keys in one query
+            session: Database session (optional, will use self.session if not provided)
+            expunge: Whether to expunge objects from session after fetching
+
+        Returns:
+            Dictionary of objects by their keys, missing keys are omitted
+
+        Usage:
+            items = Item.query_manager.in_bulk([1, 2, 3])
+            items = Item.query_manager.where(is_valid=True).in_bulk(names, field='name')
+        """
+        field = self._get_lookup_field(field)
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        dialect = get_session_dialect(session, self.ConverterConfig.model)
+
+        objects = []
+        for statement, params in self._get_in_bulk_statements(
+            dialect, field, keys, chunk_size
+        ):
+            result = session.execute(statement, params)
+
+            if not self._returns_rows:
+                result = result.scalars()
+
+            objects.extend(self._from_rows(result.all()))
+
+        self._prefetch(session, objects, expunge=expunge)
+
+        if objects and expunge:
+            self._detach(session, objects)
+
+        return {getattr(obj, field): obj for obj in objects}
+
+    @get_session_iterator
+    def iterator(self, chunk_size=1000, session=None, expunge=True):
+        """
+        Stream results chunk by chunk using a server-side cursor.
+
+        Objects are detached from the session as soon as their chunk is consumed,
+        so memory usage stays flat regardless of the number of rows.
+
+        Args:
+            chunk_size: Number of rows fetched from the cursor at a time
+            session: Database session (optional, will use self.session if not provided)
+            expunge: Whether to expunge objects from session after each chunk
+
+        Yields:
+            Model instances, or Row objects if fields were selected with only()
+
+        Usage:
+            for obj in Item.query_manager.where(is_valid=True).iterator(chunk_size=500):
+                ...
+        """
+        statement, params = self._get_read_statement()
+        statement = statement.execution_options(
+            stream_results=True,
+            yield_per=chunk_size,
+        )
+        result = session.execute(statement, params)
+
+        if not self._returns_rows:
+            result = result.scalars()
+
+        for partition in result.partitions(chunk_size):
+            partition = self._from_rows(partition)
+            self._prefetch(session, partition, expunge=expunge)
+
+            yield from partition
+
+            if expunge:
+                self._detach(session, partition)
+
+    def __iter__(self):
+        return self.iterator()
+
+    @get_session
+    def first(self, session=None, expunge=True):
+        statement, params = self._get_read_statement()
+        result = session.execute(statement, params)
+
+        if not self._returns_rows:
+            result = result.scalars()
+
+        result = result.first()
+
+        if result is not None:
+            result = self._from_rows([result])[0]
+            self._prefetch(session, [result], expunge=expunge)
+
+            if expunge:
+                self._detach(session, [result])
+
+        return result
+
+    def _get_last_statement(self):
+        """
+        Get a statement of the last object of the query.
+
+        The ordering of the query is reversed and one row is taken,
+        so the database can read an index backwards instead of sorting.
+        Without an ordering objects are ordered by the primary key.
+        """
+        if self._limit or self._offset:
+            raise ValueError(
+                "Can't get the last object of a query with limit or offset"
+            )
+
+        query_manager = self._clone()
+        if self._order_by:
+            query_manager._order_by = tuple(
+                reverse_order_by(order_by) for order_by in self._order_by
+            )
+        else:
+            query_manager._order_by = tuple(
+                f"-{primary_key}"
+                for primary_key in get_model_metadata(
+                    self.ConverterConfig.model
+                ).primary_key_attrs
+            )
+
+        return query_manager.limit(1)._get_read_statement()
+
+    @get_session
+    def last(self, session=None, expunge=True):
+        statement, params = self._get_last_statement()
+
+        result = session.execute(statement, params)
+
+        if not self._returns_rows:
+            result = result.scalars()
+
+        result = result.first()
+
+        if result is not None:
+            result = self._from_rows([result])[0]
+            self._prefetch(session, [result], expunge=expunge)
+
+            if expunge:
+                self._detach(session, [result])
+
+        return result
+
+    def _get_primary_key_identity(self, kwargs):
+        """
+        Get a primary key identity if kwargs look up an object only by its primary key.
+
+        Such lookups are sent to Session.get(), which returns an object
+        from the identity map without querying the database.
+        """
+        if self.detach_strategy in (DetachStrategy.DETACHED, DetachStrategy.ROWS):
+            return None
+
+        primary_key_attrs = get_model_metadata(
+            self.ConverterConfig.model
+        ).primary_key_attrs
+        if len(kwargs) != len(primary_key_attrs) or any(
+            key not in kwargs for key in primary_key_attrs
+        ):
+            return None
+
+        identity = tuple(kwargs[key] for key in primary_key_attrs)
+        if any(
+            value is None
+            or isinstance(value, (list, tuple, set, frozenset, dict, ClauseElement))
+            or hasattr(value, "__clause_element__")
+            for value in identity
+        ):
+            return None
+
+        return identity[0] if len(identity) == 1 else identity
+
+    def _get_lookup_statement(self, kwargs):
+        """Get a cached statement looking up objects by kwargs only"""
+        query_manager = self.__class__(
+            model=self.ConverterConfig.model,
+            session=self.session,
+        ).where(**kwargs)
+        query_manager._select_related = self._select_related
+        query_manager._prefetch_related = self._prefetch_related
+        query_manager._column_options = self._column_options
+        return query_manager._get_read_statement()
+
+    @get_session
+    def get(self, session=None, expunge=True, **kwargs):
+        identity = self._get_primary_key_identity(kwargs)
+        if identity is not None:
+            result = session.get(
+                self.ConverterConfig.model,
+                identity,
+                options=self._get_loader_options(),
+            )
+
+            if result is not None:
+                self._prefetch(session, [result], expunge=expunge)
+
+                if expunge:
+                    self._detach(session, [result])
+
+            return result
+
+        statement, params = self._get_lookup_statement(kwargs)
+        result = session.execute(statement, params)
+
+        if not self._returns_rows:
+            result = result.scalars()
+
+        result = result.first()
+
+        if result is not None:
+            result = self._from_rows([result])[0]
+            self._prefetch(session, [result], expunge=expunge)
 
-        query_manager._offset = offset
-        return query_manager
+            if expunge:
+                self._detach(session, [result])
 
-    def distinct(self):
-        query_manager = self._clone()
+        return result
 
-        query_manager._distinct = True
-        return query_manager
+    def _get_keyset_columns(self):
+        """
+        Get columns and their directions used for keyset pagination.
 
-    @property
-    def binary_expressions(self):
-        if not self._binary_expressions and self._filters:
-            models_binary_expressions = self.get_models_binary_expressions(
-                filters=self._filters
+        Columns come from the current ordering, primary key columns
+        are added at the end to break ties.
+        """
+        keyset_columns = []
+        for order_by in self._order_by:
+            if isinstance(order_by, E):
+                raise ValueError("Keyset pagination doesn't support E expressions")
+
+            field = str(order_by)
+            is_desc = field.startswith("-")
+            if is_desc:
+                field = field[1:]
+
+            keyset_columns.append((self.get_model_field(field), is_desc))
+
+        # Tie-breakers follow the direction of the last ordering term,
+        # so an ordering with a single direction stays index-friendly
+        tie_breaker_is_desc = keyset_columns[-1][1] if keyset_columns else False
+
+        tie_breakers = []
+        for primary_key in get_model_metadata(
+            self.ConverterConfig.model
+        ).primary_key_names:
+            primary_key_row = getattr(self.ConverterConfig.model, primary_key)
+            if not any(column is primary_key_row for column, _ in keyset_columns):
+                tie_breakers.append((primary_key_row, tie_breaker_is_desc))
+
+        return keyset_columns + tie_breakers, tie_breakers
+
+    @staticmethod
+    def _get_keyset_expression(keyset_columns, values):
+        if len(values) != len(keyset_columns):
+            raise ValueError("Pagination cursor doesn't match the current ordering")
+
+        directions = {is_desc for _, is_desc in keyset_columns}
+
+        # (a, b) > (1, 2) can be served by a single index range scan
+        if len(directions) == 1:
+            left = tuple_(*[column for column, _ in keyset_columns])
+            right = tuple_(
+                *[
+                    literal(value, type_=column.type)
+                    for (column, _), value in zip(keyset_columns, values)
+                ]
             )
-
-            for model_binary_expression in models_binary_expressions:
-                for model in model_binary_expression.get("models"):
-                    self.models_to_join.append(JoinConfig(model=model))
-                self._binary_expressions.append(
-                    model_binary_expression.get("binary_expression")
+            return left < right if directions.pop() else left > right
+
+        # Mixed directions are expanded into
+        # (a > 1) OR (a = 1 AND b < 2) OR ...
+        expressions = []
+        for pos, (column, is_desc) in enumerate(keyset_columns):
+            expression = [
+                previous_column == value
+                for (previous_column, _), value in zip(
+                    keyset_columns[:pos], values[:pos]
                 )
-        return self._binary_expressions
+            ]
+            value = values[pos]
+            expression.append(column < value if is_desc else column > value)
+            expressions.append(and_(*expression))
+        return or_(*expressions)
+
+    def _get_keyset_query(self, cursor, page_size):
+        keyset_columns, tie_breakers = self._get_keyset_columns()
+
+        statement, params = self._get_read_statement()
+        params.pop("qm_offset", None)
+        params.pop("qm_limit", None)
+
+        query = statement.order_by(
+            *[
+                column.desc() if is_desc else column.asc()
+                for column, is_desc in tie_breakers
+            ]
+        )
 
-    @property
-    def unary_expressions(self):
-        if not self._unary_expressions and self._order_by:
-            _order_by = list(self._order_by)
+        if cursor is not None:
+            query = query.where(
+                self._get_keyset_expression(keyset_columns, decode_cursor(cursor))
+            )
 
-            to_order_by = []
-            e_pos = []
-            for pos, order_by in enumerate(_order_by):
-                if isinstance(order_by, E):
-                    to_order_by.append(order_by.field_name)
-                    e_pos.append(pos)
-                else:
-                    to_order_by.append(order_by)
+        query = query.add_columns(
+            *[
+                column.label(f"qm_cursor_{pos}")
+                for pos, (column, _) in enumerate(keyset_columns)
+            ]
+        )
 
-            models_unary_expressions = self.get_models_unary_expressions(
-                order_by=to_order_by
-            )
+        # One more row is fetched to check if there is a next page
+        return query.offset(None).limit(page_size + 1), params, len(keyset_columns)
 
-            for pos, model_unary_expression in enumerate(models_unary_expressions):
-                for model in model_unary_expression.get("models"):
-                    self.models_to_join.append(JoinConfig(model=model))
-                unary_expression = model_unary_expression.get("unary_expression")
+    def _get_keyset_page(self, result, page_size, cursor_columns_count):
+        columns_count = len(result.keys()) - cursor_columns_count
+        frozen_result = result.freeze()
 
-                if pos in e_pos:
-                    func_to_apply = _order_by[pos].func
-                    unary_expression = func_to_apply(unary_expression)
+        rows = frozen_result().all()
 
-                self._unary_expressions.append(unary_expression)
+        if self._returns_rows:
+            items = self._from_rows(
+                frozen_result().columns(*range(columns_count)).all()
+            )
+        else:
+            items = frozen_result().scalars().all()
 
-        return self._unary_expressions
+        next_cursor = None
+        if len(rows) > page_size:
+            items = items[:page_size]
+            next_cursor = encode_cursor(rows[page_size - 1][-cursor_columns_count:])
 
-    @property
-    def query(self):
-        query = select(self.ConverterConfig.model)
+        return items, next_cursor
 
-        # Apply explicit joins
-        if self.explicit_joins:
-            query = self.join_models(
-                query=query,
-                join_configs=self.explicit_joins,
-            )
+    @get_session
+    def paginate_after(self, cursor=None, page_size=20, session=None, expunge=True):
+        """
+        Fetch a page of results using keyset (seek) pagination.
 
-        # Apply binary expressions
-        if self.binary_expressions:
-            query = self.join_models(
-                query=query,
-                join_configs=self.models_to_join,
-            )
-            query = query.where(*self.binary_expressions)
+        Instead of OFFSET, rows are filtered by the values of the last row of
+        the previous page, so deep pages cost the same as the first one.
+        The current ordering is used, primary key is added to break ties.
 
-        # Apply unary expressions
-        if self.unary_expressions:
-            query = self.join_models(query=query, join_configs=self.models_to_join)
-            query = query.order_by(*self.unary_expressions)
+        Args:
+            cursor: Cursor returned for the previous page, None for the first page
+            page_size: Number of objects on a page
+            session: Database session (optional, will use self.session if not provided)
+            expunge: Whether to expunge objects from session
 
-        # Select fields
-        if self.fields:
-            query = query.with_only_columns(*self.fields)
+        Returns:
+            Tuple of (objects, next_cursor) where next_cursor is None
+            if there are no more pages
 
-        if self._offset:
-            query = query.offset(self._offset)
+        Usage:
+            items, cursor = Item.query_manager.order_by('-created_at').paginate_after()
+            items, cursor = Item.query_manager.order_by('-created_at').paginate_after(
+                cursor
+            )
+        """
+        query, params, cursor_columns_count = self._get_keyset_query(
+            cursor=cursor,
+            page_size=page_size,
+        )
 
-        if self._limit:
-            query = query.limit(self._limit)
+        result = session.execute(query, params)
 
-        if self._distinct:
-            query = query.distinct()
+        items, next_cursor = self._get_keyset_page(
+            result=result,
+            page_size=page_size,
+            cursor_columns_count=cursor_columns_count,
+        )
 
-        return query
+        self._prefetch(session, items, expunge=expunge)
 
-    @get_session
-    def all(self, session=None, expunge=True):
-        result = session.execute(self.query)
+        if items and expunge:
+            self._detach(session, items)
 
-        if not self.fields:
-            result = result.scalars()
+        return items, next_cursor
 
-        result = result.all()
+    def _check_page(self, number, size):
+        if number < 1 or size < 1:
+            raise ValueError("Page number and size start from 1")
+        if self._limit or self._offset:
+            raise ValueError("page() can't be used with limit() or offset()")
 
-        if result and expunge:
-            session.expunge_all()
+    def _get_page_statement(self, number, size):
+        """Get a statement selecting a page with the total number of rows in every row"""
+        statement, params = self._get_read_statement()
+        statement = (
+            statement.add_columns(func.count().over().label("qm_total"))
+            .offset(bindparam("qm_page_offset"))
+            .limit(bindparam("qm_page_limit"))
+        )
 
-        return result
+        return statement, {
+            **params,
+            "qm_page_offset": (number - 1) * size,
+            "qm_page_limit": size,
+        }
 
-    @get_session
-    def first(self, session=None, expunge=True):
-        result = session.execute(self.query)
+    def _get_page_items(self, result):
+        """
+        Split rows of a page statement into objects and the total number of rows.
 
-        if not self.fields:
-            result = result.scalars()
+        Returns:
+            Tuple of (objects, total) where total is None if the page is empty
+        """
+        frozen_result = result.freeze()
 
-        result = result.first()
+        rows = frozen_result().all()
+        if not rows:
+            return [], None
 
-        if self.fields:
-            pass
-        elif result and expunge:
-            session.expunge(result)
+        if self._returns_rows:
+            items = self._from_rows(
+                frozen_result().columns(*range(len(result.keys()) - 1)).all()
+            )
+        else:
+            items = frozen_result().scalars().all()
 
-        return result
+        return items, rows[0][-1]
 
     @get_session
-    def last(self, session=None, expunge=True):
-        primary_key = inspect(self.ConverterConfig.model).primary_key[0].name
-        primary_key_row = getattr(self.ConverterConfig.model, primary_key)
+    def page(self, number=1, size=20, session=None, expunge=True):
+        """
+        Fetch a page of objects together with the total number of objects.
 
-        query = self.query.order_by(-primary_key_row)
+        The total is selected with count(*) OVER () in the same query,
+        a count query is run only for pages past the last one and for distinct queries.
 
-        result = session.execute(query)
+        Args:
+            number: Number of the page starting from 1
+            size: Number of objects on a page
+            session: Database session (optional, will use self.session if not provided)
+            expunge: Whether to expunge objects from session
 
-        if not self.fields:
-            result = result.scalars()
+        Returns:
+            Page with items, total, number, size, has_next, has_previous and pages
 
-        result = result.first()
+        Usage:
+            page = Item.query_manager.where(is_valid=True).order_by('-id').page(2, 50)
+            page.items, page.total, page.has_next
+        """
+        self._check_page(number, size)
 
-        if self.fields:
-            pass
-        elif result and expunge:
-            session.expunge(result)
+        if self._distinct:
+            # The window is computed before DISTINCT, so rows are counted separately
+            items = (
+                self.offset((number - 1) * size)
+                .limit(size)
+                .all(session=session, expunge=expunge)
+            )
+            total = self.count(session=session)
 
-        return result
+            return Page(items=items, total=total, number=number, size=size)
 
-    @get_session
-    def get(self, session=None, expunge=True, **kwargs):
-        binary_expressions = self.get_binary_expressions(filters=kwargs)
+        statement, params = self._get_page_statement(number, size)
+        result = session.execute(statement, params)
 
-        result = (
-            session.query(self.ConverterConfig.model)
-            .filter(*binary_expressions)
-            .first()
-        )
+        items, total = self._get_page_items(result)
+        if total is None:
+            total = self.count(session=session) if number > 1 else 0
 
-        if result and expunge:
-            session.expunge(result)
+        self._prefetch(session, items, expunge=expunge)
 
-        return result
+        if items and expunge:
+            self._detach(session, items)
+
+        return Page(items=items, total=total, number=number, size=size)
 
     def where(self, **kwargs):
         query_manager = self._clone()
@@ -487,23 +2126,142 @@ class QueryManager(SqlAlchemyFilterConverterMixin, SqlAlchemyOrderConverterMixin
     def order_by(self, *args):
         query_manager = self._clone()
 
-        query_manager._order_by.update(set(args))
+        # Ordering terms are applied in the order they were given,
+        # so they are kept in a tuple instead of a set
+        query_manager._order_by = self._order_by + tuple(
+            arg for arg in dict.fromkeys(args) if arg not in self._order_by
+        )
 
         return query_manager
 
+    def _get_capped_count_statement(self, exact_below):
+        """Get a statement counting at most exact_below + 1 rows of the query"""
+        statement, params = self._get_statement()
+        statement = statement.order_by(None)
+
+        if self._limit or self._offset:
+            statement = select(literal(1)).select_from(statement.subquery())
+
+        statement = statement.limit(bindparam("qm_count_limit"))
+
+        return select(func.count()).select_from(statement.subquery()), {
+            **params,
+            "qm_count_limit": exact_below + 1,
+        }
+
+    def _counts_whole_table(self):
+        """Check if the query counts all rows of the table of the model"""
+        return not (
+            self._filters
+            or self._distinct
+            or self._limit
+            or self._offset
+            or self._get_count_join_configs()
+        )
+
+    def _estimate_count(self, session):
+        """
+        Estimate the number of rows of the query from planner statistics.
+
+        Returns:
+            Estimated number of rows or None if the database has no statistics
+        """
+        dialect = get_session_dialect(session, self.ConverterConfig.model)
+        table = self.ConverterConfig.model.__table__
+
+        if self._counts_whole_table():
+            if dialect.name == "postgresql":
+                reltuples = session.execute(
+                    POSTGRES_RELTUPLES_QUERY,
+                    {"table_name": dialect.identifier_preparer.format_table(table)},
+                ).scalar()
+                # -1 if the table was never analyzed, the rows are counted then
+                # instead of using a guess of the planner
+                if reltuples is None or reltuples < 0:
+                    return None
+                return int(reltuples)
+            elif dialect.name == "sqlite":
+                if session.execute(SQLITE_STAT1_EXISTS_QUERY).scalar():
+                    stat = session.execute(
+                        SQLITE_STAT1_QUERY, {"table_name": table.name}
+                    ).scalar()
+                    if stat:
+                        return int(stat.split()[0])
+
+        if dialect.name == "postgresql":
+            statement, params = self._get_statement()
+            return get_plan_rows(session.execute(Explain(statement), params).scalar())
+
+        return None
+
     @get_session
-    def count(self, session=None, **kwargs):
-        count = session.execute(
-            select(func.count()).select_from(self.query)
-        ).scalar_one()
+    def count(self, session=None, estimate=False, exact_below=None, **kwargs):
+        """
+        Count rows of the query.
+
+        Args:
+            session: Database session (optional, will use self.session if not provided)
+            estimate: Return the number of rows estimated by the database planner,
+                falls back to an exact count if the database has no statistics
+            exact_below: Count at most exact_below + 1 rows, with estimate
+                counts below exact_below are exact and larger ones are estimated
+
+        Returns:
+            Number of rows
+
+        Usage:
+            Item.query_manager.count()
+            Item.query_manager.where(is_valid=True).count(estimate=True)
+            # Exact up to 1000 rows, estimated above
+            Item.query_manager.count(estimate=True, exact_below=1000)
+        """
+        if exact_below is not None:
+            statement, params = self._get_capped_count_statement(exact_below)
+            count = session.execute(statement, params).scalar_one()
+
+            if count <= exact_below or not estimate:
+                return count
+
+        if estimate:
+            estimated_count = self._estimate_count(session)
+
+            if estimated_count is not None:
+                if exact_below is not None:
+                    # Outdated statistics might be lower than the counted rows
+                    return max(estimated_count, exact_below + 1)
+                return estimated_count
+
+        statement, params = self._get_count_statement()
+        count = session.execute(statement, params).scalar_one()
         return count
 
     def with_session(self, session):
         query_manager = self._clone()
 
         query_manager.session = session
+        query_manager._to_commit = is_sessionmaker(session)
         return query_manager
 
+    def atomic(self):
+        """
+        Run operations of all query managers inside the block in one session.
+
+        Operations inside the block flush their changes, the session is committed once
+        when the block exits and rolled back if it raises. Nested blocks join the outer one.
+
+        Returns:
+            Context manager which returns the shared session
+
+        Usage:
+            with Item.query_manager.atomic():
+                if not Item.query_manager.where(name='test').exists():
+                    Item.query_manager.create(name='test')
+                Group.query_manager.where(id=1).update(name='test')
+        """
+        return AtomicSessionContextManager(session=self.session)
+
+    unit = atomic
+
     @get_session
     def create(self, session=None, expunge=True, **kwargs):
         """
@@ -536,40 +2294,226 @@ class QueryManager(SqlAlchemyFilterConverterMixin, SqlAlchemyOrderConverterMixin
 
         return new_obj
 
+    def _can_insert_returning(self, session):
+        """Check if many rows can be inserted and returned by one INSERT statement"""
+        # Ordering of returned rows is guaranteed starting from sqlalchemy 2.0.10
+        if SQLALCHEMY_VERSION < (2, 0, 10):
+            return False
+
+        dialect = get_session_dialect(session, model=self.ConverterConfig.model)
+        return bool(getattr(dialect, "insert_executemany_returning", False))
+
+    def _get_bulk_create_returning_statement(self):
+        model = self.ConverterConfig.model
+        return insert(model).returning(model, sort_by_parameter_order=True)
+
     @get_session
-    def bulk_create(self, data: typing.List[typing.Dict], session=None, expunge=True):
+    def bulk_create(
+        self,
+        data: typing.List[typing.Dict],
+        session=None,
+        expunge=True,
+        batch_size=1000,
+        return_objects=True,
+    ):
         """
         Create multiple instances efficiently using bulk operations.
 
+        Rows are inserted in batches with INSERT ... RETURNING, so primary keys
+        and server defaults come back in the same statement without refreshing
+        every object. On databases without RETURNING support objects
+        are added to the session and refreshed one by one.
+
         Args:
             session: Database session
             data: List of dictionaries containing field values
             expunge: Whether to expunge objects from session
+            batch_size: Number of rows sent to the database in one statement
+            return_objects: Whether to return created objects
 
         Returns:
-            List of created instances
+            List of created instances, or number of created rows
+            if return_objects is False
         """
         if not data:
-            return []
+            return [] if return_objects else 0
 
-        objects = [self.ConverterConfig.model(**item) for item in data]
-        session.add_all(objects)
+        model = self.ConverterConfig.model
 
-        if self._to_commit:
-            session.commit()
-        else:
-            session.flush()
+        if not return_objects:
+            for batch in chunked(data, batch_size):
+                if SQLALCHEMY_VERSION >= (2,):
+                    session.execute(insert(model), batch)
+                else:
+                    session.bulk_insert_mappings(model, batch)
+
+            if self._to_commit:
+                session.commit()
+            else:
+                session.flush()
 
-        # Refresh all objects to get their IDs and computed fields
-        for obj in objects:
-            session.refresh(obj)
+            return len(data)
 
+        if not self._can_insert_returning(session):
+            objects = [model(**item) for item in data]
+            session.add_all(objects)
+
+            if self._to_commit:
+                session.commit()
+            else:
+                session.flush()
+
+            # Refresh all objects to get their IDs and computed fields
+            for obj in objects:
+                session.refresh(obj)
+
+            if expunge:
+                for obj in objects:
+                    session.expunge(obj)
+
+            return objects
+
+        objects = []
+        for batch in chunked(data, batch_size):
+            objects.extend(
+                session.scalars(self._get_bulk_create_returning_statement(), batch)
+            )
+
+        # Objects are expunged before commit,
+        # so they are not expired and keep the returned values
         if expunge:
             for obj in objects:
                 session.expunge(obj)
 
+        if self._to_commit:
+            session.commit()
+        else:
+            session.flush()
+
         return objects
 
+    def _get_columns_values(self, values: typing.Dict):
+        """Convert model attribute names to table column keys"""
+        return {
+            self.get_model_column(field).key: value for field, value in values.items()
+        }
+
+    def _get_returning_statement(self, statement):
+        """Load model instances from the RETURNING clause of a DML statement"""
+        model = self.ConverterConfig.model
+        return (
+            select(model)
+            .from_statement(statement.returning(*model.__table__.columns))
+            .execution_options(populate_existing=True)
+        )
+
+    def _get_upsert_conflict_columns(self, session, kwargs, defaults):
+        """
+        Get columns for INSERT ... ON CONFLICT used by get_or_create
+        and update_or_create.
+
+        The native path is used only if the lookup fields match a unique key
+        of the table exactly and the database supports ON CONFLICT ... RETURNING,
+        otherwise None is returned.
+        """
+        dialect = get_session_dialect(session, model=self.ConverterConfig.model)
+        if dialect.name not in ON_CONFLICT_DIALECTS or not supports_returning(dialect):
+            return None
+
+        model_metadata = get_model_metadata(self.ConverterConfig.model)
+
+        column_attrs = model_metadata.column_attrs
+        if not kwargs or any(
+            field not in column_attrs for field in {**kwargs, **(defaults or {})}
+        ):
+            return None
+
+        # NULL values never conflict with each other
+        if any(value is None for value in kwargs.values()):
+            return None
+
+        conflict_columns = frozenset(self._get_columns_values(kwargs))
+        if conflict_columns not in model_metadata.unique_column_sets:
+            return None
+
+        return list(conflict_columns)
+
+    def _get_insert_do_nothing_statement(self, session, conflict_columns, values):
+        return self._get_returning_statement(
+            get_insert_do_nothing_statement(
+                dialect=get_session_dialect(session, model=self.ConverterConfig.model),
+                table=self.ConverterConfig.model.__table__,
+                values=self._get_columns_values(values),
+                conflict_columns=conflict_columns,
+            )
+        )
+
+    def _get_update_by_lookup_statement(self, kwargs, defaults):
+        return self._get_returning_statement(
+            update(self.ConverterConfig.model.__table__)
+            .where(
+                *[
+                    self.get_model_column(field) == value
+                    for field, value in kwargs.items()
+                ]
+            )
+            .values(self._get_columns_values(defaults))
+        )
+
+    def _get_bulk_upsert_statements(
+        self, dialect, data, conflict_fields, update_fields, batch_size
+    ):
+        """
+        Group rows into multi-row upsert statements.
+
+        All rows of a multi-row INSERT must have the same columns,
+        rows with the same conflict values are deduplicated
+        as a row can't be updated twice by one statement.
+        Rows with missing or NULL conflict values are kept as they are.
+
+        Yields:
+            Tuples of (statement, number of rows, whether existing rows are skipped)
+        """
+        table = self.ConverterConfig.model.__table__
+        conflict_columns = [
+            self.get_model_column(field).key for field in conflict_fields
+        ]
+
+        for batch in chunked(data, batch_size):
+            batch_groups = {}
+            for item in batch:
+                row = self._get_columns_values(item)
+                conflict_values = tuple(row.get(column) for column in conflict_columns)
+                if None in conflict_values:
+                    # NULL never conflicts, such rows are always inserted
+                    conflict_values = object()
+                batch_groups.setdefault(tuple(row), {})[conflict_values] = row
+
+            for columns, rows in batch_groups.items():
+                if update_fields is None:
+                    update_columns = [
+                        column for column in columns if column not in conflict_columns
+                    ]
+                else:
+                    update_columns = [
+                        column
+                        for column in self._get_columns_values(
+                            dict.fromkeys(update_fields)
+                        )
+                        if column in columns
+                    ]
+
+                statement = get_upsert_statement(
+                    dialect=dialect,
+                    table=table,
+                    rows=list(rows.values()),
+                    conflict_columns=conflict_columns,
+                    update_columns=update_columns,
+                )
+                yield statement, len(rows), is_do_nothing_upsert(
+                    dialect, update_columns
+                )
+
     @get_session
     def get_or_create(self, session=None, expunge=True, defaults=None, **kwargs):
         """
@@ -584,6 +2528,35 @@ class QueryManager(SqlAlchemyFilterConverterMixin, SqlAlchemyOrderConverterMixin
         Returns:
             Tuple of (instance, created) where created is True if instance was created
         """
+        conflict_columns = self._get_upsert_conflict_columns(session, kwargs, defaults)
+
+        if conflict_columns:
+            # INSERT ... ON CONFLICT DO NOTHING RETURNING creates an object
+            # in one round trip and can't fail if it is created concurrently
+            new_obj = (
+                session.execute(
+                    self._get_insert_do_nothing_statement(
+                        session=session,
+                        conflict_columns=conflict_columns,
+                        values={**kwargs, **(defaults or {})},
+                    )
+                )
+                .scalars()
+                .first()
+            )
+
+            if new_obj is not None:
+                # Expunged before commit, so returned values are not expired
+                if expunge:
+                    session.expunge(new_obj)
+
+                if self._to_commit:
+                    session.commit()
+                else:
+                    session.flush()
+
+                return new_obj, True
+
         # Try to get existing instance
         existing = self.get(session=session, expunge=False, **kwargs)
 
@@ -642,7 +2615,7 @@ class QueryManager(SqlAlchemyFilterConverterMixin, SqlAlchemyOrderConverterMixin
         updated_objects = self.all(session=session)
 
         if expunge:
-            session.expunge_all()
+            self._detach(session, updated_objects)
         return updated_objects if len(updated_objects) > 1 else updated_objects[0]
 
     @get_session
@@ -703,6 +2676,41 @@ class QueryManager(SqlAlchemyFilterConverterMixin, SqlAlchemyOrderConverterMixin
         Returns:
             Tuple of (instance, created) where created is True if instance was created
         """
+        conflict_columns = self._get_upsert_conflict_columns(session, kwargs, defaults)
+
+        if conflict_columns:
+            # INSERT ... ON CONFLICT DO NOTHING RETURNING, then UPDATE ... RETURNING
+            # if the object already exists
+            statements = [
+                (
+                    self._get_insert_do_nothing_statement(
+                        session=session,
+                        conflict_columns=conflict_columns,
+                        values={**kwargs, **(defaults or {})},
+                    ),
+                    True,
+                )
+            ]
+            if defaults:
+                statements.append(
+                    (self._get_update_by_lookup_statement(kwargs, defaults), False)
+                )
+
+            for statement, created in statements:
+                obj = session.execute(statement).scalars().first()
+
+                if obj is not None:
+                    # Expunged before commit, so returned values are not expired
+                    if expunge:
+                        session.expunge(obj)
+
+                    if self._to_commit:
+                        session.commit()
+                    else:
+                        session.flush()
+
+                    return obj, created
+
         # Try to get existing instance
         existing = self.get(session=session, expunge=False, **kwargs)
 
@@ -739,44 +2747,63 @@ class QueryManager(SqlAlchemyFilterConverterMixin, SqlAlchemyOrderConverterMixin
         session=None,
         key_fields: typing.List[str] = None,
         expunge=True,
+        batch_size=1000,
+        return_objects=True,
     ):
         """
         Update multiple records efficiently and return updated objects.
 
+        Rows are sent in batches: every batch is one executemany
+        UPDATE ... WHERE key = :key statement per set of updated fields,
+        and updated objects are fetched back with one SELECT per batch.
+        Rows without all key fields are skipped.
+
         Args:
             session: Database session
             data: List of dictionaries containing field values and identifiers
             key_fields: Fields to use for matching existing records (defaults to primary key)
             expunge: Whether to expunge the objects from session after update
+            batch_size: Number of rows sent to the database in one batch
+            return_objects: Whether to fetch and return updated objects
 
         Returns:
-            List of updated model instances
+            List of updated model instances, or number of rows sent
+            to the database if return_objects is False
         """
         if not data:
-            return []
+            return [] if return_objects else 0
 
         if key_fields is None:
             # Use primary key as default
-            primary_keys = [
-                pk.name for pk in inspect(self.ConverterConfig.model).primary_key
-            ]
+            primary_keys = list(
+                get_model_metadata(self.ConverterConfig.model).primary_key_names
+            )
             key_fields = primary_keys
 
-        updated_objects = []
+        rows_count = 0
+        for statement, params in self._get_bulk_update_statements(
+            data=data,
+            key_fields=key_fields,
+            batch_size=batch_size,
+        ):
+            session.execute(statement, params)
+            rows_count += len(params)
 
-        for item in data:
-            # Extract key fields for filtering
-            filter_kwargs = {key: item[key] for key in key_fields if key in item}
-            update_kwargs = {k: v for k, v in item.items() if k not in key_fields}
-
-            if update_kwargs and filter_kwargs:
-                # Create a new query manager instance for each update
-                query_manager = self.__class__(self.ConverterConfig.model, session)
-                query_manager.where(**filter_kwargs)
-                updated_objs = query_manager.update(
-                    session=session, expunge=False, **update_kwargs
-                )
-                updated_objects.extend(updated_objs)
+        if self._to_commit:
+            session.commit()
+        else:
+            session.flush()
+
+        if not return_objects:
+            return rows_count
+
+        updated_objects = []
+        for statement in self._get_bulk_update_select_statements(
+            data=data,
+            key_fields=key_fields,
+            batch_size=batch_size,
+        ):
+            updated_objects.extend(session.execute(statement).scalars().all())
 
         if expunge:
             for obj in updated_objects:
@@ -784,6 +2811,118 @@ class QueryManager(SqlAlchemyFilterConverterMixin, SqlAlchemyOrderConverterMixin
 
         return updated_objects
 
+    @get_session
+    def bulk_upsert(
+        self,
+        data: typing.List[typing.Dict],
+        session=None,
+        conflict_fields: typing.List[str] = None,
+        update_fields: typing.List[str] = None,
+        expunge=True,
+        batch_size=1000,
+        return_objects=True,
+    ):
+        """
+        Insert multiple records or update them if they already exist.
+
+        Every batch is sent as one INSERT ... ON CONFLICT DO UPDATE statement
+        (INSERT ... ON DUPLICATE KEY UPDATE for MySQL). Objects are returned
+        with RETURNING where it is supported, otherwise they are fetched
+        with one SELECT per batch.
+
+        Args:
+            session: Database session
+            data: List of dictionaries containing field values
+            conflict_fields: Fields of a unique key used to detect existing records
+                (defaults to primary key). Ignored by MySQL which checks all unique keys
+            update_fields: Fields to update for existing records
+                (defaults to all fields of a row except conflict fields)
+            expunge: Whether to expunge the objects from session
+            batch_size: Number of rows sent to the database in one statement
+            return_objects: Whether to return upserted objects
+
+        Returns:
+            List of upserted model instances, or number of rows sent
+            to the database if return_objects is False
+
+        Raises:
+            NotImplementedError: If the database doesn't support upsert
+        """
+        if not data:
+            return [] if return_objects else 0
+
+        if conflict_fields is None:
+            conflict_fields = list(
+                get_model_metadata(self.ConverterConfig.model).primary_key_names
+            )
+
+        dialect = get_session_dialect(session, model=self.ConverterConfig.model)
+        if not supports_upsert(dialect):
+            raise NotImplementedError(
+                f"Upsert is not supported for {dialect.name} dialect"
+            )
+
+        use_returning = return_objects and supports_returning(dialect)
+        # Objects which can't be returned by RETURNING are fetched with SELECT
+        fetch_objects = return_objects and not use_returning
+
+        objects = []
+        rows_count = 0
+        for (
+            statement,
+            statement_rows_count,
+            do_nothing,
+        ) in self._get_bulk_upsert_statements(
+            dialect=dialect,
+            data=data,
+            conflict_fields=conflict_fields,
+            update_fields=update_fields,
+            batch_size=batch_size,
+        ):
+            if use_returning and not do_nothing:
+                objects.extend(
+                    session.execute(self._get_returning_statement(statement)).scalars()
+                )
+            else:
+                session.execute(statement)
+                # ON CONFLICT DO NOTHING returns only inserted rows
+                fetch_objects = return_objects
+            rows_count += statement_rows_count
+
+        # The same row might be upserted by several batches
+        objects = list(dict.fromkeys(objects))
+
+        # Expunged before commit, so returned values are not expired
+        if expunge:
+            for obj in objects:
+                session.expunge(obj)
+
+        if self._to_commit:
+            session.commit()
+        else:
+            session.flush()
+
+        if not return_objects:
+            return rows_count
+
+        if fetch_objects:
+            # All upserted rows are selected, including ones returned by RETURNING
+            objects = []
+            for statement in self._get_bulk_update_select_statements(
+                data=data,
+                key_fields=conflict_fields,
+                batch_size=batch_size,
+            ):
+                objects.extend(session.execute(statement).scalars().all())
+
+            objects = list(dict.fromkeys(objects))
+
+            if expunge:
+                for obj in objects:
+                    session.expunge(obj)
+
+        return objects
+
     @get_session
     def delete(self, session=None):
         """
@@ -819,7 +2958,7 @@ class QueryManager(SqlAlchemyFilterConverterMixin, SqlAlchemyOrderConverterMixin
         return result.rowcount
 
     @get_session
-    def exists(self, session=None, **kwargs):
+    def exists(self, session=None, expunge=True, **kwargs):
         """
         Check if any records exist matching the criteria.
 
@@ -830,17 +2969,46 @@ class QueryManager(SqlAlchemyFilterConverterMixin, SqlAlchemyOrderConverterMixin
         Returns:
             Boolean indicating if records exist
         """
-        if kwargs:
-            # Create new query manager with additional filters
-            query_manager = self.__class__(self.ConverterConfig.model, session)
-            query_manager._filters = {**self._filters, **kwargs}
-            return query_manager.exists(session=session)
+        query_manager = self.where(**kwargs) if kwargs else self
+
+        statement, params = query_manager._get_exists_statement()
+        return session.execute(statement, params).scalar()
+
+    def _get_exists_many_statement(self, keys, field):
+        field = self._get_lookup_field(field)
+        statement, params = self.only(field)._get_statement()
+
+        # Keys are added to filters of the query manager, a filter on the same field
+        # isn't replaced
+        _, keys_expression = self._get_filter_binary_expression(f"{field}__in", keys)
+        return statement.where(keys_expression).order_by(None), params
+
+    @get_session
+    def exists_many(self, keys, field="pk", session=None, expunge=True):
+        """
+        Check which of the keys exist with one query.
+
+        Large sets of keys are bound as one parameter, see large_in_threshold
+        of QueryManagerConfig. Filters of the query manager are applied.
+
+        Args:
+            keys: Values of the field
+            field: Field to look objects up by, primary key by default
+            session: Database session (optional, will use self.session if not provided)
+
+        Returns:
+            Set of existing keys
 
-        # Use current filters
-        query = select(self.ConverterConfig.model).where(*self.binary_expressions)
-        exists_query = select(query.exists())
+        Usage:
+            existing_ids = Item.query_manager.exists_many([1, 2, 3])
+            missing_ids = set(ids) - Item.query_manager.exists_many(ids)
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return set()
 
-        return session.execute(exists_query).scalar()
+        statement, params = self._get_exists_many_statement(keys, field)
+        return set(session.execute(statement, params).scalars())
 
     def clone(self):
         """
@@ -851,68 +3019,382 @@ class QueryManager(SqlAlchemyFilterConverterMixin, SqlAlchemyOrderConverterMixin
         """
         new_manager = self.__class__(self.ConverterConfig.model, self.session)
         new_manager._filters = self._filters.copy()
-        new_manager._order_by = self._order_by.copy()
+        new_manager._order_by = self._order_by
         new_manager._limit = self._limit
         new_manager._offset = self._offset
 
-        if self.fields:
-            new_manager.fields = self.fields.copy()
+        new_manager.fields = self.fields
+        new_manager._fields_key = self._fields_key
 
         return new_manager
 
 
 class AsyncQueryManager(QueryManager):
 
+    def unit(self):
+        """
+        Async version of atomic method.
+
+        Usage:
+            async with Item.query_manager.unit():
+                if not await Item.query_manager.where(name='test').exists():
+                    await Item.query_manager.create(name='test')
+                await Group.query_manager.where(id=1).update(name='test')
+        """
+        return AsyncAtomicSessionContextManager(session=self.session)
+
+    atomic = unit
+
+    def loader(self, field="pk", max_batch_size=1000, delay=0):
+        """
+        Create a loader which batches concurrent lookups into one IN query.
+
+        Keys requested in the same event loop iteration are deduplicated and loaded
+        together, results are cached by the loader. Create a loader per request.
+
+        Args:
+            field: Unique field to look objects up by, primary key by default
+            max_batch_size: Maximum number of keys in one query
+            delay: Seconds to wait for more keys before running a query
+
+        Returns:
+            DataLoader
+
+        Usage:
+            loader = Item.query_manager.loader()
+
+            item = await loader.load(1)
+            items = await loader.load_many([1, 2, 3])
+        """
+        return DataLoader(
+            query_manager=self,
+            field=field,
+            max_batch_size=max_batch_size,
+            delay=delay,
+        )
+
     @get_async_session
     async def first(self, session=None):
-        result = await session.execute(self.query)
+        statement, params = self._get_read_statement()
+        result = await session.execute(statement, params)
 
-        if not self.fields:
+        if not self._returns_rows:
             result = result.scalars()
-        return result.first()
+
+        result = result.first()
+        if result is None:
+            return None
+
+        result = self._from_rows([result])[0]
+        await self._prefetch(session, [result])
+        return result
 
     @get_async_session
     async def last(self, session=None):
-        primary_key = inspect(self.ConverterConfig.model).primary_key[0].name
-        primary_key_row = getattr(self.ConverterConfig.model, primary_key)
-
-        query = self.query.order_by(-primary_key_row)
+        statement, params = self._get_last_statement()
 
-        result = await session.execute(query)
+        result = await session.execute(statement, params)
 
-        if not self.fields:
+        if not self._returns_rows:
             result = result.scalars()
-        return result.first()
+
+        result = result.first()
+        if result is None:
+            return None
+
+        result = self._from_rows([result])[0]
+        await self._prefetch(session, [result])
+        return result
 
     @get_async_session
     async def get(self, session=None, **kwargs):
-        binary_expressions = self.get_binary_expressions(filters=kwargs)
+        identity = self._get_primary_key_identity(kwargs)
+        if identity is not None:
+            result = await session.get(
+                self.ConverterConfig.model,
+                identity,
+                options=self._get_loader_options(),
+            )
+            if result is not None:
+                await self._prefetch(session, [result])
+            return result
 
-        result = (
-            (
-                await session.execute(
-                    select(self.ConverterConfig.model).where(*binary_expressions)
+        statement, params = self._get_lookup_statement(kwargs)
+        result = await session.execute(statement, params)
+
+        if not self._returns_rows:
+            result = result.scalars()
+
+        result = result.first()
+        if result is None:
+            return None
+
+        result = self._from_rows([result])[0]
+        await self._prefetch(session, [result])
+        return result
+
+    @get_async_session
+    async def all(self, session=None):
+        statement, params = self._get_read_statement()
+        result = await session.execute(statement, params)
+
+        if not self._returns_rows:
+            result = result.scalars()
+
+        result = self._from_rows(result.all())
+        await self._prefetch(session, result)
+        return result
+
+    async def _prefetch(self, session, objects):
+        """Async version of _prefetch method."""
+        if not objects or self._returns_rows:
+            return
+
+        for (
+            relationship_property,
+            remote_field,
+            objects_by_keys,
+            query_manager,
+        ) in self._get_prefetch_lookups(objects):
+            keys = [key for key in objects_by_keys if key is not None]
+            related_objects = (
+                await query_manager.where(**{f"{remote_field}__in": keys}).all(
+                    session=session
                 )
+                if keys
+                else []
+            )
+
+            self._set_prefetched(
+                relationship_property, remote_field, objects_by_keys, related_objects
+            )
+
+    async def in_bulk(self, keys, field="pk", chunk_size=500, session=None):
+        """
+        Async version of in_bulk method.
+
+        Chunks are loaded concurrently, each in its own session,
+        if the query manager has a sessionmaker and no session is passed.
+        """
+        field = self._get_lookup_field(field)
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        if (
+            session is None
+            and len(keys) > chunk_size
+            and is_sessionmaker(self.session)
+            and get_current_async_session() is None
+        ):
+            results = await asyncio.gather(
+                *[
+                    self._in_bulk(chunk, field, chunk_size)
+                    for chunk in chunked(keys, chunk_size)
+                ]
             )
-            .scalars()
-            .first()
+        else:
+            results = [await self._in_bulk(keys, field, chunk_size, session=session)]
+
+        return {key: obj for result in results for key, obj in result.items()}
+
+    @get_async_session
+    async def _in_bulk(self, keys, field, chunk_size, session=None):
+        dialect = get_session_dialect(session, self.ConverterConfig.model)
+
+        objects = []
+        for statement, params in self._get_in_bulk_statements(
+            dialect, field, keys, chunk_size
+        ):
+            result = await session.execute(statement, params)
+
+            if not self._returns_rows:
+                result = result.scalars()
+
+            objects.extend(self._from_rows(result.all()))
+
+        await self._prefetch(session, objects)
+
+        return {getattr(obj, field): obj for obj in objects}
+
+    @get_async_session
+    async def values(self, *fields, session=None):
+        """Async version of values method."""
+        statement, params = self._get_values_query_manager(fields)._get_statement()
+        result = await session.execute(statement, params)
+        return [tuple(row) for row in result]
+
+    @get_async_session
+    async def values_list(self, *fields, flat=False, session=None):
+        """Async version of values_list method."""
+        if flat and len(fields) != 1:
+            raise ValueError("flat is only supported with a single field")
+
+        statement, params = self._get_values_query_manager(fields)._get_statement()
+        result = await session.execute(statement, params)
+
+        if flat:
+            return result.scalars().all()
+        return [tuple(row) for row in result]
+
+    @get_async_session
+    async def dicts(self, *fields, session=None):
+        """Async version of dicts method."""
+        statement, params = self._get_values_query_manager(fields)._get_statement()
+        result = await session.execute(statement, params)
+        return [dict(row) for row in result.mappings()]
+
+    @get_async_session
+    async def paginate_after(self, cursor=None, page_size=20, session=None):
+        """Async version of paginate_after method."""
+        query, params, cursor_columns_count = self._get_keyset_query(
+            cursor=cursor,
+            page_size=page_size,
         )
-        return result
+
+        result = await session.execute(query, params)
+
+        items, next_cursor = self._get_keyset_page(
+            result=result,
+            page_size=page_size,
+            cursor_columns_count=cursor_columns_count,
+        )
+        await self._prefetch(session, items)
+
+        return items, next_cursor
+
+    async def page(self, number=1, size=20, session=None):
+        """
+        Async version of page method.
+
+        Objects and the total of distinct queries are fetched concurrently,
+        each in its own session, if the query manager has a sessionmaker
+        and no session is passed.
+        """
+        self._check_page(number, size)
+
+        if not self._distinct:
+            return await self._get_page(number, size, session=session)
+
+        query_manager = self.offset((number - 1) * size).limit(size)
+
+        if (
+            session is None
+            and is_sessionmaker(self.session)
+            and get_current_async_session() is None
+        ):
+            items, total = await asyncio.gather(query_manager.all(), self.count())
+        else:
+            items = await query_manager.all(session=session)
+            total = await self.count(session=session)
+
+        return Page(items=items, total=total, number=number, size=size)
 
     @get_async_session
-    async def all(self, session=None):
-        result = await session.execute(self.query)
+    async def _get_page(self, number, size, session=None):
+        statement, params = self._get_page_statement(number, size)
+        result = await session.execute(statement, params)
+
+        items, total = self._get_page_items(result)
+        if total is None:
+            total = await self.count(session=session) if number > 1 else 0
+
+        await self._prefetch(session, items)
+
+        return Page(items=items, total=total, number=number, size=size)
+
+    @get_async_session_iterator
+    async def astream(self, chunk_size=1000, session=None, expunge=True):
+        """
+        Async version of iterator method built on AsyncSession.stream().
+
+        Rows are fetched from a server-side cursor only when the consumer asks for
+        them, so a slow consumer naturally applies backpressure to the database.
+
+        Usage:
+            async for obj in Item.query_manager.where(is_valid=True).astream(500):
+                ...
+        """
+        statement, params = self._get_read_statement()
+        statement = statement.execution_options(yield_per=chunk_size)
+        result = await session.stream(statement, params)
 
-        if not self.fields:
+        if not self._returns_rows:
             result = result.scalars()
 
-        return result.all()
+        async for partition in result.partitions(chunk_size):
+            partition = self._from_rows(partition)
+            await self._prefetch(session, partition)
+
+            for obj in partition:
+                yield obj
+
+            if expunge:
+                self._detach(session, partition)
+
+    iterator = astream
+
+    def __aiter__(self):
+        return self.astream()
+
+    def __iter__(self):
+        raise TypeError(
+            "AsyncQueryManager is not iterable. Use 'async for' or astream() instead."
+        )
+
+    async def _estimate_count(self, session):
+        """Async version of _estimate_count method."""
+        dialect = get_session_dialect(session, self.ConverterConfig.model)
+        table = self.ConverterConfig.model.__table__
+
+        if self._counts_whole_table():
+            if dialect.name == "postgresql":
+                reltuples = (
+                    await session.execute(
+                        POSTGRES_RELTUPLES_QUERY,
+                        {"table_name": dialect.identifier_preparer.format_table(table)},
+                    )
+                ).scalar()
+                if reltuples is None or reltuples < 0:
+                    return None
+                return int(reltuples)
+            elif dialect.name == "sqlite":
+                if (await session.execute(SQLITE_STAT1_EXISTS_QUERY)).scalar():
+                    stat = (
+                        await session.execute(
+                            SQLITE_STAT1_QUERY, {"table_name": table.name}
+                        )
+                    ).scalar()
+                    if stat:
+                        return int(stat.split()[0])
+
+        if dialect.name == "postgresql":
+            statement, params = self._get_statement()
+            plan = (await session.execute(Explain(statement), params)).scalar()
+            return get_plan_rows(plan)
+
+        return None
 
     @get_async_session
-    async def count(self, session=None):
-        count = (
-            await session.execute(select(func.count()).select_from(self.query))
-        ).scalar_one()
+    async def count(self, session=None, estimate=False, exact_below=None):
+        """Async version of count method."""
+        if exact_below is not None:
+            statement, params = self._get_capped_count_statement(exact_below)
+            count = (await session.execute(statement, params)).scalar_one()
+
+            if count <= exact_below or not estimate:
+                return count
+
+        if estimate:
+            estimated_count = await self._estimate_count(session)
+
+            if estimated_count is not None:
+                if exact_below is not None:
+                    return max(estimated_count, exact_below + 1)
+                return estimated_count
+
+        statement, params = self._get_count_statement()
+        count = (await session.execute(statement, params)).scalar_one()
         return count
 
     @get_async_session
@@ -921,7 +3403,7 @@ class AsyncQueryManager(QueryManager):
         new_obj = self.ConverterConfig.model(**kwargs)
         session.add(new_obj)
 
-        if isinstance(self.session, sessionmaker):
+        if is_sessionmaker(self.session):
             await session.commit()
         else:
             await session.flush()
@@ -929,32 +3411,100 @@ class AsyncQueryManager(QueryManager):
         await session.refresh(new_obj)
         return new_obj
 
+    async def _commit_returned_objects(self, session, objects):
+        """Commit or flush a session after objects were loaded with RETURNING"""
+        if is_sessionmaker(self.session):
+            # The session is closed right after the commit, objects are expunged
+            # beforehand so the commit doesn't expire returned values
+            for obj in objects:
+                session.expunge(obj)
+            await session.commit()
+        else:
+            await session.flush()
+
     @get_async_session
     async def bulk_create(
         self,
         data: typing.List[typing.Dict],
         session=None,
+        batch_size=1000,
+        return_objects=True,
     ):
         """Async version of bulk_create method."""
         if not data:
-            return []
+            return [] if return_objects else 0
 
-        objects = [self.ConverterConfig.model(**item) for item in data]
-        session.add_all(objects)
+        model = self.ConverterConfig.model
+        to_commit = is_sessionmaker(self.session)
 
-        if isinstance(self.session, sessionmaker):
-            await session.commit()
-        else:
-            await session.flush()
+        if not return_objects:
+            for batch in chunked(data, batch_size):
+                if SQLALCHEMY_VERSION >= (2,):
+                    await session.execute(insert(model), batch)
+                else:
+                    await session.run_sync(
+                        lambda sync_session, batch=batch: (
+                            sync_session.bulk_insert_mappings(model, batch)
+                        )
+                    )
+
+            if to_commit:
+                await session.commit()
+            else:
+                await session.flush()
+
+            return len(data)
+
+        if not self._can_insert_returning(session):
+            objects = [model(**item) for item in data]
+            session.add_all(objects)
+
+            if to_commit:
+                await session.commit()
+            else:
+                await session.flush()
+
+            for obj in objects:
+                await session.refresh(obj)
+
+            return objects
+
+        objects = []
+        for batch in chunked(data, batch_size):
+            objects.extend(
+                await session.scalars(
+                    self._get_bulk_create_returning_statement(), batch
+                )
+            )
 
-        for obj in objects:
-            await session.refresh(obj)
+        await self._commit_returned_objects(session, objects)
 
         return objects
 
     @get_async_session
     async def get_or_create(self, session=None, defaults=None, **kwargs):
         """Async version of get_or_create method."""
+        conflict_columns = self._get_upsert_conflict_columns(session, kwargs, defaults)
+
+        if conflict_columns:
+            new_obj = (
+                (
+                    await session.execute(
+                        self._get_insert_do_nothing_statement(
+                            session=session,
+                            conflict_columns=conflict_columns,
+                            values={**kwargs, **(defaults or {})},
+                        )
+                    )
+                )
+                .scalars()
+                .first()
+            )
+
+            if new_obj is not None:
+                await self._commit_returned_objects(session, [new_obj])
+                return new_obj, True
+
         existing = await self.get(session=session, **kwargs)
 
         if existing:
@@ -985,7 +3535,7 @@ class AsyncQueryManager(QueryManager):
 
         await session.execute(update_query)
 
-        if isinstance(self.session, sessionmaker):
+        if is_sessionmaker(self.session):
             await session.commit()
         else:
             await session.flush()
@@ -1023,7 +3573,7 @@ class AsyncQueryManager(QueryManager):
 
         result = await session.execute(update_query)
 
-        if isinstance(self.session, sessionmaker):
+        if is_sessionmaker(self.session):
             await session.commit()
         else:
             await session.flush()
@@ -1033,6 +3583,31 @@ class AsyncQueryManager(QueryManager):
     @get_async_session
     async def update_or_create(self, session=None, defaults=None, **kwargs):
         """Async version of update_or_create method."""
+        conflict_columns = self._get_upsert_conflict_columns(session, kwargs, defaults)
+
+        if conflict_columns:
+            statements = [
+                (
+                    self._get_insert_do_nothing_statement(
+                        session=session,
+                        conflict_columns=conflict_columns,
+                        values={**kwargs, **(defaults or {})},
+                    ),
+                    True,
+                )
+            ]
+            if defaults:
+                statements.append(
+                    (self._get_update_by_lookup_statement(kwargs, defaults), False)
+                )
+
+            for statement, created in statements:
+                obj = (await session.execute(statement)).scalars().first()
+
+                if obj is not None:
+                    await self._commit_returned_objects(session, [obj])
+                    return obj, created
+
         existing = await self.get(session=session, **kwargs)
 
         if existing:
@@ -1041,7 +3616,7 @@ class AsyncQueryManager(QueryManager):
                     if hasattr(existing, key):
                         setattr(existing, key, value)
 
-            if isinstance(self.session, sessionmaker):
+            if is_sessionmaker(self.session):
                 await session.commit()
             else:
                 await session.flush()
@@ -1063,32 +3638,121 @@ class AsyncQueryManager(QueryManager):
         session=None,
         key_fields: typing.List[str] = None,
         expunge=True,
+        batch_size=1000,
+        return_objects=True,
     ):
         """Async version of bulk_update method that returns updated objects."""
         if not data:
-            return []
+            return [] if return_objects else 0
 
         if key_fields is None:
-            primary_keys = [
-                pk.name for pk in inspect(self.ConverterConfig.model).primary_key
-            ]
+            primary_keys = list(
+                get_model_metadata(self.ConverterConfig.model).primary_key_names
+            )
             key_fields = primary_keys
 
+        rows_count = 0
+        for statement, params in self._get_bulk_update_statements(
+            data=data,
+            key_fields=key_fields,
+            batch_size=batch_size,
+        ):
+            await session.execute(statement, params)
+            rows_count += len(params)
+
+        if is_sessionmaker(self.session):
+            await session.commit()
+        else:
+            await session.flush()
+
+        if not return_objects:
+            return rows_count
+
         updated_objects = []
+        for statement in self._get_bulk_update_select_statements(
+            data=data,
+            key_fields=key_fields,
+            batch_size=batch_size,
+        ):
+            updated_objects.extend((await session.execute(statement)).scalars().all())
+
+        return updated_objects
+
+    @get_async_session
+    async def bulk_upsert(
+        self,
+        data: typing.List[typing.Dict],
+        session=None,
+        conflict_fields: typing.List[str] = None,
+        update_fields: typing.List[str] = None,
+        batch_size=1000,
+        return_objects=True,
+    ):
+        """Async version of bulk_upsert method."""
+        if not data:
+            return [] if return_objects else 0
+
+        if conflict_fields is None:
+            conflict_fields = list(
+                get_model_metadata(self.ConverterConfig.model).primary_key_names
+            )
 
-        for item in data:
-            filter_kwargs = {key: item[key] for key in key_fields if key in item}
-            update_kwargs = {k: v for k, v in item.items() if k not in key_fields}
+        dialect = get_session_dialect(session, model=self.ConverterConfig.model)
+        if not supports_upsert(dialect):
+            raise NotImplementedError(
+                f"Upsert is not supported for {dialect.name} dialect"
+            )
 
-            if update_kwargs and filter_kwargs:
-                query_manager = self.__class__(self.ConverterConfig.model, session)
-                query_manager.where(**filter_kwargs)
-                updated_objs = await query_manager.update(
-                    session=session, expunge=False, **update_kwargs
+        use_returning = return_objects and supports_returning(dialect)
+        # Objects which can't be returned by RETURNING are fetched with SELECT
+        fetch_objects = return_objects and not use_returning
+
+        objects = []
+        rows_count = 0
+        for (
+            statement,
+            statement_rows_count,
+            do_nothing,
+        ) in self._get_bulk_upsert_statements(
+            dialect=dialect,
+            data=data,
+            conflict_fields=conflict_fields,
+            update_fields=update_fields,
+            batch_size=batch_size,
+        ):
+            if use_returning and not do_nothing:
+                objects.extend(
+                    (
+                        await session.execute(self._get_returning_statement(statement))
+                    ).scalars()
                 )
-                updated_objects.extend(updated_objs)
+            else:
+                await session.execute(statement)
+                # ON CONFLICT DO NOTHING returns only inserted rows
+                fetch_objects = return_objects
+            rows_count += statement_rows_count
 
-        return updated_objects
+        # The same row might be upserted by several batches
+        objects = list(dict.fromkeys(objects))
+
+        await self._commit_returned_objects(session, objects)
+
+        if not return_objects:
+            return rows_count
+
+        if fetch_objects:
+            # All upserted rows are selected, including ones returned by RETURNING
+            objects = []
+            for statement in self._get_bulk_update_select_statements(
+                data=data,
+                key_fields=conflict_fields,
+                batch_size=batch_size,
+            ):
+                objects.extend((await session.execute(statement)).scalars().all())
+
+            objects = list(dict.fromkeys(objects))
+
+        return objects
 
     @get_async_session
     async def delete(self, session=None, synchronize_session=True):
@@ -1108,7 +3772,7 @@ class AsyncQueryManager(QueryManager):
             delete_query, execution_options={"synchronize_session": False}
         )
 
-        if isinstance(self.session, sessionmaker):
+        if is_sessionmaker(self.session):
             await session.commit()
         else:
             await session.flush()
@@ -1118,38 +3782,73 @@ class AsyncQueryManager(QueryManager):
     @get_async_session
     async def exists(self, session=None, **kwargs):
         """Async version of exists method."""
-        if kwargs:
-            query_manager = self.__class__(self.ConverterConfig.model, session)
-            query_manager._filters = {**self._filters, **kwargs}
-            return await query_manager.exists(session=session)
+        query_manager = self.where(**kwargs) if kwargs else self
+
+        statement, params = query_manager._get_exists_statement()
+        return (await session.execute(statement, params)).scalar()
 
-        query = select(self.ConverterConfig.model).where(*self.binary_expressions)
-        exists_query = select(query.exists())
+    @get_async_session
+    async def exists_many(self, keys, field="pk", session=None):
+        """Async version of exists_many method."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return set()
 
-        return (await session.execute(exists_query)).scalar()
+        statement, params = self._get_exists_many_statement(keys, field)
+        return set((await session.execute(statement, params)).scalars())
 
 
 class BaseModelQueryManagerMixin:
     class QueryManagerConfig:
         session = None
+        # Number of built statements cached per model, 0 disables the cache
+        statement_cache_size = DEFAULT_STATEMENT_CACHE_SIZE
+        # Compute model metadata when its mapper is configured instead of on first use
+        eager_metadata = False
+        # How objects returned by read operations are detached from the session
+        detach_strategy = DetachStrategy.EXPUNGE
+        # Number of values of an in/not_in filter above which they are bound as one
+        # array (postgres) or JSON (sqlite) parameter instead of an IN list, 0 disables it
+        large_in_threshold = DEFAULT_LARGE_IN_THRESHOLD
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        if getattr(cls.QueryManagerConfig, "eager_metadata", False):
+            register_model(cls)
 
     def as_dict(self) -> typing.Dict[str, str]:
         return {c.name: getattr(self, c.name) for c in self.__table__.columns}  # type: ignore
 
+    @classmethod
+    def _get_root_query_manager(cls, query_manager_class):
+        """
+        Get a query manager without filters for the model.
+
+        Query managers are never changed in place, so one instance is stored
+        on the model and rebuilt only when the configured session changes.
+        """
+        session = getattr(cls.QueryManagerConfig, "session", None)
+
+        query_manager = cls.__dict__.get("_query_manager_root")
+        if (
+            query_manager is None
+            or query_manager.__class__ is not query_manager_class
+            or query_manager.session is not session
+        ):
+            query_manager = query_manager_class(model=cls, session=session)
+            setattr(cls, "_query_manager_root", query_manager)
+
+        return query_manager
+
 
 class ModelQueryManagerMixin(BaseModelQueryManagerMixin):
     @classproperty
     def query_manager(cls):
-        return QueryManager(
-            model=cls,
-            session=getattr(cls.QueryManagerConfig, "session", None),
-        )
+        return cls._get_root_query_manager(QueryManager)
 
 
 class AsyncModelQueryManagerMixin(BaseModelQueryManagerMixin):
     @classproperty
     def query_manager(cls):
-        return AsyncQueryManager(
-            model=cls,
-            session=getattr(cls.QueryManagerConfig, "session", None),
-        )
+        return cls._get_root_query_manager(AsyncQueryManager)
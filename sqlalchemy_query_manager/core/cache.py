@@ -0,0 +1,98 @@
+import collections
+import threading
+import typing
+
+
+DEFAULT_STATEMENT_CACHE_SIZE = 128
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+
+class StatementCache:
+    """
+    LRU cache of statements built by QueryManager.
+
+    Statements are stored by the shape of a query, filter values
+    are passed as bind parameters when a statement is executed.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_STATEMENT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+        self._statements: typing.OrderedDict = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            statement = self._statements.get(key)
+
+            if statement is None:
+                self.misses += 1
+                return None
+
+            self._statements.move_to_end(key)
+            self.hits += 1
+            return statement
+
+    def set(self, key, statement):
+        with self._lock:
+            self._statements[key] = statement
+            self._statements.move_to_end(key)
+
+            while len(self._statements) > self.maxsize:
+                self._statements.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._statements.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=len(self._statements),
+        )
+
+
+def get_statement_cache(model) -> typing.Optional[StatementCache]:
+    """
+    Get the statement cache of a model.
+
+    The cache is created on first use and stored on the model class.
+    Its size is set by QueryManagerConfig.statement_cache_size, 0 disables it.
+    """
+    cache = model.__dict__.get("_query_manager_statement_cache")
+
+    if cache is None:
+        config = getattr(model, "QueryManagerConfig", None)
+        maxsize = getattr(config, "statement_cache_size", DEFAULT_STATEMENT_CACHE_SIZE)
+        if not maxsize:
+            return None
+
+        cache = StatementCache(maxsize=maxsize)
+        setattr(model, "_query_manager_statement_cache", cache)
+
+    return cache
+
+
+def get_lookup_cache(model) -> typing.Dict:
+    """
+    Get the cache of resolved lookups of a model.
+
+    Lookups like "group__owner__email__isnull" are resolved to models to join,
+    a model field and an operation once and stored on the model class.
+    """
+    cache = model.__dict__.get("_query_manager_lookup_cache")
+
+    if cache is None:
+        cache = {}
+        setattr(model, "_query_manager_lookup_cache", cache)
+
+    return cache
@@ -0,0 +1,155 @@
+import json
+
+from sqlalchemy import Boolean, String, bindparam, cast, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement, ColumnElement
+from sqlalchemy.sql.visitors import InternalTraversal
+from sqlalchemy.types import TypeDecorator
+
+
+# Number of values of an in/not_in filter above which InValues is used instead of IN (...)
+DEFAULT_LARGE_IN_THRESHOLD = 1000
+
+
+class ValueList(TypeDecorator):
+    """
+    List of values bound as one parameter.
+
+    Postgres gets an array, other dialects get a JSON array.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def __init__(self, item_type):
+        super().__init__()
+        self.item_type = item_type
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(ARRAY(self.item_type))
+        return dialect.type_descriptor(String())
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if dialect.name == "postgresql":
+            return list(value)
+        return json.dumps(list(value), default=str)
+
+
+class InValues(ColumnElement):
+    """
+    column IN <values> for large sets of values.
+
+    Values are bound as one parameter and joined as a set, so the planner
+    can hash them instead of checking a long IN list:
+        postgres: column IN (SELECT unnest(CAST(:values AS type[])))
+        sqlite: column IN (SELECT value FROM json_each(:values))
+    Other dialects get a regular IN list.
+    """
+
+    __visit_name__ = "qm_in_values"
+    type = Boolean()
+    _is_implicitly_boolean = True
+    inherit_cache = True
+    _traverse_internals = [
+        ("column", InternalTraversal.dp_clauseelement),
+        ("values", InternalTraversal.dp_clauseelement),
+        ("negate", InternalTraversal.dp_boolean),
+    ]
+
+    def __init__(self, column, values=None, key=None, negate=False):
+        if hasattr(column, "__clause_element__"):
+            column = column.__clause_element__()
+
+        self.column = column
+        self.negate = negate
+
+        self.values = bindparam(
+            key,
+            None if values is None else list(values),
+            type_=ValueList(column.type),
+            unique=key is None,
+        )
+
+
+def _in_operator(element):
+    return "NOT IN" if element.negate else "IN"
+
+
+@compiles(InValues)
+def _compile_in_values(element, compiler, **kw):
+    # A clone of the parameter is matched to the original one by a cached
+    # statement, so values of later executions are bound to it
+    values = element.values._clone(maintain_key=True)
+    values.type = element.column.type
+    values.expanding = True
+
+    expression = element.column.in_(values)
+    if element.negate:
+        expression = ~expression
+
+    return compiler.process(expression, **kw)
+
+
+@compiles(InValues, "postgresql")
+def _compile_in_values_postgresql(element, compiler, **kw):
+    values = cast(element.values, ARRAY(element.column.type))
+
+    return (
+        f"{compiler.process(element.column, **kw)} {_in_operator(element)} "
+        f"(SELECT unnest({compiler.process(values, **kw)}))"
+    )
+
+
+@compiles(InValues, "sqlite")
+def _compile_in_values_sqlite(element, compiler, **kw):
+    return (
+        f"{compiler.process(element.column, **kw)} {_in_operator(element)} "
+        f"(SELECT value FROM json_each({compiler.process(element.values, **kw)}))"
+    )
+
+
+class Explain(Executable, ClauseElement):
+    """
+    EXPLAIN of a statement, parameters of the statement are bound as usual.
+
+    Postgres returns the plan as JSON.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain)
+def _compile_explain(element, compiler, **kw):
+    return f"EXPLAIN {compiler.process(element.statement, **kw)}"
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain_postgresql(element, compiler, **kw):
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
+
+# Planner statistics of the number of rows of a table
+POSTGRES_RELTUPLES_QUERY = text(
+    "SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table_name)"
+)
+SQLITE_STAT1_EXISTS_QUERY = text(
+    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+)
+SQLITE_STAT1_QUERY = text(
+    "SELECT stat FROM sqlite_stat1 WHERE tbl = :table_name AND stat IS NOT NULL LIMIT 1"
+)
+
+
+def get_plan_rows(plan) -> int:
+    """Get the estimated number of rows from the JSON output of Postgres EXPLAIN"""
+    if isinstance(plan, (str, bytes)):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
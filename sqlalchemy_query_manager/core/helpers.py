@@ -1,3 +1,10 @@
+from sqlalchemy import nulls_first, nulls_last
+
+
+# Functions placing NULL values at the opposite end of the ordering
+_REVERSED_FUNCS = {nulls_first: nulls_last, nulls_last: nulls_first}
+
+
 class E:
     """
     Class for sqlalchemy methods which might be applied to fields.
@@ -7,3 +14,22 @@ class E:
     def __init__(self, field_name: str, func):
         self.field_name = field_name
         self.func = func
+
+
+def reverse_order_by(order_by):
+    """
+    Get an ordering term sorting in the opposite direction.
+
+    nulls_last and nulls_first of E are swapped,
+    so NULL values end up on the opposite side as well.
+    """
+    if isinstance(order_by, E):
+        return E(
+            reverse_order_by(order_by.field_name),
+            _REVERSED_FUNCS.get(order_by.func, order_by.func),
+        )
+
+    order_by = str(order_by)
+    if order_by.startswith("-"):
+        return order_by[1:]
+    return f"-{order_by}"
@@ -0,0 +1,134 @@
+import asyncio
+import typing
+
+from sqlalchemy_query_manager.core.transaction_context_manager import (
+    get_current_async_session,
+)
+from sqlalchemy_query_manager.core.utils import chunked
+
+
+class DataLoader:
+    """
+    Batch loader of objects by a unique field.
+
+    Keys requested by coroutines in the same event loop iteration
+    (or within delay seconds) are loaded with one WHERE field IN (...) query.
+    Keys are deduplicated and results are cached by the loader,
+    so a loader is supposed to be created per request.
+    Batches are loaded concurrently unless they share the session
+    of an AsyncQueryManager.unit() block, then they are loaded one by one.
+
+    Usage:
+        loader = Item.query_manager.loader()
+
+        items = await asyncio.gather(*[loader.load(item_id) for item_id in item_ids])
+    """
+
+    def __init__(
+        self,
+        query_manager,
+        field: str = "pk",
+        max_batch_size: int = 1000,
+        delay: float = 0,
+    ):
+        field = query_manager._get_lookup_field(field)
+
+        self.query_manager = query_manager
+        self.field = field
+        self.max_batch_size = max_batch_size
+        self.delay = delay
+
+        self._futures: typing.Dict[typing.Any, asyncio.Future] = {}
+        self._queue: typing.List = []
+        self._dispatch_handle: typing.Optional[asyncio.Handle] = None
+        # The event loop keeps only weak references to tasks
+        self._tasks: typing.Set[asyncio.Future] = set()
+
+    def load(self, key) -> asyncio.Future:
+        """
+        Load an object by a key.
+
+        Returns:
+            Awaitable resolved with the object or None if it doesn't exist
+        """
+        future = self._futures.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+
+        future = loop.create_future()
+        self._futures[key] = future
+        self._queue.append(key)
+
+        if self._dispatch_handle is None:
+            if self.delay:
+                self._dispatch_handle = loop.call_later(self.delay, self._dispatch)
+            else:
+                self._dispatch_handle = loop.call_soon(self._dispatch)
+
+        return future
+
+    async def load_many(self, keys) -> typing.List:
+        """Load objects by keys, None is returned for missing objects"""
+        return list(await asyncio.gather(*[self.load(key) for key in keys]))
+
+    def prime(self, key, obj):
+        """Put an object to the cache of the loader"""
+        if key not in self._futures:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(obj)
+            self._futures[key] = future
+
+    def clear(self, key=None):
+        """Remove a key or all keys from the cache of the loader"""
+        if key is None:
+            self._futures = {
+                key: future
+                for key, future in self._futures.items()
+                if not future.done()
+            }
+        elif key in self._futures and self._futures[key].done():
+            del self._futures[key]
+
+    def _dispatch(self):
+        keys, self._queue = self._queue, []
+        self._dispatch_handle = None
+
+        batches = list(chunked(keys, self.max_batch_size))
+
+        # A session of a unit() block can't run queries concurrently
+        if get_current_async_session() is not None:
+            self._start(self._load_batches(batches))
+        else:
+            for batch in batches:
+                self._start(self._load_batch(batch))
+
+    def _start(self, coroutine):
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load_batches(self, batches):
+        for batch in batches:
+            await self._load_batch(batch)
+
+    async def _load_batch(self, keys):
+        try:
+            objects = await self.query_manager.where(
+                **{f"{self.field}__in": keys}
+            ).all()
+        except Exception as e:
+            for key in keys:
+                # Failed keys are not cached, so they can be loaded again
+                future = self._futures.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            return
+
+        objects_by_key = {getattr(obj, self.field): obj for obj in objects}
+
+        for key in keys:
+            future = self._futures.get(key)
+            if future is not None and not future.done():
+                future.set_result(objects_by_key.get(key))
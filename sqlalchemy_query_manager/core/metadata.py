@@ -0,0 +1,87 @@
+import dataclasses
+import typing
+import weakref
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Mapper
+
+from sqlalchemy_query_manager.core.upsert import get_unique_column_sets
+
+
+@dataclasses.dataclass(frozen=True)
+class ModelMetadata:
+    """Invariant information about a model used by QueryManager"""
+
+    primary_key: typing.Tuple
+    primary_key_names: typing.Tuple[str, ...]
+    primary_key_attrs: typing.Tuple[str, ...]
+    columns: typing.Tuple
+    column_attrs: typing.Dict[str, typing.Any]
+    column_types: typing.Dict[str, typing.Any]
+    hybrids: typing.Tuple[str, ...]
+    relationships: typing.Dict[str, typing.Any]
+    unique_column_sets: typing.Tuple[typing.FrozenSet[str], ...]
+
+
+# Models which metadata is computed as soon as their mapper is configured
+_eager_models: "weakref.WeakSet" = weakref.WeakSet()
+
+
+def build_model_metadata(model) -> ModelMetadata:
+    mapper = inspect(model)
+    table = model.__table__
+
+    return ModelMetadata(
+        primary_key=tuple(mapper.primary_key),
+        primary_key_names=tuple(column.name for column in mapper.primary_key),
+        primary_key_attrs=tuple(
+            mapper.get_property_by_column(column).key for column in mapper.primary_key
+        ),
+        columns=tuple(table.columns),
+        column_attrs={
+            name: column_attr.columns[0]
+            for name, column_attr in mapper.column_attrs.items()
+        },
+        column_types={
+            name: column_attr.columns[0].type
+            for name, column_attr in mapper.column_attrs.items()
+        },
+        hybrids=tuple(
+            name
+            for name, attr in vars(model).items()
+            if isinstance(attr, hybrid_property)
+        ),
+        relationships={
+            name: relationship.entity.class_
+            for name, relationship in mapper.relationships.items()
+        },
+        unique_column_sets=tuple(get_unique_column_sets(table)),
+    )
+
+
+def get_model_metadata(model) -> ModelMetadata:
+    """
+    Get metadata of a model.
+
+    Metadata is computed on first use and stored on the model class,
+    models with QueryManagerConfig.eager_metadata get it when their mapper is configured.
+    """
+    model_metadata = model.__dict__.get("_query_manager_metadata")
+
+    if model_metadata is None:
+        model_metadata = build_model_metadata(model)
+        setattr(model, "_query_manager_metadata", model_metadata)
+
+    return model_metadata
+
+
+def register_model(model):
+    """Register a model to compute its metadata when its mapper is configured"""
+    _eager_models.add(model)
+
+
+@event.listens_for(Mapper, "mapper_configured")
+def _compute_eager_metadata(mapper, model):
+    if model in _eager_models:
+        get_model_metadata(model)
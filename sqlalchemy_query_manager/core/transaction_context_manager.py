@@ -1,32 +1,114 @@
+import contextvars
+import enum
+import inspect
+import typing
+import weakref
 from contextlib import _AsyncGeneratorContextManager, _GeneratorContextManager
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, sessionmaker
 
 
-def is_generator_context_manager(obj):
+try:
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+except ImportError:  # SQLAlchemy < 2.0
+    _SESSIONMAKER_TYPES: typing.Tuple[type, ...] = (sessionmaker,)
+else:
+    _SESSIONMAKER_TYPES = (sessionmaker, async_sessionmaker)
+
+
+class SessionProviderType(enum.Enum):
+    """Kinds of objects which can be used as a session of a QueryManager"""
+
+    SESSIONMAKER = "sessionmaker"
+    SESSION = "session"
+    # Functions decorated with @contextmanager
+    CONTEXT_MANAGER_FACTORY = "context_manager_factory"
+    # Functions decorated with @asynccontextmanager
+    ASYNC_CONTEXT_MANAGER_FACTORY = "async_context_manager_factory"
+    # Other callables, a context manager returned by them is checked on use
+    FACTORY = "factory"
+
+
+# Sessions of the current atomic()/unit() block, shared by all query managers inside it
+_current_session: contextvars.ContextVar = contextvars.ContextVar(
+    "sqlalchemy_query_manager_session", default=None
+)
+_current_async_session: contextvars.ContextVar = contextvars.ContextVar(
+    "sqlalchemy_query_manager_async_session", default=None
+)
+
+
+def get_current_session():
+    """Get the session of the current QueryManager.atomic() block"""
+    return _current_session.get()
+
+
+def get_current_async_session():
+    """Get the session of the current AsyncQueryManager.unit() block"""
+    return _current_async_session.get()
+
+
+_session_provider_types: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _classify_session_provider(session):
+    if isinstance(session, _SESSIONMAKER_TYPES):
+        return SessionProviderType.SESSIONMAKER
+
+    if isinstance(session, (Session, AsyncSession)):
+        return SessionProviderType.SESSION
+
+    if not callable(session):
+        return None
+
+    # @contextmanager keeps the decorated function in __wrapped__,
+    # so a factory is classified without calling it
+    func = inspect.unwrap(session)
+    if inspect.isasyncgenfunction(func):
+        return SessionProviderType.ASYNC_CONTEXT_MANAGER_FACTORY
+    if inspect.isgeneratorfunction(func):
+        return SessionProviderType.CONTEXT_MANAGER_FACTORY
+
+    return SessionProviderType.FACTORY
+
+
+def get_session_provider_type(session):
     """
-    Helper function to check if the object is a generator-based context manager
-    (created by @contextmanager).
+    Get the kind of a session provider.
+
+    Providers are classified once and the result is cached per provider object,
+    sessions are checked directly since they are short-lived.
+
+    Returns:
+        SessionProviderType or None if the object can't provide a session
     """
-    # Ensure the object is callable, and if called, returns a generator.
-    if callable(obj):
-        try:
-            # Check if calling it returns a generator (context manager)
-            result = obj()
-            if isinstance(result, _GeneratorContextManager) or isinstance(
-                result, _AsyncGeneratorContextManager
-            ):
-                return True
-        except Exception:
-            pass
-    return False
+    if isinstance(session, (Session, AsyncSession)):
+        return SessionProviderType.SESSION
+
+    try:
+        return _session_provider_types[session]
+    except (KeyError, TypeError):
+        pass
 
+    provider_type = _classify_session_provider(session)
 
-def is_async_context_manager(obj):
-    return callable(getattr(obj, "__aenter__", None)) and callable(
-        getattr(obj, "__aexit__", None)
-    )
+    try:
+        _session_provider_types[session] = provider_type
+    except TypeError:
+        # Objects without weak reference support are classified on every use
+        pass
+
+    return provider_type
+
+
+def is_sessionmaker(session):
+    """
+    Check whether sessions are created by the query manager from a sessionmaker.
+
+    Such sessions are committed by operations, other sessions are only flushed.
+    """
+    return get_session_provider_type(session) == SessionProviderType.SESSIONMAKER
 
 
 class BaseSessionContextManager:
@@ -44,14 +126,24 @@ class BaseSessionContextManager:
 
 class TransactionSessionContextManager(BaseSessionContextManager):
     def __enter__(self):  # type: ignore
-        if isinstance(self.session, sessionmaker):
+        provider_type = get_session_provider_type(self.session)
+
+        if provider_type == SessionProviderType.SESSIONMAKER:
             self.resource = self.session().__enter__()
             self._to_exit = True
-        elif isinstance(self.session, Session):
+        elif provider_type == SessionProviderType.SESSION and isinstance(
+            self.session, Session
+        ):
             self.resource = self.session
             self.is_session_already_set = True
-        elif is_generator_context_manager(self.session):
-            self._ctx = self.session()
+        elif provider_type in (
+            SessionProviderType.CONTEXT_MANAGER_FACTORY,
+            SessionProviderType.FACTORY,
+        ):
+            ctx = self.session()
+            if not isinstance(ctx, _GeneratorContextManager):
+                raise NotImplementedError
+            self._ctx = ctx
             self.resource = self._ctx.__enter__()
             self._to_exit = True
         else:
@@ -68,14 +160,24 @@ class TransactionSessionContextManager(BaseSessionContextManager):
 
 class AsyncTransactionSessionContextManager(BaseSessionContextManager):
     async def __aenter__(self):  # type: ignore
-        if isinstance(self.session, sessionmaker):
+        provider_type = get_session_provider_type(self.session)
+
+        if provider_type == SessionProviderType.SESSIONMAKER:
             self.resource = await self.session().__aenter__()
             self._to_exit = True
-        elif isinstance(self.session, AsyncSession):
+        elif provider_type == SessionProviderType.SESSION and isinstance(
+            self.session, AsyncSession
+        ):
             self.resource = self.session
             self.is_session_already_set = True
-        elif is_generator_context_manager(self.session):
-            self._ctx = self.session()
+        elif provider_type in (
+            SessionProviderType.ASYNC_CONTEXT_MANAGER_FACTORY,
+            SessionProviderType.FACTORY,
+        ):
+            ctx = self.session()
+            if not isinstance(ctx, _AsyncGeneratorContextManager):
+                raise NotImplementedError
+            self._ctx = ctx
             self.resource = await self._ctx.__aenter__()
             self._to_exit = True
         else:
@@ -88,3 +190,86 @@ class AsyncTransactionSessionContextManager(BaseSessionContextManager):
                 await self._ctx.__aexit__(exc_type, exc, tb)
             else:
                 await self.resource.__aexit__(exc_type, exc, tb)
+
+
+class AtomicSessionContextManager:
+    """
+    Share one session between all query managers inside the block.
+
+    Operations inside the block flush instead of committing, a session created
+    by the block is committed once when it exits. Nested blocks join the outer one.
+    """
+
+    def __init__(self, session) -> None:  # type: ignore
+        self._session_ctx = TransactionSessionContextManager(session=session)
+        self._token = None
+
+    def __enter__(self):  # type: ignore
+        current_session = get_current_session()
+        if current_session is not None:
+            return current_session
+
+        session = self._session_ctx.__enter__()
+        self._token = _current_session.set(session)
+        return session
+
+    def __exit__(self, exc_type, exc, tb):  # type: ignore
+        if self._token is None:
+            return
+
+        _current_session.reset(self._token)
+        self._token = None
+
+        session = self._session_ctx.resource
+        try:
+            if exc_type is None and not self._session_ctx.is_session_already_set:
+                session.flush()
+                # Returned objects stay usable after the session is closed
+                session.expunge_all()
+
+                if self._session_ctx._ctx is None:
+                    session.commit()
+        except BaseException as e:
+            self._session_ctx.__exit__(type(e), e, e.__traceback__)
+            raise
+
+        self._session_ctx.__exit__(exc_type, exc, tb)
+
+
+class AsyncAtomicSessionContextManager:
+    """Async version of AtomicSessionContextManager."""
+
+    def __init__(self, session) -> None:  # type: ignore
+        self._session_ctx = AsyncTransactionSessionContextManager(session=session)
+        self._token = None
+
+    async def __aenter__(self):  # type: ignore
+        current_session = get_current_async_session()
+        if current_session is not None:
+            return current_session
+
+        session = await self._session_ctx.__aenter__()
+        self._token = _current_async_session.set(session)
+        return session
+
+    async def __aexit__(self, exc_type, exc, tb):  # type: ignore
+        if self._token is None:
+            return
+
+        _current_async_session.reset(self._token)
+        self._token = None
+
+        session = self._session_ctx.resource
+        try:
+            if exc_type is None and not self._session_ctx.is_session_already_set:
+                await session.flush()
+                # Returned objects stay usable after the session is closed
+                session.expunge_all()
+
+                if self._session_ctx._ctx is None:
+                    await session.commit()
+        except BaseException as e:
+            await self._session_ctx.__aexit__(type(e), e, e.__traceback__)
+            raise
+
+        await self._session_ctx.__aexit__(exc_type, exc, tb)
@@ -0,0 +1,101 @@
+from sqlalchemy import Index, UniqueConstraint
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+
+ON_CONFLICT_DIALECTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+ON_DUPLICATE_KEY_DIALECTS = {
+    "mysql": mysql.insert,
+    "mariadb": mysql.insert,
+}
+
+
+def supports_upsert(dialect) -> bool:
+    """Check if a dialect has a native INSERT ... ON CONFLICT/ON DUPLICATE KEY"""
+    return (
+        dialect.name in ON_CONFLICT_DIALECTS
+        or dialect.name in ON_DUPLICATE_KEY_DIALECTS
+    )
+
+
+def supports_returning(dialect) -> bool:
+    """Check if a dialect supports INSERT/UPDATE ... RETURNING"""
+    # sqlalchemy >= 2.0 uses insert_returning, 1.4 uses full_returning
+    # which is deprecated in 2.0
+    if hasattr(dialect, "insert_returning"):
+        return bool(dialect.insert_returning)
+    return bool(getattr(dialect, "full_returning", False))
+
+
+def is_do_nothing_upsert(dialect, update_columns) -> bool:
+    """Check if an upsert skips existing rows, RETURNING doesn't return them then"""
+    return dialect.name in ON_CONFLICT_DIALECTS and not update_columns
+
+
+def get_unique_column_sets(table):
+    """Get sets of column names which are guaranteed to be unique in a table"""
+    unique_column_sets = []
+
+    if table.primary_key.columns:
+        unique_column_sets.append(
+            frozenset(column.key for column in table.primary_key.columns)
+        )
+
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            unique_column_sets.append(
+                frozenset(column.key for column in constraint.columns)
+            )
+
+    for index in table.indexes:
+        if isinstance(index, Index) and index.unique:
+            unique_column_sets.append(frozenset(column.key for column in index.columns))
+
+    return unique_column_sets
+
+
+def get_insert_do_nothing_statement(dialect, table, values, conflict_columns):
+    """Build INSERT ... ON CONFLICT (conflict_columns) DO NOTHING"""
+    insert = ON_CONFLICT_DIALECTS[dialect.name]
+    return (
+        insert(table)
+        .values(values)
+        .on_conflict_do_nothing(
+            index_elements=conflict_columns,
+        )
+    )
+
+
+def get_upsert_statement(dialect, table, rows, conflict_columns, update_columns):
+    """
+    Build a multi-row upsert statement.
+
+    Postgres and SQLite use INSERT ... ON CONFLICT (conflict_columns) DO UPDATE,
+    MySQL uses INSERT ... ON DUPLICATE KEY UPDATE which checks all unique keys.
+    """
+    if dialect.name in ON_CONFLICT_DIALECTS:
+        statement = ON_CONFLICT_DIALECTS[dialect.name](table).values(rows)
+
+        if not update_columns:
+            return statement.on_conflict_do_nothing(index_elements=conflict_columns)
+
+        return statement.on_conflict_do_update(
+            index_elements=conflict_columns,
+            set_={column: statement.excluded[column] for column in update_columns},
+        )
+
+    if dialect.name in ON_DUPLICATE_KEY_DIALECTS:
+        statement = ON_DUPLICATE_KEY_DIALECTS[dialect.name](table).values(rows)
+
+        # Updating a conflict column to its own value is a no-op
+        # which makes MySQL skip duplicated rows
+        update_columns = update_columns or conflict_columns[:1]
+
+        return statement.on_duplicate_key_update(
+            {column: statement.inserted[column] for column in update_columns}
+        )
+
+    raise NotImplementedError(f"Upsert is not supported for {dialect.name} dialect")
@@ -1,24 +1,52 @@
+import base64
+import datetime
+import decimal
+import itertools
+import json
+import uuid
 from functools import wraps
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from sqlalchemy_query_manager.core.transaction_context_manager import (
     AsyncTransactionSessionContextManager,
     TransactionSessionContextManager,
+    get_current_async_session,
+    get_current_session,
 )
 
 
+def _resolve_expunge(expunge, session, ctx_manager):
+    # Objects stay in a session owned by the caller unless expunge is passed
+    if expunge is None:
+        return not (session or ctx_manager.is_session_already_set)
+    return expunge
+
+
 def get_session(func):
-    """Decorator that provides a sync session from inside a class."""
+    """
+    Decorator that provides a sync session from inside a class.
+
+    Returned objects are expunged from a session opened by the decorator.
+    Objects stay in a session passed by the caller or shared by atomic(),
+    unless expunge=True is passed explicitly.
+    """
 
     @wraps(func)
     def wrapper(self, *args, session=None, **kwargs):
+        # Inside QueryManager.atomic() the block's session is used
+        current_session = None if session else get_current_session()
+        if current_session is not None:
+            self = self.with_session(current_session)
+
         ctx_manager = TransactionSessionContextManager(
             session=session or self.session,
         )
 
         with ctx_manager as managed_session:
-            expunge = True
-            if session or ctx_manager.is_session_already_set:
-                expunge = False
+            expunge = _resolve_expunge(
+                kwargs.pop("expunge", None), session, ctx_manager
+            )
 
             return func(self, session=managed_session, expunge=expunge, *args, **kwargs)
 
@@ -30,9 +58,147 @@ def get_async_session(func):
 
     @wraps(func)
     async def wrapper(self, *args, session=None, **kwargs):
+        # Inside AsyncQueryManager.unit() the block's session is used
+        current_session = None if session else get_current_async_session()
+        if current_session is not None:
+            self = self.with_session(current_session)
+
         async with AsyncTransactionSessionContextManager(
             session=session or self.session
         ) as managed_session:
             return await func(self, session=managed_session, *args, **kwargs)
 
     return wrapper
+
+
+def get_session_iterator(func):
+    """
+    Decorator that provides a sync session to a generator from inside a class.
+    The session is kept open until the generator is exhausted or closed.
+    Objects are expunged like with get_session.
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, session=None, **kwargs):
+        # Inside QueryManager.atomic() the block's session is used
+        current_session = None if session else get_current_session()
+        if current_session is not None:
+            self = self.with_session(current_session)
+
+        ctx_manager = TransactionSessionContextManager(
+            session=session or self.session,
+        )
+
+        with ctx_manager as managed_session:
+            expunge = _resolve_expunge(
+                kwargs.pop("expunge", None), session, ctx_manager
+            )
+
+            yield from func(
+                self, session=managed_session, expunge=expunge, *args, **kwargs
+            )
+
+    return wrapper
+
+
+def get_async_session_iterator(func):
+    """
+    Decorator that provides an async session to an async generator from inside a class.
+    The session is kept open until the generator is exhausted or closed.
+    """
+
+    @wraps(func)
+    async def wrapper(self, *args, session=None, **kwargs):
+        # Inside AsyncQueryManager.unit() the block's session is used
+        current_session = None if session else get_current_async_session()
+        if current_session is not None:
+            self = self.with_session(current_session)
+
+        ctx_manager = AsyncTransactionSessionContextManager(
+            session=session or self.session,
+        )
+
+        async with ctx_manager as managed_session:
+            expunge = True
+            if session or ctx_manager.is_session_already_set:
+                expunge = False
+
+            async for item in func(
+                self, session=managed_session, expunge=expunge, *args, **kwargs
+            ):
+                yield item
+
+    return wrapper
+
+
+def get_session_dialect(session, model=None):
+    """Get the dialect of the database a sync or async session is bound to."""
+    if isinstance(session, AsyncSession):
+        session = session.sync_session
+    return session.get_bind(mapper=model).dialect
+
+
+def chunked(iterable, size):
+    """Split an iterable into lists of at most size elements."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def freeze(value):
+    """
+    Convert a value to a hashable one with the same equality.
+
+    Lists and tuples become tuples, sets become frozensets and dicts
+    become frozensets of their items, nested values are converted as well.
+    """
+    if isinstance(value, dict):
+        # Tagged, so a dict is not equal to a tuple of pairs
+        return (dict, frozenset((key, freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    return value
+
+
+CURSOR_TYPES = {
+    "datetime": (datetime.datetime, datetime.datetime.fromisoformat),
+    "date": (datetime.date, datetime.date.fromisoformat),
+    "time": (datetime.time, datetime.time.fromisoformat),
+    "decimal": (decimal.Decimal, decimal.Decimal),
+    "uuid": (uuid.UUID, uuid.UUID),
+}
+
+
+def _encode_cursor_value(value):
+    for type_name, (type_, _) in CURSOR_TYPES.items():
+        if isinstance(value, type_):
+            value = value.isoformat() if hasattr(value, "isoformat") else str(value)
+            return {"type": type_name, "value": value}
+    raise TypeError(f"Value of type {type(value).__name__} can't be used in a cursor")
+
+
+def _decode_cursor_value(obj):
+    if set(obj) == {"type", "value"} and obj["type"] in CURSOR_TYPES:
+        _, from_str = CURSOR_TYPES[obj["type"]]
+        return from_str(obj["value"])
+    return obj
+
+
+def encode_cursor(values) -> str:
+    """Encode values of the last fetched row into an opaque pagination cursor."""
+    data = json.dumps(list(values), default=_encode_cursor_value, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode()
+
+
+def decode_cursor(cursor: str):
+    """Decode a pagination cursor created by encode_cursor."""
+    try:
+        data = base64.urlsafe_b64decode(cursor.encode()).decode()
+        return json.loads(data, object_hook=_decode_cursor_value)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
@@ -0,0 +1,87 @@
+import pytest
+from sqlalchemy import inspect
+
+
+@pytest.fixture()
+def bulk_create_data():
+    return [
+        {"name": "first", "number": 1},
+        {"name": "second", "number": 2, "is_valid": True},
+        {"name": "third", "number": 3},
+    ]
+
+
+def test_bulk_create__ok(
+    db_session,
+    item_sql_query_manager,
+    bulk_create_data,
+):
+    created_objs = item_sql_query_manager.query_manager.bulk_create(
+        bulk_create_data,
+        batch_size=2,
+    )
+
+    assert [obj.name for obj in created_objs] == ["first", "second", "third"]
+    assert [obj.is_valid for obj in created_objs] == [False, True, False]
+
+    for created_obj in created_objs:
+        assert created_obj.id is not None
+        assert created_obj.created_at is not None
+        assert inspect(created_obj).detached
+
+    assert item_sql_query_manager.query_manager.count() == 3
+
+
+def test_bulk_create__return_objects__false__ok(
+    db_session,
+    item_sql_query_manager,
+    bulk_create_data,
+):
+    created_count = item_sql_query_manager.query_manager.bulk_create(
+        bulk_create_data,
+        return_objects=False,
+    )
+
+    assert created_count == 3
+    assert item_sql_query_manager.query_manager.count() == 3
+
+
+def test_bulk_create__empty__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    assert item_sql_query_manager.query_manager.bulk_create([]) == []
+
+
+@pytest.mark.asyncio
+async def test_async_bulk_create__ok(
+    db_session,
+    async_item_sql_query_manager,
+    bulk_create_data,
+):
+    created_objs = await async_item_sql_query_manager.query_manager.bulk_create(
+        bulk_create_data,
+        batch_size=2,
+    )
+
+    assert [obj.name for obj in created_objs] == ["first", "second", "third"]
+
+    for created_obj in created_objs:
+        assert created_obj.id is not None
+
+    assert await async_item_sql_query_manager.query_manager.count() == 3
+
+
+@pytest.mark.asyncio
+async def test_async_bulk_create__return_objects__false__ok(
+    db_session,
+    async_item_sql_query_manager,
+    bulk_create_data,
+):
+    created_count = await async_item_sql_query_manager.query_manager.bulk_create(
+        bulk_create_data,
+        return_objects=False,
+    )
+
+    assert created_count == 3
+    assert await async_item_sql_query_manager.query_manager.count() == 3
@@ -0,0 +1,88 @@
+import pytest
+
+from tests import models_factory
+
+
+def test_bulk_update__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=5)
+
+    data = [{"id": item.id, "name": f"name_{item.id}"} for item in items]
+    data[0]["number"] = 999
+
+    updated_objs = item_sql_query_manager.query_manager.bulk_update(
+        data,
+        batch_size=2,
+    )
+
+    assert sorted(obj.id for obj in updated_objs) == sorted(item.id for item in items)
+
+    for updated_obj in updated_objs:
+        assert updated_obj.name == f"name_{updated_obj.id}"
+
+    updated_item = item_sql_query_manager.query_manager.get(id=items[0].id)
+    assert updated_item.number == 999
+
+    not_updated_item = item_sql_query_manager.query_manager.get(id=items[1].id)
+    assert not_updated_item.number == items[1].number
+
+
+def test_bulk_update__key_fields__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create(name="unique_name")
+    other_item = models_factory.ItemFactory.create()
+
+    updated_objs = item_sql_query_manager.query_manager.bulk_update(
+        [{"name": "unique_name", "number": 999}],
+        key_fields=["name"],
+    )
+
+    assert [obj.id for obj in updated_objs] == [item.id]
+    assert updated_objs[0].number == 999
+
+    not_updated_item = item_sql_query_manager.query_manager.get(id=other_item.id)
+    assert not_updated_item.number == other_item.number
+
+
+def test_bulk_update__return_objects__false__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=3)
+
+    rows_count = item_sql_query_manager.query_manager.bulk_update(
+        [{"id": item.id, "number": 999} for item in items] + [{"number": 1}],
+        return_objects=False,
+    )
+
+    assert rows_count == 3
+    assert item_sql_query_manager.query_manager.where(number=999).count() == 3
+
+
+def test_bulk_update__empty__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    assert item_sql_query_manager.query_manager.bulk_update([]) == []
+
+
+@pytest.mark.asyncio
+async def test_async_bulk_update__ok(
+    db_session,
+    async_item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=3)
+
+    updated_objs = await async_item_sql_query_manager.query_manager.bulk_update(
+        [{"id": item.id, "name": f"name_{item.id}"} for item in items],
+        batch_size=2,
+    )
+
+    assert sorted(obj.id for obj in updated_objs) == sorted(item.id for item in items)
+
+    for updated_obj in updated_objs:
+        assert updated_obj.name == f"name_{updated_obj.id}"
@@ -1,5 +1,11 @@
+from unittest import mock
+
 import pytest
+import sqlalchemy as sa
+from sqlalchemy import text
+from sqlalchemy.orm import Session, registry, relationship
 
+from sqlalchemy_query_manager.core.base import QueryManager
 from tests import models_factory
 
 
@@ -28,3 +34,275 @@ async def test_async_count__ok(
     count = await async_item_sql_query_manager.query_manager.count()
 
     assert count == expected_count
+
+
+def get_count_sql(query_manager):
+    statement, _ = query_manager._get_count_statement()
+    return str(statement)
+
+
+def test_count__no_subquery__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    models_factory.ItemFactory.create_batch(size=3, is_valid=True)
+    models_factory.ItemFactory.create(is_valid=False)
+
+    query_manager = item_sql_query_manager.query_manager.where(is_valid=True).order_by(
+        "-id"
+    )
+
+    count_sql = get_count_sql(query_manager)
+
+    assert "ORDER BY" not in count_sql
+    assert count_sql.count("SELECT") == 1
+    assert query_manager.count() == 3
+
+
+def test_count__left_join__pruned(
+    db_session,
+    item_sql_query_manager,
+):
+    models_factory.ItemFactory.create(group=models_factory.GroupFactory.create())
+    models_factory.ItemFactory.create()
+
+    query_manager = item_sql_query_manager.query_manager.left_join("group__owner")
+
+    assert "JOIN" not in get_count_sql(query_manager)
+    assert query_manager.count() == len(query_manager.all()) == 2
+
+
+def test_count__joins__kept(
+    db_session,
+    item_sql_query_manager,
+):
+    group = models_factory.GroupFactory.create(name="group")
+    models_factory.ItemFactory.create_batch(size=2, group=group)
+    models_factory.ItemFactory.create(
+        group=models_factory.GroupFactory.create(name="other group")
+    )
+    models_factory.ItemFactory.create()
+
+    # Filters use the joined model
+    query_manager = item_sql_query_manager.query_manager.left_join("group").where(
+        group__name="group"
+    )
+
+    assert "JOIN" in get_count_sql(query_manager)
+    assert query_manager.count() == 2
+
+    # INNER JOIN by a nullable foreign key filters out items without a group
+    query_manager = item_sql_query_manager.query_manager.order_by("group__name")
+
+    assert "ORDER BY" not in get_count_sql(query_manager)
+    assert query_manager.count() == len(query_manager.all()) == 3
+
+    query_manager = item_sql_query_manager.query_manager.join("group__owner")
+
+    assert query_manager.count() == len(query_manager.all()) == 3
+
+
+def test_count__join_chain__sqlite__ok():
+    metadata = sa.MetaData()
+    a_table = sa.Table(
+        "a",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("b_id", sa.ForeignKey("b.id"), nullable=False),
+    )
+    b_table = sa.Table("b", metadata, sa.Column("id", sa.Integer, primary_key=True))
+    c_table = sa.Table(
+        "c",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("b_id", sa.ForeignKey("b.id")),
+    )
+
+    class A:
+        pass
+
+    class B:
+        pass
+
+    class C:
+        pass
+
+    mapper_registry = registry()
+    mapper_registry.map_imperatively(C, c_table)
+    mapper_registry.map_imperatively(B, b_table, properties={"cs": relationship(C)})
+    mapper_registry.map_imperatively(A, a_table, properties={"b": relationship(B)})
+
+    engine = sa.create_engine("sqlite://")
+    metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.execute(b_table.insert(), [{"id": 1}, {"id": 2}])
+        session.execute(a_table.insert(), [{"id": 1, "b_id": 1}, {"id": 2, "b_id": 2}])
+        session.execute(
+            c_table.insert(),
+            [{"id": 1, "b_id": 1}, {"id": 2, "b_id": 1}, {"id": 3, "b_id": 2}],
+        )
+
+        # The many-to-one join to b leads to the one-to-many join to c
+        query_manager = QueryManager(model=A, session=session).left_join("b__cs")
+
+        assert query_manager.count() == len(query_manager.all()) == 3
+
+
+def test_count__limit_offset_distinct__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    models_factory.ItemFactory.create_batch(size=3, name="name")
+    models_factory.ItemFactory.create(name="other name")
+
+    query_manager = item_sql_query_manager.query_manager.order_by("id")
+
+    assert query_manager.offset(1).limit(2).count() == 2
+    assert query_manager.offset(3).limit(2).count() == 1
+    assert query_manager.only("name").distinct().count() == 2
+
+
+def test_count__statement_cache__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    models_factory.ItemFactory.create_batch(size=2, is_valid=True)
+
+    query_manager = item_sql_query_manager.query_manager
+    query_manager.cache_clear()
+
+    assert query_manager.where(is_valid=True).count() == 2
+    assert query_manager.where(is_valid=False).count() == 0
+
+    cache_info = query_manager.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_async_count__filters__ok(
+    db_session,
+    async_item_sql_query_manager,
+):
+    group = models_factory.GroupFactory.create()
+    models_factory.ItemFactory.create_batch(size=2, group=group)
+    models_factory.ItemFactory.create()
+
+    query_manager = async_item_sql_query_manager.query_manager.left_join("group")
+
+    assert await query_manager.where(group__id=group.id).count() == 2
+    assert await query_manager.limit(1).count() == 1
+
+
+def test_count__estimate__not_analyzed__exact(
+    db_session,
+    item_sql_query_manager,
+):
+    models_factory.ItemFactory.create_batch(size=6)
+
+    # The table has no statistics, the planner would guess the number of rows
+    assert item_sql_query_manager.query_manager.count(estimate=True) == 6
+
+
+@pytest.mark.asyncio
+async def test_async_count__estimate__not_analyzed__exact(
+    db_session,
+    async_item_sql_query_manager,
+):
+    models_factory.ItemFactory.create_batch(size=6)
+
+    assert await async_item_sql_query_manager.query_manager.count(estimate=True) == 6
+
+
+@pytest.fixture
+def analyze_items(db_session):
+    def analyze():
+        db_session.execute(text("ANALYZE item"))
+        db_session.commit()
+
+    return analyze
+
+
+def test_count__estimate__ok(
+    db_session,
+    item_sql_query_manager,
+    analyze_items,
+):
+    models_factory.ItemFactory.create_batch(size=5, is_valid=True)
+    analyze_items()
+
+    query_manager = item_sql_query_manager.query_manager
+
+    assert query_manager.count(estimate=True) == 5
+
+    # Filtered queries are estimated with EXPLAIN
+    with mock.patch.object(
+        Session, "execute", autospec=True, side_effect=Session.execute
+    ) as execute_mock:
+        estimated_count = query_manager.where(is_valid=True).count(estimate=True)
+
+    assert estimated_count == 5
+    assert str(execute_mock.call_args.args[1]).startswith("EXPLAIN")
+
+
+def test_count__exact_below__ok(
+    db_session,
+    item_sql_query_manager,
+    analyze_items,
+):
+    models_factory.ItemFactory.create_batch(size=5)
+
+    query_manager = item_sql_query_manager.query_manager.order_by("id")
+
+    assert query_manager.count(exact_below=10) == 5
+    assert query_manager.count(exact_below=3) == 4
+    assert query_manager.offset(1).limit(3).count(exact_below=2) == 3
+
+    analyze_items()
+
+    assert query_manager.count(estimate=True, exact_below=10) == 5
+    assert query_manager.count(estimate=True, exact_below=2) == 5
+
+
+def test_count__estimate__sqlite__ok():
+    metadata = sa.MetaData()
+    table = sa.Table("record", metadata, sa.Column("id", sa.Integer, primary_key=True))
+
+    class Record:
+        pass
+
+    registry().map_imperatively(Record, table)
+
+    engine = sa.create_engine("sqlite://")
+    metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.execute(table.insert(), [{"id": record_id} for record_id in range(3)])
+
+        query_manager = QueryManager(model=Record, session=session)
+
+        # There are no statistics before ANALYZE
+        assert query_manager.count(estimate=True) == 3
+
+        session.execute(table.insert(), [{"id": 3}])
+        session.execute(text("ANALYZE"))
+        session.execute(table.insert(), [{"id": 4}])
+
+        assert query_manager.count(estimate=True) == 4
+        assert query_manager.count() == 5
+
+
+@pytest.mark.asyncio
+async def test_async_count__estimate__ok(
+    db_session,
+    async_item_sql_query_manager,
+    analyze_items,
+):
+    models_factory.ItemFactory.create_batch(size=3, is_valid=True)
+    analyze_items()
+
+    query_manager = async_item_sql_query_manager.query_manager
+
+    assert await query_manager.count(estimate=True) == 3
+    assert await query_manager.where(is_valid=True).count(estimate=True) == 3
+    assert await query_manager.count(exact_below=1) == 2
@@ -0,0 +1,151 @@
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.dialects import postgresql
+
+from sqlalchemy_query_manager.core.base import DetachStrategy, ModelQueryManagerMixin
+from tests import models_factory
+from tests.models import Item
+
+
+def get_selected_columns(query_manager):
+    query = query_manager.query.compile(dialect=postgresql.dialect())
+    return str(query).split("FROM")[0]
+
+
+def test_defer__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    query_manager = item_sql_query_manager.query_manager.defer("name", "number")
+
+    assert "item.name" not in get_selected_columns(query_manager)
+
+    returned_objs = query_manager.all()
+
+    assert isinstance(returned_objs[0], item_sql_query_manager)
+    assert returned_objs[0].id == item.id
+    assert returned_objs[0].is_valid == item.is_valid
+    assert {"name", "number"} <= inspect(returned_objs[0]).unloaded
+
+
+def test_defer__undefer__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    returned_obj = (
+        item_sql_query_manager.query_manager.defer("name", "number")
+        .undefer("name")
+        .get(id=item.id)
+    )
+
+    assert returned_obj.name == item.name
+    assert "number" in inspect(returned_obj).unloaded
+
+
+def test_load_only__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    query_manager = item_sql_query_manager.query_manager.load_only("name").load_only(
+        "number"
+    )
+
+    assert get_selected_columns(query_manager).split() == [
+        "SELECT",
+        "item.id,",
+        "item.name,",
+        "item.number",
+    ]
+
+    returned_obj = query_manager.first()
+
+    assert (returned_obj.id, returned_obj.name, returned_obj.number) == (
+        item.id,
+        item.name,
+        item.number,
+    )
+    assert {"is_valid", "group_id", "created_at"} <= inspect(returned_obj).unloaded
+
+
+def test_defer__relationship__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    group = models_factory.GroupFactory.create()
+    models_factory.ItemFactory.create(group=group)
+
+    returned_obj = (
+        item_sql_query_manager.query_manager.select_related("group__owner")
+        .defer("group__name")
+        .load_only("group__owner__first_name")
+        .first()
+    )
+
+    assert returned_obj.group.id == group.id
+    assert "name" in inspect(returned_obj.group).unloaded
+    assert returned_obj.group.owner.first_name == group.owner.first_name
+    assert "last_name" in inspect(returned_obj.group.owner).unloaded
+
+
+def test_defer__error(
+    item_sql_query_manager,
+):
+    with pytest.raises(ValueError):
+        item_sql_query_manager.query_manager.defer("unknown")
+
+    with pytest.raises(ValueError):
+        item_sql_query_manager.query_manager.load_only("unknown__name")
+
+    with pytest.raises(ValueError):
+        # Hybrid properties are not columns
+        item_sql_query_manager.query_manager.undefer("has_name")
+
+
+def test_defer__detached_strategy__ok(
+    db_session,
+    sync_db_sessionmaker,
+):
+    item = models_factory.ItemFactory.create()
+
+    class InjectedItem(Item, ModelQueryManagerMixin):
+        class QueryManagerConfig:
+            session = sync_db_sessionmaker
+            detach_strategy = DetachStrategy.ROWS
+
+    returned_rows = InjectedItem.query_manager.load_only("name").all()
+
+    assert [row._asdict() for row in returned_rows] == [
+        {"id": item.id, "name": item.name}
+    ]
+
+    returned_rows = InjectedItem.query_manager.defer("name", "created_at").all()
+
+    assert [row._asdict() for row in returned_rows] == [
+        {
+            "id": item.id,
+            "number": item.number,
+            "is_valid": item.is_valid,
+            "group_id": None,
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_defer__async__ok(
+    db_session,
+    async_item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    returned_objs = await async_item_sql_query_manager.query_manager.load_only(
+        "name"
+    ).all()
+
+    assert [obj.name for obj in returned_objs] == [item.name]
+    assert "number" in inspect(returned_objs[0]).unloaded
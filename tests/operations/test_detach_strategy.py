@@ -0,0 +1,187 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.engine import Row
+
+from sqlalchemy_query_manager.core.base import (
+    AsyncModelQueryManagerMixin,
+    DetachStrategy,
+    ModelQueryManagerMixin,
+)
+from tests import models_factory
+from tests.models import Item
+
+
+@pytest.fixture
+def long_lived_session(db_session):
+    @contextmanager
+    def session_scope():
+        # The session stays open after an operation, like a session of a batch job
+        yield db_session
+
+    return session_scope
+
+
+def get_injected_item(session, detach_strategy):
+    class InjectedItem(Item, ModelQueryManagerMixin):
+        class QueryManagerConfig:
+            pass
+
+    InjectedItem.QueryManagerConfig.session = session
+    InjectedItem.QueryManagerConfig.detach_strategy = detach_strategy
+
+    return InjectedItem
+
+
+def test_detach_strategy__expunge__only_returned_objects(
+    db_session,
+    long_lived_session,
+):
+    item, other_item = models_factory.ItemFactory.create_batch(size=2)
+
+    injected_item = get_injected_item(long_lived_session, DetachStrategy.EXPUNGE)
+
+    loaded_other_item = db_session.get(injected_item, other_item.id)
+
+    returned_objs = injected_item.query_manager.where(id=item.id).all()
+
+    assert [obj.id for obj in returned_objs] == [item.id]
+    assert inspect(returned_objs[0]).detached
+    assert loaded_other_item in db_session
+
+
+def test_detach_strategy__expunge_all__ok(
+    db_session,
+    long_lived_session,
+):
+    item, other_item = models_factory.ItemFactory.create_batch(size=2)
+
+    injected_item = get_injected_item(long_lived_session, DetachStrategy.EXPUNGE_ALL)
+
+    loaded_other_item = db_session.get(injected_item, other_item.id)
+
+    returned_objs = injected_item.query_manager.where(id=item.id).all()
+
+    assert inspect(returned_objs[0]).detached
+    assert loaded_other_item not in db_session
+
+
+def test_detach_strategy__detached__not_added_to_session(
+    db_session,
+    long_lived_session,
+):
+    items = models_factory.ItemFactory.create_batch(size=3)
+
+    injected_item = get_injected_item(long_lived_session, DetachStrategy.DETACHED)
+
+    returned_objs = injected_item.query_manager.order_by("id").all()
+
+    assert [obj.as_dict() for obj in returned_objs] == [
+        item.as_dict() for item in items
+    ]
+    for returned_obj in returned_objs:
+        assert isinstance(returned_obj, injected_item)
+        assert inspect(returned_obj).detached
+        assert inspect(returned_obj).identity == (returned_obj.id,)
+
+    assert len(db_session.identity_map) == 0
+
+    returned_obj = injected_item.query_manager.where(id=items[1].id).first()
+    assert inspect(returned_obj).detached
+    assert returned_obj.id == items[1].id
+
+    returned_obj = injected_item.query_manager.get(id=items[2].id)
+    assert inspect(returned_obj).detached
+    assert returned_obj.id == items[2].id
+
+    assert [obj.id for obj in injected_item.query_manager.iterator(chunk_size=2)]
+
+    returned_objs, _ = injected_item.query_manager.paginate_after(page_size=2)
+    assert [obj.id for obj in returned_objs] == [item.id for item in items[:2]]
+
+    assert len(db_session.identity_map) == 0
+
+
+def test_detach_strategy__detached__merge__ok(
+    db_session,
+    sync_db_sessionmaker,
+):
+    item = models_factory.ItemFactory.create(name="name")
+
+    injected_item = get_injected_item(sync_db_sessionmaker, DetachStrategy.DETACHED)
+
+    returned_obj = injected_item.query_manager.get(id=item.id)
+    returned_obj.name = "updated"
+
+    with sync_db_sessionmaker() as session:
+        session.merge(returned_obj)
+        session.commit()
+
+    assert injected_item.query_manager.get(id=item.id).name == "updated"
+
+
+def test_detach_strategy__rows__ok(
+    db_session,
+    sync_db_sessionmaker,
+):
+    items = models_factory.ItemFactory.create_batch(size=2)
+
+    injected_item = get_injected_item(sync_db_sessionmaker, DetachStrategy.ROWS)
+
+    returned_rows = injected_item.query_manager.order_by("id").all()
+
+    assert all(isinstance(row, Row) for row in returned_rows)
+    assert [row._asdict() for row in returned_rows] == [
+        item.as_dict() for item in items
+    ]
+
+    returned_row = injected_item.query_manager.get(id=items[0].id)
+
+    assert returned_row.id == items[0].id
+    assert returned_row.name == items[0].name
+
+    # Selected fields are not changed by the strategy
+    returned_rows = injected_item.query_manager.only("id").order_by("id").all()
+
+    assert [row.id for row in returned_rows] == [item.id for item in items]
+
+
+@pytest.mark.asyncio
+async def test_detach_strategy__async__rows__ok(
+    db_session,
+    async_db_sessionmaker,
+):
+    items = models_factory.ItemFactory.create_batch(size=2)
+
+    class InjectedItem(Item, AsyncModelQueryManagerMixin):
+        class QueryManagerConfig:
+            session = async_db_sessionmaker
+            detach_strategy = DetachStrategy.ROWS
+
+    returned_rows = await InjectedItem.query_manager.order_by("id").all()
+
+    assert [row.id for row in returned_rows] == [item.id for item in items]
+
+    returned_row = await InjectedItem.query_manager.first()
+
+    assert isinstance(returned_row, Row)
+
+
+def test_passed_session__expunge__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    query_manager = item_sql_query_manager.query_manager.where(id=item.id)
+
+    # Objects stay in a session passed by the caller by default
+    returned_obj = query_manager.first(session=db_session)
+    assert returned_obj in db_session
+
+    returned_obj = query_manager.first(session=db_session, expunge=True)
+    assert inspect(returned_obj).detached
+
+    returned_objs = list(query_manager.iterator(session=db_session, expunge=True))
+    assert all(inspect(obj).detached for obj in returned_objs)
@@ -0,0 +1,212 @@
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.orm import relationship
+
+from sqlalchemy_query_manager.core.base import (
+    AsyncModelQueryManagerMixin,
+    AsyncQueryManager,
+    ModelQueryManagerMixin,
+    QueryManager,
+)
+from tests import models_factory
+from tests.models import Group, Item
+
+
+class GroupWithItems(Group, ModelQueryManagerMixin):
+    group_items = relationship(Item, viewonly=True, order_by=Item.id)
+
+    class QueryManagerConfig:
+        pass
+
+
+class AsyncGroupWithItems(Group, AsyncModelQueryManagerMixin):
+    group_items = relationship(Item, viewonly=True, order_by=Item.id)
+
+    class QueryManagerConfig:
+        pass
+
+
+@pytest.fixture
+def group_query_manager(sync_db_sessionmaker):
+    GroupWithItems.QueryManagerConfig.session = sync_db_sessionmaker
+    return GroupWithItems.query_manager
+
+
+@pytest.fixture
+def async_group_query_manager(async_db_sessionmaker):
+    AsyncGroupWithItems.QueryManagerConfig.session = async_db_sessionmaker
+    return AsyncGroupWithItems.query_manager
+
+
+def create_groups_with_items():
+    groups = models_factory.GroupFactory.create_batch(size=2)
+    items = [
+        models_factory.ItemFactory.create(group=group, is_valid=is_valid)
+        for group in groups
+        for is_valid in (True, False)
+    ]
+    return groups, items
+
+
+def test_select_related__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    group = models_factory.GroupFactory.create()
+    item = models_factory.ItemFactory.create(group=group)
+    item_without_group = models_factory.ItemFactory.create()
+
+    returned_objs = (
+        item_sql_query_manager.query_manager.select_related("group__owner")
+        .order_by("id")
+        .all()
+    )
+
+    assert inspect(returned_objs[0]).detached
+    # Relationships are loaded, so they are available after expunge
+    assert returned_objs[0].group.name == group.name
+    assert returned_objs[0].group.owner.first_name == group.owner.first_name
+    assert returned_objs[1].id == item_without_group.id
+    assert returned_objs[1].group is None
+
+    returned_obj = item_sql_query_manager.query_manager.select_related("group").get(
+        id=item.id
+    )
+
+    assert returned_obj.group.name == group.name
+
+
+def test_select_related__filters__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create(
+        group=models_factory.GroupFactory.create(name="group")
+    )
+    models_factory.ItemFactory.create(
+        group=models_factory.GroupFactory.create(name="other group")
+    )
+
+    returned_objs = (
+        item_sql_query_manager.query_manager.select_related("group")
+        .where(group__name="group")
+        .all()
+    )
+
+    assert [obj.id for obj in returned_objs] == [item.id]
+    assert returned_objs[0].group.name == "group"
+
+
+def test_select_related__error(
+    item_sql_query_manager,
+    group_query_manager,
+):
+    with pytest.raises(ValueError):
+        item_sql_query_manager.query_manager.select_related("unknown")
+
+    with pytest.raises(ValueError):
+        # Dynamic relationships can't be loaded
+        item_sql_query_manager.query_manager.select_related("group__items")
+
+    with pytest.raises(ValueError):
+        group_query_manager.select_related("group_items")
+
+
+def test_prefetch_related__ok(
+    db_session,
+    group_query_manager,
+):
+    groups, items = create_groups_with_items()
+
+    returned_objs = (
+        group_query_manager.prefetch_related("group_items").order_by("id").all()
+    )
+
+    assert inspect(returned_objs[0]).detached
+    assert [[item.id for item in obj.group_items] for obj in returned_objs] == [
+        [items[0].id, items[1].id],
+        [items[2].id, items[3].id],
+    ]
+
+
+def test_prefetch_related__query_manager__ok(
+    db_session,
+    group_query_manager,
+):
+    groups, items = create_groups_with_items()
+    group_without_items = models_factory.GroupFactory.create()
+
+    returned_objs = (
+        group_query_manager.prefetch_related(
+            "group_items",
+            query_manager=QueryManager(model=Item).where(is_valid=True).order_by("-id"),
+        )
+        .order_by("id")
+        .all()
+    )
+
+    assert [[item.id for item in obj.group_items] for obj in returned_objs] == [
+        [items[0].id],
+        [items[2].id],
+        [],
+    ]
+    assert returned_objs[2].id == group_without_items.id
+
+
+def test_prefetch_related__query_manager__many_to_one__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    group = models_factory.GroupFactory.create()
+    item = models_factory.ItemFactory.create(group=group)
+    item_without_group = models_factory.ItemFactory.create()
+
+    query_manager = item_sql_query_manager.query_manager.prefetch_related(
+        "group", query_manager=QueryManager(model=Group)
+    )
+
+    returned_objs = query_manager.order_by("id").all()
+
+    assert returned_objs[0].group.id == group.id
+    assert returned_objs[1].group is None
+
+    assert query_manager.get(id=item.id).group.id == group.id
+    returned_objs = query_manager.in_bulk([item_without_group.id])
+    assert returned_objs[item_without_group.id].group is None
+
+
+def test_prefetch_related__query_manager__error(
+    item_sql_query_manager,
+):
+    with pytest.raises(ValueError):
+        item_sql_query_manager.query_manager.prefetch_related(
+            "group__owner", query_manager=QueryManager(model=Group)
+        )
+
+
+@pytest.mark.asyncio
+async def test_eager_loading__async__ok(
+    db_session,
+    async_group_query_manager,
+):
+    groups, items = create_groups_with_items()
+
+    returned_objs = (
+        await async_group_query_manager.select_related("owner")
+        .prefetch_related("group_items")
+        .order_by("id")
+        .all()
+    )
+
+    assert returned_objs[0].owner.first_name == groups[0].owner.first_name
+    assert [item.id for item in returned_objs[0].group_items] == [
+        items[0].id,
+        items[1].id,
+    ]
+
+    returned_obj = await async_group_query_manager.prefetch_related(
+        "group_items",
+        query_manager=AsyncQueryManager(model=Item).where(is_valid=False),
+    ).get(id=groups[1].id)
+
+    assert [item.id for item in returned_obj.group_items] == [items[3].id]
@@ -0,0 +1,148 @@
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import Session, registry, relationship
+
+from sqlalchemy_query_manager.core.base import QueryManager
+from tests import models_factory
+
+
+def test_exists__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create(name="name")
+
+    query_manager = item_sql_query_manager.query_manager
+
+    assert query_manager.exists()
+    assert query_manager.where(name="name").exists()
+    assert not query_manager.where(name="other name").exists()
+    assert query_manager.exists(id=item.id)
+    assert not query_manager.where(name="name").exists(id=-1)
+
+    exists_sql = str(query_manager.where(name="name")._get_exists_statement()[0])
+
+    assert "EXISTS" in exists_sql
+    assert "LIMIT" in exists_sql
+    assert "ORDER BY" not in exists_sql
+
+
+def test_exists__foreign_key__join(
+    db_session,
+    item_sql_query_manager,
+):
+    models_factory.ItemFactory.create(
+        group=models_factory.GroupFactory.create(name="group")
+    )
+    models_factory.GroupFactory.create(name="group without items")
+
+    query_manager = item_sql_query_manager.query_manager
+
+    exists_sql = str(
+        query_manager.where(group__name="group")._get_exists_statement()[0]
+    )
+
+    # Filters on relationships join models instead of a cross join
+    assert "JOIN" in exists_sql
+
+    assert query_manager.where(group__name="group").exists()
+    assert not query_manager.exists(group__name="group without items")
+    assert query_manager.left_join("group__owner").order_by("group__name").exists()
+
+
+def test_exists__join_chain__sqlite__ok():
+    metadata = sa.MetaData()
+    a_table = sa.Table(
+        "a",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("b_id", sa.ForeignKey("b.id"), nullable=False),
+    )
+    b_table = sa.Table("b", metadata, sa.Column("id", sa.Integer, primary_key=True))
+    c_table = sa.Table(
+        "c",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("b_id", sa.ForeignKey("b.id")),
+        sa.Column("name", sa.String),
+    )
+
+    class A:
+        pass
+
+    class B:
+        pass
+
+    class C:
+        pass
+
+    mapper_registry = registry()
+    mapper_registry.map_imperatively(C, c_table)
+    mapper_registry.map_imperatively(B, b_table, properties={"cs": relationship(C)})
+    mapper_registry.map_imperatively(A, a_table, properties={"b": relationship(B)})
+
+    engine = sa.create_engine("sqlite://")
+    metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.execute(b_table.insert(), [{"id": 1}])
+        session.execute(a_table.insert(), [{"id": 1, "b_id": 1}])
+        session.execute(c_table.insert(), [{"id": 1, "b_id": 1, "name": "name"}])
+
+        query_manager = QueryManager(model=A, session=session).left_join("b__cs")
+
+        assert query_manager.exists()
+        assert query_manager.where(b__cs__name="name").exists()
+        assert not query_manager.where(b__cs__name="other name").exists()
+
+
+def test_exists__offset__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    models_factory.ItemFactory.create_batch(size=2)
+
+    query_manager = item_sql_query_manager.query_manager.order_by("id")
+
+    assert query_manager.offset(1).limit(5).exists()
+    assert not query_manager.offset(2).exists()
+
+
+def test_exists_many__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=3, is_valid=True)
+    invalid_item = models_factory.ItemFactory.create(name="name", is_valid=False)
+
+    query_manager = item_sql_query_manager.query_manager.order_by("-number")
+
+    assert query_manager.exists_many(
+        [items[0].id, items[2].id, invalid_item.id, -1, items[0].id]
+    ) == {items[0].id, items[2].id, invalid_item.id}
+    assert query_manager.where(is_valid=True).exists_many(
+        [items[0].id, invalid_item.id]
+    ) == {items[0].id}
+    assert query_manager.exists_many(["name", "other name"], field="name") == {"name"}
+    assert query_manager.exists_many([]) == set()
+
+    # Keys don't replace a filter on the same field
+    assert query_manager.where(id__in=[items[0].id]).exists_many(
+        [item.id for item in items], field="id"
+    ) == {items[0].id}
+
+
+@pytest.mark.asyncio
+async def test_exists__async__ok(
+    db_session,
+    async_item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create(
+        group=models_factory.GroupFactory.create(name="group")
+    )
+
+    query_manager = async_item_sql_query_manager.query_manager
+
+    assert await query_manager.exists(group__name="group")
+    assert not await query_manager.where(group__name="other group").exists()
+    assert await query_manager.exists_many([item.id, -1]) == {item.id}
@@ -1,4 +1,5 @@
 import pytest
+from sqlalchemy import event, inspect
 
 from tests import models_factory
 
@@ -31,6 +32,96 @@ def test_get_object__multiple_filters__ok(
     assert returned_obj.id == item.id
 
 
+def test_get_object__primary_key__identity_map(
+    db_session,
+    sync_db_engine,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(sync_db_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        loaded_obj = item_sql_query_manager.query_manager.get(
+            id=item.id, session=db_session
+        )
+        assert len(statements) == 1
+
+        # The object is taken from the identity map of the session
+        returned_obj = item_sql_query_manager.query_manager.get(
+            id=item.id, session=db_session
+        )
+        assert len(statements) == 1
+    finally:
+        event.remove(sync_db_engine, "before_cursor_execute", before_cursor_execute)
+
+    assert returned_obj is loaded_obj
+
+
+def test_get_object__primary_key__detached(
+    db_session,
+    sync_db_engine,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    returned_obj = item_sql_query_manager.query_manager.get(id=item.id)
+
+    assert returned_obj.as_dict() == item.as_dict()
+    assert inspect(returned_obj).detached
+
+
+def test_get_object__not_found__ok(
+    db_session,
+    sync_db_engine,
+    item_sql_query_manager,
+):
+    models_factory.ItemFactory.create()
+
+    assert item_sql_query_manager.query_manager.get(id=-1) is None
+    assert item_sql_query_manager.query_manager.get(name="missing") is None
+
+
+def test_get_object__statement_cached__ok(
+    db_session,
+    sync_db_engine,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=2)
+
+    query_manager = item_sql_query_manager.query_manager
+    query_manager.cache_clear()
+
+    for item in items:
+        assert query_manager.get(name=item.name, number=item.number).id == item.id
+
+    assert query_manager.cache_info().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_async_get_object__primary_key__identity_map(
+    db_session,
+    sync_db_engine,
+    async_db_sessionmaker,
+    async_item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    async with async_db_sessionmaker() as session:
+        loaded_obj = await async_item_sql_query_manager.query_manager.get(
+            id=item.id, session=session
+        )
+        returned_obj = await async_item_sql_query_manager.query_manager.get(
+            id=item.id, session=session
+        )
+
+    assert returned_obj is loaded_obj
+
+
 @pytest.mark.asyncio
 async def test_async_get_object__ok(
     db_session,
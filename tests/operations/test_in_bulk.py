@@ -0,0 +1,124 @@
+from unittest import mock
+
+import pytest
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import Session
+
+from sqlalchemy_query_manager.core.base import AsyncQueryManager
+from tests import models_factory
+
+
+def test_in_bulk__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=3)
+
+    returned_objs = item_sql_query_manager.query_manager.in_bulk(
+        [items[0].id, items[2].id, items[0].id, -1]
+    )
+
+    assert list(returned_objs) == [items[0].id, items[2].id]
+    assert returned_objs[items[0].id].name == items[0].name
+    assert returned_objs[items[2].id].name == items[2].name
+
+
+def test_in_bulk__empty__ok(
+    item_sql_query_manager,
+):
+    assert item_sql_query_manager.query_manager.in_bulk([]) == {}
+
+
+def test_in_bulk__field_and_filters__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create(name="name", is_valid=True)
+    models_factory.ItemFactory.create(name="other name", is_valid=False)
+
+    returned_objs = item_sql_query_manager.query_manager.where(is_valid=True).in_bulk(
+        ["name", "other name"], field="name"
+    )
+
+    assert list(returned_objs) == ["name"]
+    assert returned_objs["name"].id == item.id
+
+
+def test_in_bulk__chunks__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=5)
+
+    query_manager = item_sql_query_manager.query_manager
+
+    with mock.patch.object(
+        Session, "execute", autospec=True, side_effect=Session.execute
+    ) as execute_mock:
+        returned_objs = query_manager.in_bulk([item.id for item in items], chunk_size=2)
+
+    assert execute_mock.call_count == 3
+    assert sorted(returned_objs) == [item.id for item in items]
+    # The statement doesn't depend on the number of keys
+    assert len({str(call.args[1]) for call in execute_mock.call_args_list}) == 1
+
+
+def test_in_bulk__padded_chunks__ok(
+    item_sql_query_manager,
+):
+    query_manager = item_sql_query_manager.query_manager
+
+    chunks = [
+        params["qm_keys"]
+        for _, params in query_manager._get_in_bulk_statements(
+            sqlite.dialect(), "id", [1, 2, 3, 4, 5, 6, 7], chunk_size=4
+        )
+    ]
+
+    assert chunks == [[1, 2, 3, 4], [5, 6, 7, 7]]
+
+    chunks = [
+        params["qm_keys"]
+        for _, params in query_manager._get_in_bulk_statements(
+            sqlite.dialect(), "id", [1, 2, 3], chunk_size=100
+        )
+    ]
+
+    assert chunks == [[1, 2, 3, 3]]
+
+
+@pytest.mark.asyncio
+async def test_in_bulk__async__ok(
+    db_session,
+    async_item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=3)
+
+    returned_objs = await async_item_sql_query_manager.query_manager.in_bulk(
+        [item.id for item in items]
+    )
+
+    assert sorted(returned_objs) == [item.id for item in items]
+
+
+@pytest.mark.asyncio
+async def test_in_bulk__async__concurrent_chunks__ok(
+    db_session,
+    async_item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=5)
+
+    query_manager = async_item_sql_query_manager.query_manager
+
+    with mock.patch.object(
+        AsyncQueryManager,
+        "_in_bulk",
+        autospec=True,
+        side_effect=AsyncQueryManager._in_bulk,
+    ) as in_bulk_mock:
+        returned_objs = await query_manager.in_bulk(
+            [item.id for item in items], chunk_size=2
+        )
+
+    assert in_bulk_mock.call_count == 3
+    assert sorted(returned_objs) == [item.id for item in items]
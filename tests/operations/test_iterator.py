@@ -0,0 +1,152 @@
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.engine import Row
+
+from tests import models_factory
+
+
+def test_iterator__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=5)
+
+    returned_objs = list(
+        item_sql_query_manager.query_manager.order_by("id").iterator(chunk_size=2)
+    )
+
+    assert [obj.id for obj in returned_objs] == [item.id for item in items]
+
+    for returned_obj in returned_objs:
+        assert inspect(returned_obj).detached
+
+
+def test_iterator__for_loop__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=3)
+
+    returned_ids = [obj.id for obj in item_sql_query_manager.query_manager]
+
+    assert sorted(returned_ids) == sorted([item.id for item in items])
+
+
+def test_iterator__where__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    models_factory.ItemFactory.create_batch(size=3)
+
+    returned_objs = list(
+        item_sql_query_manager.query_manager.where(id=item.id).iterator()
+    )
+
+    assert len(returned_objs) == 1
+    assert returned_objs[0].as_dict() == item.as_dict()
+
+
+def test_iterator__only__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=3)
+
+    returned_records = list(
+        item_sql_query_manager.query_manager.only("id", "name")
+        .order_by("id")
+        .iterator(chunk_size=1)
+    )
+
+    for returned_record, item in zip(returned_records, items):
+        assert isinstance(returned_record, Row)
+        assert returned_record.id == item.id
+        assert returned_record.name == item.name
+
+
+def test_iterator__with_session__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    models_factory.ItemFactory.create_batch(size=3)
+
+    returned_objs = list(
+        item_sql_query_manager.query_manager.iterator(
+            chunk_size=2,
+            session=db_session,
+        )
+    )
+
+    assert len(returned_objs) == 3
+
+    for returned_obj in returned_objs:
+        assert returned_obj in db_session
+
+
+@pytest.mark.asyncio
+async def test_async_astream__ok(
+    db_session,
+    async_item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=5)
+
+    returned_objs = [
+        obj
+        async for obj in async_item_sql_query_manager.query_manager.order_by(
+            "id"
+        ).astream(chunk_size=2)
+    ]
+
+    assert [obj.id for obj in returned_objs] == [item.id for item in items]
+
+    for returned_obj in returned_objs:
+        assert inspect(returned_obj).detached
+
+
+@pytest.mark.asyncio
+async def test_async_astream__async_for__ok(
+    db_session,
+    async_item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    models_factory.ItemFactory.create_batch(size=3)
+
+    returned_objs = [
+        obj
+        async for obj in async_item_sql_query_manager.query_manager.where(id=item.id)
+    ]
+
+    assert len(returned_objs) == 1
+    assert returned_objs[0].as_dict() == item.as_dict()
+
+
+@pytest.mark.asyncio
+async def test_async_astream__only__ok(
+    db_session,
+    async_item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=3)
+
+    returned_records = [
+        record
+        async for record in async_item_sql_query_manager.query_manager.only(
+            "id", "name"
+        )
+        .order_by("id")
+        .astream(chunk_size=1)
+    ]
+
+    for returned_record, item in zip(returned_records, items):
+        assert isinstance(returned_record, Row)
+        assert returned_record.id == item.id
+        assert returned_record.name == item.name
+
+
+def test_async_query_manager__sync_iteration__fail(
+    async_item_sql_query_manager,
+):
+    with pytest.raises(TypeError):
+        iter(async_item_sql_query_manager.query_manager)
@@ -0,0 +1,162 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import default
+
+from sqlalchemy_query_manager.core.base import (
+    AsyncModelQueryManagerMixin,
+    ModelQueryManagerMixin,
+)
+from sqlalchemy_query_manager.core.expressions import InValues
+from tests import models_factory
+from tests.models import Item
+
+
+def get_injected_item(session, large_in_threshold):
+    class InjectedItem(Item, ModelQueryManagerMixin):
+        class QueryManagerConfig:
+            pass
+
+    InjectedItem.QueryManagerConfig.session = session
+    InjectedItem.QueryManagerConfig.large_in_threshold = large_in_threshold
+
+    return InjectedItem
+
+
+def test_large_in__ok(
+    db_session,
+    sync_db_sessionmaker,
+):
+    items = models_factory.ItemFactory.create_batch(size=4)
+
+    injected_item = get_injected_item(sync_db_sessionmaker, large_in_threshold=2)
+
+    query_manager = injected_item.query_manager.where(
+        id__in=[item.id for item in items[:3]]
+    ).order_by("id")
+
+    assert "unnest" in str(query_manager.query.compile(dialect=postgresql.dialect()))
+    assert [obj.id for obj in query_manager.all()] == [item.id for item in items[:3]]
+
+    returned_objs = injected_item.query_manager.where(
+        id__not_in={item.id for item in items[:3]}
+    ).all()
+
+    assert [obj.id for obj in returned_objs] == [items[3].id]
+    assert injected_item.query_manager.exists_many(
+        [item.id for item in items[1:]] + [-1]
+    ) == {item.id for item in items[1:]}
+
+
+def test_large_in__below_threshold__in_list(
+    sync_db_sessionmaker,
+):
+    injected_item = get_injected_item(sync_db_sessionmaker, large_in_threshold=2)
+
+    query = injected_item.query_manager.where(id__in=[1, 2]).query
+
+    assert "unnest" not in str(query.compile(dialect=postgresql.dialect()))
+
+
+def test_large_in__disabled__in_list(
+    sync_db_sessionmaker,
+):
+    injected_item = get_injected_item(sync_db_sessionmaker, large_in_threshold=0)
+
+    query = injected_item.query_manager.where(id__in=list(range(10))).query
+
+    assert "unnest" not in str(query.compile(dialect=postgresql.dialect()))
+
+
+def test_large_in__statement_cache__ok(
+    db_session,
+    sync_db_sessionmaker,
+):
+    items = models_factory.ItemFactory.create_batch(size=5)
+
+    injected_item = get_injected_item(sync_db_sessionmaker, large_in_threshold=2)
+
+    injected_item.query_manager.cache_clear()
+
+    returned_objs = injected_item.query_manager.where(
+        id__in=[item.id for item in items[:3]]
+    ).all()
+    assert len(returned_objs) == 3
+
+    # The statement doesn't depend on the number of values
+    returned_objs = injected_item.query_manager.where(
+        id__in=[item.id for item in items]
+    ).all()
+    assert len(returned_objs) == 5
+
+    cache_info = injected_item.query_manager.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 1)
+
+
+def test_large_in__compiled_cache__ok(
+    db_session,
+    sync_db_sessionmaker,
+):
+    items = models_factory.ItemFactory.create_batch(size=5)
+
+    compiled = []
+    with sync_db_sessionmaker() as session:
+        for item_ids in ([item.id for item in items[:3]], [item.id for item in items]):
+            result = session.connection().execute(
+                select(Item.id).where(InValues(Item.id, item_ids)).order_by(Item.id)
+            )
+
+            assert result.scalars().all() == item_ids
+            compiled.append(result.context.compiled)
+
+    # SQLAlchemy compiles the statement once for any number of values
+    assert compiled[0] is compiled[1]
+
+
+def test_large_in__in_list_fallback__compiled_cache__ok():
+    statement = select(Item.id).where(InValues(Item.id, [1, 2]))
+    other_statement = select(Item.id).where(InValues(Item.id, [3, 4, 5]))
+
+    cache_key = statement._generate_cache_key()
+    other_cache_key = other_statement._generate_cache_key()
+
+    assert cache_key == other_cache_key
+
+    compiled = statement.compile(dialect=default.DefaultDialect(), cache_key=cache_key)
+
+    assert "POSTCOMPILE" in str(compiled)
+    # Values of another statement are bound to the statement compiled first
+    assert list(
+        compiled.construct_params(extracted_parameters=other_cache_key[1]).values()
+    ) == [[3, 4, 5]]
+
+
+def test_large_in__sqlite__ok(
+    sync_db_sessionmaker,
+):
+    injected_item = get_injected_item(sync_db_sessionmaker, large_in_threshold=2)
+
+    query = injected_item.query_manager.where(name__in=["a", "b", "c"]).query
+    compiled_query = query.compile(dialect=sqlite.dialect())
+
+    assert "json_each" in str(compiled_query)
+    assert list(compiled_query.params.values()) == [["a", "b", "c"]]
+
+
+@pytest.mark.asyncio
+async def test_large_in__async__ok(
+    db_session,
+    async_db_sessionmaker,
+):
+    items = models_factory.ItemFactory.create_batch(size=4)
+
+    class InjectedItem(Item, AsyncModelQueryManagerMixin):
+        class QueryManagerConfig:
+            session = async_db_sessionmaker
+            large_in_threshold = 2
+
+    returned_objs = await InjectedItem.query_manager.where(
+        id__in=[item.id for item in items[:3]]
+    ).all()
+
+    assert sorted(obj.id for obj in returned_objs) == [item.id for item in items[:3]]
@@ -1,5 +1,8 @@
 import pytest
+from sqlalchemy import nulls_last
+from sqlalchemy.dialects import postgresql
 
+from sqlalchemy_query_manager.core.helpers import E
 from tests import models_factory
 
 
@@ -15,6 +18,65 @@ def test_where_object_last__ok(
     assert returned_obj_record.as_dict() == last_item.as_dict()
 
 
+def test_last__order_by__reversed(
+    db_session,
+    item_sql_query_manager,
+):
+    last_item = models_factory.ItemFactory.create(number=1)
+    models_factory.ItemFactory.create(number=3)
+    models_factory.ItemFactory.create(number=2)
+
+    query_manager = item_sql_query_manager.query_manager.order_by("-number")
+
+    assert query_manager.last().id == last_item.id
+    assert query_manager.order_by("id").last().id == last_item.id
+
+    statement, _ = query_manager._get_last_statement()
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert "ORDER BY item.number ASC" in sql
+    assert "LIMIT" in sql
+
+
+def test_last__order_by_nulls_last__reversed(
+    db_session,
+    item_sql_query_manager,
+):
+    null_name_item = models_factory.ItemFactory.create(name=None)
+    models_factory.ItemFactory.create(name="a")
+    last_item = models_factory.ItemFactory.create(name="b")
+
+    query_manager = item_sql_query_manager.query_manager
+
+    assert query_manager.order_by(E("name", nulls_last)).last().id == (
+        null_name_item.id
+    )
+    assert query_manager.where(name__is_not=None).order_by(
+        E("name", nulls_last)
+    ).last().id == (last_item.id)
+
+    statement, _ = query_manager.order_by(E("name", nulls_last))._get_last_statement()
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert "ORDER BY item.name DESC NULLS FIRST" in sql
+
+
+def test_last__no_ordering__primary_key_desc(
+    item_sql_query_manager,
+):
+    statement, _ = item_sql_query_manager.query_manager._get_last_statement()
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert "ORDER BY item.id DESC" in sql
+
+
+def test_last__limit__error(
+    item_sql_query_manager,
+):
+    with pytest.raises(ValueError):
+        item_sql_query_manager.query_manager.limit(2).last()
+
+
 @pytest.mark.asyncio
 async def test_async_where_object_last__ok(
     db_session,
@@ -26,3 +88,18 @@ async def test_async_where_object_last__ok(
     returned_obj_record = await async_item_sql_query_manager.query_manager.last()
 
     assert returned_obj_record.as_dict() == last_item.as_dict()
+
+
+@pytest.mark.asyncio
+async def test_async_last__order_by__reversed(
+    db_session,
+    async_item_sql_query_manager,
+):
+    last_item = models_factory.ItemFactory.create(name="a")
+    models_factory.ItemFactory.create(name="b")
+
+    returned_obj = await async_item_sql_query_manager.query_manager.order_by(
+        "-name"
+    ).last()
+
+    assert returned_obj.id == last_item.id
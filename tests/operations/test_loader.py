@@ -0,0 +1,156 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from sqlalchemy_query_manager.core.base import AsyncQueryManager
+from tests import models_factory
+
+
+@pytest.mark.asyncio
+async def test_loader__batches_concurrent_loads(
+    db_session,
+    async_item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=3)
+
+    loader = async_item_sql_query_manager.query_manager.loader()
+
+    with mock.patch.object(
+        AsyncQueryManager,
+        "all",
+        autospec=True,
+        side_effect=AsyncQueryManager.all,
+    ) as all_mock:
+        returned_objs = await asyncio.gather(
+            loader.load(items[0].id),
+            loader.load(items[1].id),
+            loader.load(items[0].id),
+            loader.load(-1),
+            loader.load(items[2].id),
+        )
+
+    assert all_mock.call_count == 1
+    assert [obj.id if obj else None for obj in returned_objs] == [
+        items[0].id,
+        items[1].id,
+        items[0].id,
+        None,
+        items[2].id,
+    ]
+    # Duplicated keys get the same object
+    assert returned_objs[0] is returned_objs[2]
+
+
+@pytest.mark.asyncio
+async def test_loader__cached__ok(
+    db_session,
+    async_item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    loader = async_item_sql_query_manager.query_manager.loader()
+
+    returned_obj = await loader.load(item.id)
+
+    with mock.patch.object(
+        AsyncQueryManager,
+        "all",
+        autospec=True,
+        side_effect=AsyncQueryManager.all,
+    ) as all_mock:
+        assert await loader.load(item.id) is returned_obj
+
+        loader.clear(item.id)
+
+        assert (await loader.load(item.id)).id == item.id
+
+    assert all_mock.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_loader__load_many__max_batch_size__ok(
+    db_session,
+    async_item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=5)
+
+    loader = async_item_sql_query_manager.query_manager.loader(max_batch_size=2)
+
+    with mock.patch.object(
+        AsyncQueryManager,
+        "all",
+        autospec=True,
+        side_effect=AsyncQueryManager.all,
+    ) as all_mock:
+        returned_objs = await loader.load_many([item.id for item in items])
+
+    assert all_mock.call_count == 3
+    assert [obj.id for obj in returned_objs] == [item.id for item in items]
+
+
+@pytest.mark.asyncio
+async def test_loader__load_many__unit__ok(
+    db_session,
+    async_item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=5)
+
+    query_manager = async_item_sql_query_manager.query_manager
+
+    # Batches share the session of the block
+    async with query_manager.unit():
+        loader = query_manager.loader(max_batch_size=2)
+
+        returned_objs = await loader.load_many([item.id for item in items])
+
+    assert [obj.id for obj in returned_objs] == [item.id for item in items]
+
+
+@pytest.mark.asyncio
+async def test_loader__field_and_filters__ok(
+    db_session,
+    async_item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create(name="name", is_valid=True)
+    models_factory.ItemFactory.create(name="other name", is_valid=False)
+
+    loader = async_item_sql_query_manager.query_manager.where(is_valid=True).loader(
+        field="name"
+    )
+
+    returned_objs = await loader.load_many(["name", "other name"])
+
+    assert returned_objs[0].id == item.id
+    assert returned_objs[1] is None
+
+
+@pytest.mark.asyncio
+async def test_loader__prime__ok(
+    db_session,
+    async_item_sql_query_manager,
+):
+    loader = async_item_sql_query_manager.query_manager.loader()
+
+    obj = object()
+    loader.prime(1, obj)
+
+    assert await loader.load(1) is obj
+
+
+@pytest.mark.asyncio
+async def test_loader__error__not_cached(
+    db_session,
+    async_item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    loader = async_item_sql_query_manager.query_manager.loader()
+
+    with mock.patch.object(
+        AsyncQueryManager, "all", autospec=True, side_effect=RuntimeError
+    ):
+        with pytest.raises(RuntimeError):
+            await loader.load(item.id)
+
+    assert (await loader.load(item.id)).id == item.id
@@ -0,0 +1,70 @@
+from unittest import mock
+
+from sqlalchemy_query_manager.core.base import QueryManager
+from tests import models_factory
+
+
+def test_lookup_cache__foreign_key_path__resolved_once(
+    db_session,
+    item_sql_query_manager,
+):
+    owner = models_factory.OwnerFactory.create(email="owner@example.com")
+    group = models_factory.GroupFactory.create(owner=owner)
+    item = models_factory.ItemFactory.create(group=group)
+    models_factory.ItemFactory.create_batch(size=2)
+
+    with mock.patch.object(
+        QueryManager,
+        "get_foreign_key_path",
+        autospec=True,
+        side_effect=QueryManager.get_foreign_key_path,
+    ) as get_foreign_key_path:
+        for _ in range(3):
+            returned_objs = (
+                item_sql_query_manager.query_manager.where(
+                    group__owner__email=owner.email,
+                    group__owner__email__isnull=False,
+                )
+                .order_by("-group__owner__email")
+                .all()
+            )
+
+            assert [obj.id for obj in returned_objs] == [item.id]
+
+    # One resolution per distinct path
+    assert get_foreign_key_path.call_count == 1
+
+
+def test_lookup_cache__join__resolved_once(
+    db_session,
+    item_sql_query_manager,
+):
+    models_factory.ItemFactory.create_batch(size=2)
+
+    with mock.patch.object(
+        QueryManager,
+        "get_foreign_key_path",
+        autospec=True,
+        side_effect=QueryManager.get_foreign_key_path,
+    ) as get_foreign_key_path:
+        for _ in range(3):
+            item_sql_query_manager.query_manager.left_join("group__owner").all()
+
+    assert get_foreign_key_path.call_count == 1
+
+
+def test_lookup_cache__isnull__value_applied_per_query(
+    db_session,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+    item_without_name = models_factory.ItemFactory.create(name=None)
+
+    query_manager = item_sql_query_manager.query_manager
+
+    assert [obj.id for obj in query_manager.where(name__isnull=False).all()] == [
+        item.id
+    ]
+    assert [obj.id for obj in query_manager.where(name__isnull=True).all()] == [
+        item_without_name.id
+    ]
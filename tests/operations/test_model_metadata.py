@@ -0,0 +1,65 @@
+import sqlalchemy as sa
+from sqlalchemy.orm import configure_mappers, declarative_base, relationship
+
+from sqlalchemy_query_manager.core.base import ModelQueryManagerMixin
+from sqlalchemy_query_manager.core.metadata import get_model_metadata
+from tests.models import Group, Item
+
+
+def test_model_metadata__ok(
+    item_sql_query_manager,
+):
+    model_metadata = get_model_metadata(item_sql_query_manager)
+
+    assert model_metadata.primary_key_names == ("id",)
+    assert [column.name for column in model_metadata.columns] == [
+        column.name for column in Item.__table__.columns
+    ]
+    assert model_metadata.column_attrs["name"] is Item.__table__.c.name
+    assert isinstance(model_metadata.column_types["number"], sa.Integer)
+    assert model_metadata.hybrids == ("has_name",)
+    assert model_metadata.relationships["group"] is Group
+    assert frozenset({"id"}) in model_metadata.unique_column_sets
+
+
+def test_model_metadata__cached__ok(
+    item_sql_query_manager,
+):
+    assert get_model_metadata(item_sql_query_manager) is get_model_metadata(
+        item_sql_query_manager
+    )
+
+
+def test_model_metadata__eager__ok():
+    Base = declarative_base()
+
+    class EagerParent(Base, ModelQueryManagerMixin):
+        __tablename__ = "eager_parent"
+
+        class QueryManagerConfig:
+            eager_metadata = True
+
+        id = sa.Column(sa.Integer, primary_key=True)
+
+    class EagerChild(Base, ModelQueryManagerMixin):
+        __tablename__ = "eager_child"
+
+        class QueryManagerConfig:
+            eager_metadata = True
+
+        id = sa.Column(sa.Integer, primary_key=True)
+        parent_id = sa.Column(sa.Integer, sa.ForeignKey(EagerParent.id))
+        parent = relationship("EagerParent")
+
+    class LazyModel(Base, ModelQueryManagerMixin):
+        __tablename__ = "lazy_model"
+
+        id = sa.Column(sa.Integer, primary_key=True)
+
+    configure_mappers()
+
+    assert "_query_manager_metadata" in EagerParent.__dict__
+    assert EagerChild.__dict__["_query_manager_metadata"].relationships == {
+        "parent": EagerParent
+    }
+    assert "_query_manager_metadata" not in LazyModel.__dict__
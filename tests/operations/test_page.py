@@ -0,0 +1,149 @@
+from unittest import mock
+
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+from sqlalchemy_query_manager.core.base import (
+    DetachStrategy,
+    ModelQueryManagerMixin,
+    Page,
+)
+from tests import models_factory
+from tests.models import Item
+
+
+def test_page__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=5)
+
+    query_manager = item_sql_query_manager.query_manager.order_by("id")
+
+    with mock.patch.object(
+        Session, "execute", autospec=True, side_effect=Session.execute
+    ) as execute_mock:
+        page = query_manager.page(number=2, size=2)
+
+    # Objects and the total are selected with one query
+    assert execute_mock.call_count == 1
+
+    assert isinstance(page, Page)
+    assert [obj.id for obj in page.items] == [item.id for item in items[2:4]]
+    assert inspect(page.items[0]).detached
+    assert (page.total, page.number, page.size, page.pages) == (5, 2, 2, 3)
+    assert page.has_next
+    assert page.has_previous
+
+    page = query_manager.page(number=3, size=2)
+
+    assert [obj.id for obj in page.items] == [items[4].id]
+    assert not page.has_next
+
+
+def test_page__filters__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=3, is_valid=True)
+    models_factory.ItemFactory.create(is_valid=False)
+
+    page = (
+        item_sql_query_manager.query_manager.where(is_valid=True)
+        .order_by("-id")
+        .page(size=2)
+    )
+
+    assert [obj.id for obj in page.items] == [items[2].id, items[1].id]
+    assert page.total == 3
+
+
+def test_page__empty__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    query_manager = item_sql_query_manager.query_manager
+
+    page = query_manager.page()
+
+    assert (page.items, page.total, page.pages, page.has_next) == ([], 0, 0, False)
+
+    models_factory.ItemFactory.create_batch(size=3)
+
+    # The total of a page past the last one is counted separately
+    page = query_manager.page(number=3, size=2)
+
+    assert (page.items, page.total) == ([], 3)
+
+
+def test_page__distinct__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    models_factory.ItemFactory.create_batch(size=2, name="name")
+    models_factory.ItemFactory.create(name="other name")
+
+    page = (
+        item_sql_query_manager.query_manager.only("name")
+        .distinct()
+        .order_by("name")
+        .page(size=1)
+    )
+
+    assert [row.name for row in page.items] == ["name"]
+    assert page.total == 2
+
+
+def test_page__rows__ok(
+    db_session,
+    sync_db_sessionmaker,
+):
+    items = models_factory.ItemFactory.create_batch(size=3)
+
+    class InjectedItem(Item, ModelQueryManagerMixin):
+        class QueryManagerConfig:
+            session = sync_db_sessionmaker
+            detach_strategy = DetachStrategy.ROWS
+
+    page = InjectedItem.query_manager.order_by("id").page(size=2)
+
+    assert [row._asdict() for row in page.items] == [
+        item.as_dict() for item in items[:2]
+    ]
+    assert page.total == 3
+
+
+def test_page__error(
+    item_sql_query_manager,
+):
+    with pytest.raises(ValueError):
+        item_sql_query_manager.query_manager.page(number=0)
+
+    with pytest.raises(ValueError):
+        item_sql_query_manager.query_manager.limit(10).page()
+
+
+@pytest.mark.asyncio
+async def test_page__async__ok(
+    db_session,
+    async_item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=3, name="name")
+
+    query_manager = async_item_sql_query_manager.query_manager.order_by("id")
+
+    page = await query_manager.page(number=2, size=2)
+
+    assert [obj.id for obj in page.items] == [items[2].id]
+    assert page.total == 3
+
+    page = await query_manager.page(number=5, size=2)
+
+    assert (page.items, page.total) == ([], 3)
+
+    page = (
+        await async_item_sql_query_manager.query_manager.only("name").distinct().page()
+    )
+
+    assert ([row.name for row in page.items], page.total) == (["name"], 1)
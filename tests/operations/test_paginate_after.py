@@ -0,0 +1,144 @@
+import pytest
+from sqlalchemy import nulls_last
+
+from sqlalchemy_query_manager.core.helpers import E
+from tests import models_factory
+
+
+def test_paginate_after__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=5)
+
+    query_manager = item_sql_query_manager.query_manager.order_by("id")
+
+    first_page, cursor = query_manager.paginate_after(page_size=2)
+    second_page, cursor = query_manager.paginate_after(cursor, page_size=2)
+    third_page, last_cursor = query_manager.paginate_after(cursor, page_size=2)
+
+    assert [obj.id for obj in first_page] == [items[0].id, items[1].id]
+    assert [obj.id for obj in second_page] == [items[2].id, items[3].id]
+    assert [obj.id for obj in third_page] == [items[4].id]
+    assert last_cursor is None
+
+
+def test_paginate_after__ties__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=3, number=1)
+    items += models_factory.ItemFactory.create_batch(size=2, number=0)
+
+    query_manager = item_sql_query_manager.query_manager.order_by("-number")
+
+    returned_ids = []
+    cursor = None
+    while True:
+        page, cursor = query_manager.paginate_after(cursor, page_size=2)
+        returned_ids.extend(obj.id for obj in page)
+        if cursor is None:
+            break
+
+    expected_ids = [
+        item.id for item in sorted(items, key=lambda item: (-item.number, -item.id))
+    ]
+
+    assert returned_ids == expected_ids
+
+
+def test_paginate_after__mixed_directions__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = [
+        models_factory.ItemFactory.create(number=number, name=name)
+        for number, name in [(1, "a"), (1, "b"), (2, "a"), (2, "b"), (3, "a")]
+    ]
+
+    query_manager = item_sql_query_manager.query_manager.order_by("number", "-name")
+
+    returned_ids = []
+    cursor = None
+    while True:
+        page, cursor = query_manager.paginate_after(cursor, page_size=2)
+        returned_ids.extend(obj.id for obj in page)
+        if cursor is None:
+            break
+
+    expected_ids = [items[1].id, items[0].id, items[3].id, items[2].id, items[4].id]
+
+    assert returned_ids == expected_ids
+
+
+def test_paginate_after__datetime_cursor__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=3)
+
+    query_manager = item_sql_query_manager.query_manager.order_by("created_at")
+
+    first_page, cursor = query_manager.paginate_after(page_size=2)
+    second_page, cursor = query_manager.paginate_after(cursor, page_size=2)
+
+    assert [obj.id for obj in first_page + second_page] == [item.id for item in items]
+    assert cursor is None
+
+
+def test_paginate_after__where_only__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=3, is_valid=True)
+    models_factory.ItemFactory.create_batch(size=2, is_valid=False)
+
+    query_manager = (
+        item_sql_query_manager.query_manager.where(is_valid=True)
+        .order_by("id")
+        .only("id", "name")
+    )
+
+    first_page, cursor = query_manager.paginate_after(page_size=2)
+    second_page, cursor = query_manager.paginate_after(cursor, page_size=2)
+
+    assert [tuple(row) for row in first_page + second_page] == [
+        (item.id, item.name) for item in items
+    ]
+    assert cursor is None
+
+
+def test_paginate_after__e_ordering__fail(
+    db_session,
+    item_sql_query_manager,
+):
+    with pytest.raises(ValueError):
+        item_sql_query_manager.query_manager.order_by(
+            E("name", nulls_last)
+        ).paginate_after()
+
+
+def test_paginate_after__invalid_cursor__fail(
+    db_session,
+    item_sql_query_manager,
+):
+    with pytest.raises(ValueError):
+        item_sql_query_manager.query_manager.paginate_after("invalid")
+
+
+@pytest.mark.asyncio
+async def test_async_paginate_after__ok(
+    db_session,
+    async_item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=3)
+
+    query_manager = async_item_sql_query_manager.query_manager.order_by("-id")
+
+    first_page, cursor = await query_manager.paginate_after(page_size=2)
+    second_page, cursor = await query_manager.paginate_after(cursor, page_size=2)
+
+    assert [obj.id for obj in first_page + second_page] == [
+        item.id for item in reversed(items)
+    ]
+    assert cursor is None
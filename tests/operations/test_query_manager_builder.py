@@ -0,0 +1,79 @@
+from tests import models_factory
+
+
+def test_builder__chained_after_evaluation__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create(name="name", number=1)
+    models_factory.ItemFactory.create(name="name", number=2)
+
+    query_manager = item_sql_query_manager.query_manager.where(name="name")
+
+    assert len(query_manager.all()) == 2
+
+    # Expressions built by the parent query manager must not leak into the child one
+    returned_objs = query_manager.where(number=1).order_by("id").all()
+
+    assert [obj.id for obj in returned_objs] == [item.id]
+
+
+def test_builder__parent_unchanged__ok(
+    item_sql_query_manager,
+):
+    query_manager = item_sql_query_manager.query_manager.where(name="name")
+
+    query_manager.where(number=1).order_by("id").only("id").left_join("group")
+
+    assert query_manager._filters == {"name": "name"}
+    assert query_manager._order_by == ()
+    assert query_manager.fields is None
+    assert query_manager.explicit_joins == ()
+
+
+def test_builder__hashable__ok(
+    item_sql_query_manager,
+):
+    query_manager = item_sql_query_manager.query_manager
+
+    first_query_manager = query_manager.where(id__in=[1, 2]).order_by("id").limit(5)
+    second_query_manager = query_manager.where(id__in=[1, 2]).order_by("id").limit(5)
+    third_query_manager = query_manager.where(id__in=[1, 3]).order_by("id").limit(5)
+
+    assert first_query_manager == second_query_manager
+    assert hash(first_query_manager) == hash(second_query_manager)
+    assert first_query_manager != third_query_manager
+
+    assert len({first_query_manager, second_query_manager, third_query_manager}) == 2
+
+
+def test_builder__hashable__unhashable_values__ok(
+    item_sql_query_manager,
+):
+    query_manager = item_sql_query_manager.query_manager
+
+    # A dict might be compared with a JSON column
+    first_query_manager = query_manager.where(name={"a": [1, 2], "b": {"c": 3}})
+    second_query_manager = query_manager.where(name={"b": {"c": 3}, "a": [1, 2]})
+    third_query_manager = query_manager.where(name={"a": [1, 3]})
+
+    assert first_query_manager == second_query_manager
+    assert hash(first_query_manager) == hash(second_query_manager)
+    assert first_query_manager != third_query_manager
+    assert query_manager.where(name={"a": 1}) != query_manager.where(name=[("a", 1)])
+
+
+def test_builder__root_query_manager_reused__ok(
+    item_sql_query_manager,
+    sync_db_sessionmaker,
+):
+    assert item_sql_query_manager.query_manager is item_sql_query_manager.query_manager
+
+    query_manager = item_sql_query_manager.query_manager
+
+    item_sql_query_manager.QueryManagerConfig.session = None
+
+    assert item_sql_query_manager.query_manager is not query_manager
+    assert item_sql_query_manager.query_manager.session is None
+
+    item_sql_query_manager.QueryManagerConfig.session = sync_db_sessionmaker
@@ -0,0 +1,152 @@
+import pytest
+
+from tests import models_factory
+
+
+def test_statement_cache__same_shape__reuses_statement(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=3)
+
+    query_manager = item_sql_query_manager.query_manager
+    query_manager.cache_clear()
+
+    for item in items:
+        returned_obj = query_manager.where(id=item.id).first()
+
+        assert returned_obj.id == item.id
+
+    cache_info = query_manager.cache_info()
+
+    assert cache_info.misses == 1
+    assert cache_info.hits == 2
+    assert cache_info.currsize == 1
+
+
+def test_statement_cache__different_shapes__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    models_factory.ItemFactory.create_batch(size=3)
+
+    query_manager = item_sql_query_manager.query_manager
+    query_manager.cache_clear()
+
+    query_manager.where(id=1).all()
+    query_manager.where(name="name").all()
+    query_manager.where(id=1).order_by("-id").all()
+    query_manager.where(id=1).only("id").all()
+
+    assert query_manager.cache_info().currsize == 4
+
+
+def test_statement_cache__in__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=4)
+
+    query_manager = item_sql_query_manager.query_manager
+    query_manager.cache_clear()
+
+    first_ids = [item.id for item in items[:2]]
+    second_ids = [item.id for item in items[1:]]
+
+    first_objs = query_manager.where(id__in=first_ids).order_by("id").all()
+    second_objs = query_manager.where(id__in=second_ids).order_by("id").all()
+
+    assert [obj.id for obj in first_objs] == first_ids
+    assert [obj.id for obj in second_objs] == second_ids
+    assert query_manager.cache_info().hits == 1
+
+
+def test_statement_cache__isnull__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+    models_factory.ItemFactory.create(name=None)
+
+    query_manager = item_sql_query_manager.query_manager
+    query_manager.cache_clear()
+
+    not_null_objs = query_manager.where(name__isnull=False).all()
+    null_objs = query_manager.where(name__isnull=True).all()
+
+    assert [obj.id for obj in not_null_objs] == [item.id]
+    assert len(null_objs) == 1
+    assert null_objs[0].id != item.id
+    assert query_manager.cache_info().currsize == 2
+
+
+def test_statement_cache__limit_offset__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=5)
+
+    query_manager = item_sql_query_manager.query_manager.order_by("id")
+    query_manager.cache_clear()
+
+    first_page = query_manager.limit(2).all()
+    second_page = query_manager.offset(2).limit(2).all()
+    third_page = query_manager.offset(4).limit(2).all()
+
+    assert [obj.id for obj in first_page] == [item.id for item in items[:2]]
+    assert [obj.id for obj in second_page] == [item.id for item in items[2:4]]
+    assert [obj.id for obj in third_page] == [items[4].id]
+    assert query_manager.cache_info().hits == 1
+
+
+def test_statement_cache__query__renders_values(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=2)
+
+    query_manager = item_sql_query_manager.query_manager
+
+    for item in items:
+        returned_obj = db_session.execute(
+            query_manager.where(id=item.id).query
+        ).scalar_one()
+
+        assert returned_obj.id == item.id
+
+
+def test_statement_cache__disabled__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    item_sql_query_manager.QueryManagerConfig.statement_cache_size = 0
+
+    query_manager = item_sql_query_manager.query_manager
+
+    assert query_manager.cache_info() is None
+    assert query_manager.where(id=item.id).first().id == item.id
+
+
+@pytest.mark.asyncio
+async def test_statement_cache__async__ok(
+    db_session,
+    async_item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=3)
+
+    query_manager = async_item_sql_query_manager.query_manager
+    query_manager.cache_clear()
+
+    for item in items:
+        returned_obj = await query_manager.where(id=item.id).first()
+
+        assert returned_obj.id == item.id
+
+    assert await query_manager.where(id__in=[item.id for item in items]).count() == 3
+
+    cache_info = query_manager.cache_info()
+
+    assert cache_info.misses == 2
+    assert cache_info.hits == 2
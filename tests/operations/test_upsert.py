@@ -0,0 +1,264 @@
+import warnings
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from sqlalchemy_query_manager.core.upsert import supports_returning
+from tests import models_factory
+
+
+def test_get_or_create__by_primary_key__create__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    obj, created = item_sql_query_manager.query_manager.get_or_create(
+        id=100,
+        defaults={"name": "new_name"},
+    )
+
+    assert created is True
+    assert obj.id == 100
+    assert obj.name == "new_name"
+    assert obj.created_at is not None
+
+    assert item_sql_query_manager.query_manager.get(id=100).name == "new_name"
+
+
+def test_get_or_create__by_primary_key__get__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    obj, created = item_sql_query_manager.query_manager.get_or_create(
+        id=item.id,
+        defaults={"name": "new_name"},
+    )
+
+    assert created is False
+    assert obj.as_dict() == item.as_dict()
+    assert item_sql_query_manager.query_manager.count() == 1
+
+
+def test_get_or_create__not_unique_fields__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    obj, created = item_sql_query_manager.query_manager.get_or_create(name=item.name)
+
+    assert created is False
+    assert obj.id == item.id
+
+    obj, created = item_sql_query_manager.query_manager.get_or_create(name="new_name")
+
+    assert created is True
+    assert obj.name == "new_name"
+
+
+def test_update_or_create__by_primary_key__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    obj, created = item_sql_query_manager.query_manager.update_or_create(
+        id=item.id,
+        defaults={"name": "updated_name"},
+    )
+
+    assert created is False
+    assert obj.id == item.id
+    assert obj.name == "updated_name"
+
+    obj, created = item_sql_query_manager.query_manager.update_or_create(
+        id=100,
+        defaults={"name": "new_name"},
+    )
+
+    assert created is True
+    assert obj.id == 100
+    assert obj.name == "new_name"
+
+    assert item_sql_query_manager.query_manager.count() == 2
+
+
+def test_bulk_upsert__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=2)
+
+    upserted_objs = item_sql_query_manager.query_manager.bulk_upsert(
+        [
+            {"id": items[0].id, "name": "updated_name"},
+            {"id": 100, "name": "new_name"},
+            {"id": 101, "name": "duplicated_name"},
+            {"id": 101, "name": "new_name"},
+        ],
+        batch_size=3,
+    )
+
+    assert sorted((obj.id, obj.name) for obj in upserted_objs) == [
+        (items[0].id, "updated_name"),
+        (100, "new_name"),
+        (101, "new_name"),
+    ]
+
+    not_updated_item = item_sql_query_manager.query_manager.get(id=items[1].id)
+    assert not_updated_item.name == items[1].name
+
+    assert item_sql_query_manager.query_manager.count() == 4
+
+
+def test_bulk_upsert__without_primary_keys__all_inserted(
+    db_session,
+    item_sql_query_manager,
+):
+    upserted_objs = item_sql_query_manager.query_manager.bulk_upsert(
+        [{"name": "a"}, {"name": "b"}, {"name": "c"}],
+    )
+
+    assert sorted(obj.name for obj in upserted_objs) == ["a", "b", "c"]
+
+    rows_count = item_sql_query_manager.query_manager.bulk_upsert(
+        [{"name": "d"}, {"name": "e"}],
+        return_objects=False,
+    )
+
+    assert rows_count == 2
+    assert item_sql_query_manager.query_manager.count() == 5
+
+
+def test_bulk_upsert__update_fields__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    rows_count = item_sql_query_manager.query_manager.bulk_upsert(
+        [{"id": item.id, "name": "updated_name", "number": 999}],
+        update_fields=["number"],
+        return_objects=False,
+    )
+
+    assert rows_count == 1
+
+    updated_item = item_sql_query_manager.query_manager.get(id=item.id)
+    assert updated_item.name == item.name
+    assert updated_item.number == 999
+
+
+def test_bulk_upsert__do_nothing__existing_returned(
+    db_session,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create(name="name")
+
+    upserted_objs = item_sql_query_manager.query_manager.bulk_upsert(
+        [
+            {"id": item.id, "name": "updated_name"},
+            {"id": 100, "name": "new_name"},
+        ],
+        update_fields=[],
+    )
+
+    # Existing rows are skipped by ON CONFLICT DO NOTHING but still returned
+    assert sorted((obj.id, obj.name) for obj in upserted_objs) == [
+        (item.id, "name"),
+        (100, "new_name"),
+    ]
+
+    upserted_objs = item_sql_query_manager.query_manager.bulk_upsert(
+        [{"id": item.id}, {"id": 101}],
+    )
+
+    assert sorted(obj.id for obj in upserted_objs) == [item.id, 101]
+
+
+def test_supports_returning__no_deprecation_warning():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+
+        assert supports_returning(postgresql.dialect())
+
+
+@pytest.mark.asyncio
+async def test_async_get_or_create__by_primary_key__ok(
+    db_session,
+    async_item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    obj, created = await async_item_sql_query_manager.query_manager.get_or_create(
+        id=item.id,
+    )
+
+    assert created is False
+    assert obj.id == item.id
+
+    obj, created = await async_item_sql_query_manager.query_manager.get_or_create(
+        id=100,
+        defaults={"name": "new_name"},
+    )
+
+    assert created is True
+    assert obj.name == "new_name"
+
+
+@pytest.mark.asyncio
+async def test_async_update_or_create__by_primary_key__ok(
+    db_session,
+    async_item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    obj, created = await async_item_sql_query_manager.query_manager.update_or_create(
+        id=item.id,
+        defaults={"name": "updated_name"},
+    )
+
+    assert created is False
+    assert obj.name == "updated_name"
+
+
+@pytest.mark.asyncio
+async def test_async_bulk_upsert__ok(
+    db_session,
+    async_item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    upserted_objs = await async_item_sql_query_manager.query_manager.bulk_upsert(
+        [
+            {"id": item.id, "name": "updated_name"},
+            {"id": 100, "name": "new_name"},
+        ],
+    )
+
+    assert sorted((obj.id, obj.name) for obj in upserted_objs) == [
+        (item.id, "updated_name"),
+        (100, "new_name"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_bulk_upsert__do_nothing__existing_returned(
+    db_session,
+    async_item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create(name="name")
+
+    upserted_objs = await async_item_sql_query_manager.query_manager.bulk_upsert(
+        [
+            {"id": item.id, "name": "updated_name"},
+            {"id": 100, "name": "new_name"},
+        ],
+        update_fields=[],
+    )
+
+    assert sorted((obj.id, obj.name) for obj in upserted_objs) == [
+        (item.id, "name"),
+        (100, "new_name"),
+    ]
@@ -0,0 +1,155 @@
+import pytest
+
+from tests import models_factory
+
+
+def test_values__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=3)
+
+    returned_values = item_sql_query_manager.query_manager.order_by("id").values(
+        "id", "name"
+    )
+
+    assert returned_values == [(item.id, item.name) for item in items]
+    assert all(type(value) is tuple for value in returned_values)
+
+
+def test_values__all_columns__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    returned_dicts = item_sql_query_manager.query_manager.dicts()
+
+    assert returned_dicts == [item.as_dict()]
+
+
+def test_values__foreign_key__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create(group=models_factory.GroupFactory.create())
+    item_without_group = models_factory.ItemFactory.create()
+
+    returned_values = item_sql_query_manager.query_manager.order_by("id").values(
+        "id", "group__name", "group__owner__first_name"
+    )
+
+    # Items without a group are kept
+    assert returned_values == [
+        (item.id, item.group.name, item.group.owner.first_name),
+        (item_without_group.id, None, None),
+    ]
+
+
+def test_values__where_foreign_key__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create(
+        group=models_factory.GroupFactory.create(name="group")
+    )
+    models_factory.ItemFactory.create(
+        group=models_factory.GroupFactory.create(name="other group")
+    )
+    models_factory.ItemFactory.create()
+
+    returned_values = item_sql_query_manager.query_manager.where(
+        group__name=item.group.name
+    ).values("id", "group__name")
+
+    assert returned_values == [(item.id, item.group.name)]
+
+
+def test_values_list__flat__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=3)
+
+    returned_values = item_sql_query_manager.query_manager.order_by("-id").values_list(
+        "id", flat=True
+    )
+
+    assert returned_values == [item.id for item in reversed(items)]
+
+
+def test_values_list__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=2)
+
+    returned_values = item_sql_query_manager.query_manager.order_by("id").values_list(
+        "id", "number"
+    )
+
+    assert returned_values == [(item.id, item.number) for item in items]
+
+
+def test_values_list__flat_several_fields__error(
+    item_sql_query_manager,
+):
+    with pytest.raises(ValueError):
+        item_sql_query_manager.query_manager.values_list("id", "name", flat=True)
+
+
+def test_dicts__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = [
+        models_factory.ItemFactory.create(group=models_factory.GroupFactory.create())
+        for _ in range(2)
+    ]
+
+    returned_dicts = item_sql_query_manager.query_manager.order_by("id").dicts(
+        "id", "name", "group__name"
+    )
+
+    assert returned_dicts == [
+        {"id": item.id, "name": item.name, "group__name": item.group.name}
+        for item in items
+    ]
+    assert all(type(value) is dict for value in returned_dicts)
+
+
+def test_dicts__limit__ok(
+    db_session,
+    item_sql_query_manager,
+):
+    items = models_factory.ItemFactory.create_batch(size=3)
+
+    returned_dicts = (
+        item_sql_query_manager.query_manager.order_by("id")
+        .offset(1)
+        .limit(1)
+        .dicts("id")
+    )
+
+    assert returned_dicts == [{"id": items[1].id}]
+
+
+@pytest.mark.asyncio
+async def test_values__async__ok(
+    db_session,
+    async_item_sql_query_manager,
+):
+    items = [
+        models_factory.ItemFactory.create(group=models_factory.GroupFactory.create())
+        for _ in range(2)
+    ]
+
+    query_manager = async_item_sql_query_manager.query_manager.order_by("id")
+
+    assert await query_manager.values("id", "group__name") == [
+        (item.id, item.group.name) for item in items
+    ]
+    assert await query_manager.values_list("id", flat=True) == [
+        item.id for item in items
+    ]
+    assert await query_manager.dicts("id") == [{"id": item.id} for item in items]
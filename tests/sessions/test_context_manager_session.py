@@ -1,12 +1,19 @@
 from contextlib import asynccontextmanager, contextmanager
 
 import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from sqlalchemy_query_manager.consts import SQLALCHEMY_VERSION
 from sqlalchemy_query_manager.core.base import (
     AsyncModelQueryManagerMixin,
     ModelQueryManagerMixin,
 )
+from sqlalchemy_query_manager.core.transaction_context_manager import (
+    SessionProviderType,
+    get_session_provider_type,
+)
 from tests import models_factory
 from tests.models import Item
 
@@ -72,3 +79,118 @@ async def test_async_context_manager_session(
     returned_obj = await InjectedItem.query_manager.get(id=item.id)
 
     assert returned_obj.id == item.id
+
+
+def test_sync_context_manager_session__called_once_per_operation(
+    create_tables,
+    sync_db_sessionmaker,
+):
+    calls = []
+
+    @contextmanager
+    def session_scope() -> Session:
+        calls.append(1)
+        with sync_db_sessionmaker() as session:
+            yield session
+
+    class InjectedItem(Item, ModelQueryManagerMixin):
+        class QueryManagerConfig:
+            session = session_scope
+
+    item = models_factory.ItemFactory.create()
+
+    for _ in range(3):
+        returned_obj = InjectedItem.query_manager.get(id=item.id)
+
+        assert returned_obj.id == item.id
+
+    assert len(calls) == 3
+
+
+def test_session_provider_type__ok(
+    sync_db_sessionmaker,
+    async_db_sessionmaker,
+):
+    @contextmanager
+    def session_scope():
+        yield
+
+    @asynccontextmanager
+    async def async_session_scope():
+        yield
+
+    assert (
+        get_session_provider_type(sync_db_sessionmaker)
+        == SessionProviderType.SESSIONMAKER
+    )
+    assert (
+        get_session_provider_type(async_db_sessionmaker)
+        == SessionProviderType.SESSIONMAKER
+    )
+    assert (
+        get_session_provider_type(sync_db_sessionmaker()) == SessionProviderType.SESSION
+    )
+    assert (
+        get_session_provider_type(session_scope)
+        == SessionProviderType.CONTEXT_MANAGER_FACTORY
+    )
+    assert (
+        get_session_provider_type(async_session_scope)
+        == SessionProviderType.ASYNC_CONTEXT_MANAGER_FACTORY
+    )
+    assert get_session_provider_type(lambda: session_scope()) == (
+        SessionProviderType.FACTORY
+    )
+    assert get_session_provider_type(None) is None
+
+
+@pytest.mark.skipif(
+    SQLALCHEMY_VERSION < (2,), reason="async_sessionmaker requires SQLAlchemy 2.0"
+)
+@pytest.mark.asyncio
+async def test_async_sessionmaker_session__committed(
+    async_db_engine,
+    sync_db_sessionmaker,
+):
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    class InjectedItem(Item, AsyncModelQueryManagerMixin):
+        class QueryManagerConfig:
+            session = async_sessionmaker(async_db_engine, expire_on_commit=False)
+
+    assert (
+        get_session_provider_type(InjectedItem.QueryManagerConfig.session)
+        == SessionProviderType.SESSIONMAKER
+    )
+
+    created_obj = await InjectedItem.query_manager.create(name="name")
+
+    with sync_db_sessionmaker() as session:
+        assert (
+            session.scalar(
+                select(func.count()).select_from(Item).where(Item.id == created_obj.id)
+            )
+            == 1
+        )
+
+
+@pytest.mark.asyncio
+async def test_async_factory_session__not_supported__error(
+    async_db_engine,
+):
+    class InjectedItem(Item, AsyncModelQueryManagerMixin):
+        class QueryManagerConfig:
+            # A session returned by a factory is neither committed nor closed
+            session = lambda: AsyncSession(async_db_engine)  # noqa: E731
+
+    with pytest.raises(NotImplementedError):
+        await InjectedItem.query_manager.first()
+
+
+def test_session_provider__not_supported__error():
+    class InjectedItem(Item, ModelQueryManagerMixin):
+        class QueryManagerConfig:
+            session = object()
+
+    with pytest.raises(NotImplementedError):
+        InjectedItem.query_manager.first()
@@ -0,0 +1,122 @@
+from unittest import mock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from tests import models_factory
+
+
+def test_atomic__one_session_one_commit(
+    create_tables,
+    item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    query_manager = item_sql_query_manager.query_manager
+
+    with mock.patch.object(
+        Session, "commit", autospec=True, side_effect=Session.commit
+    ) as commit:
+        with query_manager.atomic() as session:
+            assert query_manager.where(id=item.id).exists()
+            assert query_manager.get(id=item.id).id == item.id
+
+            query_manager.where(id=item.id).update(name="updated")
+            new_obj = query_manager.create(name="created", number=1)
+
+            # Objects returned inside the block belong to the shared session
+            assert new_obj in session
+
+    assert commit.call_count == 1
+
+    assert query_manager.get(id=item.id).name == "updated"
+    assert query_manager.get(id=new_obj.id).name == "created"
+    assert new_obj.name == "created"
+
+
+def test_atomic__error__rolled_back(
+    create_tables,
+    item_sql_query_manager,
+):
+    query_manager = item_sql_query_manager.query_manager
+
+    with pytest.raises(ValueError):
+        with query_manager.atomic():
+            query_manager.create(name="created", number=1)
+
+            assert query_manager.where(name="created").count() == 1
+
+            raise ValueError
+
+    assert query_manager.where(name="created").count() == 0
+
+
+def test_atomic__nested__joins_outer_block(
+    create_tables,
+    item_sql_query_manager,
+):
+    query_manager = item_sql_query_manager.query_manager
+
+    with query_manager.atomic() as session:
+        with query_manager.where(name="other").atomic() as nested_session:
+            assert nested_session is session
+
+            query_manager.create(name="created", number=1)
+
+        assert query_manager.first().name == "created"
+
+
+def test_atomic__explicit_session__not_overridden(
+    db_session,
+    item_sql_query_manager,
+    sync_db_sessionmaker,
+):
+    query_manager = item_sql_query_manager.query_manager
+
+    with query_manager.atomic():
+        query_manager.create(name="created", number=1)
+
+        # A session passed to an operation is used instead of the block's one
+        with sync_db_sessionmaker() as other_session:
+            assert query_manager.first(session=other_session) is None
+
+
+@pytest.mark.asyncio
+async def test_async_unit__one_session_one_commit(
+    create_tables,
+    async_item_sql_query_manager,
+):
+    item = models_factory.ItemFactory.create()
+
+    query_manager = async_item_sql_query_manager.query_manager
+
+    with mock.patch.object(
+        AsyncSession, "commit", autospec=True, side_effect=AsyncSession.commit
+    ) as commit:
+        async with query_manager.unit():
+            assert await query_manager.where(id=item.id).exists()
+
+            await query_manager.where(id=item.id).update(name="updated")
+            new_obj = await query_manager.create(name="created", number=1)
+
+    assert commit.call_count == 1
+
+    assert (await query_manager.get(id=item.id)).name == "updated"
+    assert (await query_manager.get(id=new_obj.id)).name == "created"
+
+
+@pytest.mark.asyncio
+async def test_async_unit__error__rolled_back(
+    create_tables,
+    async_item_sql_query_manager,
+):
+    query_manager = async_item_sql_query_manager.query_manager
+
+    with pytest.raises(ValueError):
+        async with query_manager.unit():
+            await query_manager.create(name="created", number=1)
+
+            raise ValueError
+
+    assert await query_manager.where(name="created").count() == 0